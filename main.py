@@ -1,14 +1,21 @@
-import tkinter as tk  # Import the tkinter library for creating GUI applications
-from src.ui import SOSGameUI  # Import the SOSGameUI class from the ui module for the game's interface
-from src.game_logic import GameLogic  # Import the GameLogic class from the game_logic module for handling game logic
+import sys  # Command line arguments select the headless mode
 
 def main():
+    # With arguments, run the headless command line instead of the GUI; it never imports tkinter
+    if len(sys.argv) > 1:
+        from src.cli import main as cli_main  # Import the headless CLI only when it is used
+        return cli_main(sys.argv[1:])
+
+    import tkinter as tk  # Import the tkinter library for creating GUI applications
+    from src.ui import SOSGameUI  # Import the SOSGameUI class from the ui module for the game's interface
+    from src.game_logic import GameLogic  # Import the GameLogic class from the game_logic module for handling game logic
+
     # Create the main window for the game using tkinter
     root = tk.Tk()
 
     # Initialize the game logic with a starting grid size of 3
     # The GameLogic class handles the core functionality of the game
-    game_logic = GameLogic(3)  
+    game_logic = GameLogic(3)
 
     # Create an instance of the SOSGameUI class to manage the user interface
     # It takes the main window (root) and the game logic object (game_logic) as arguments
@@ -19,4 +26,4 @@ def main():
 
 # Check if this script is being run directly (rather than being imported as a module)
 if __name__ == "__main__":
-    main()  # Call the main function to start the game
+    sys.exit(main())  # Call the main function to start the game
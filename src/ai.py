@@ -0,0 +1,367 @@
+"""Computer players for GameLogic.
+
+A player is any object with choose_move(game) -> (row, col, letter). Attach one with
+GameLogic.set_player(color, player).
+"""
+import random  # Random fallback player and Zobrist keys
+import time  # Per-move time budget
+from src.board import EMPTY, S, O, LETTERS  # Byte codes used by ArrayBoard
+from src.game_logic import GameLogic  # Game rules
+
+WIN = 1000  # Value of a won Simple game
+INFINITY = 10 ** 9
+CLOCK_CHECK_CELLS = 64  # Above this many empty cells every node is slow enough to check the clock
+EXACT, LOWER, UPPER = 0, 1, 2  # Transposition table bound types
+
+_ZOBRIST_CACHE = {}  # Board size -> (cell keys, side key)
+_NEIGHBOR_CACHE = {}  # Board size -> cells within distance 2 of each cell
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+def zobrist_keys(size):
+    """Return the Zobrist keys for a board size: one per (cell, letter) plus one for the side to move."""
+    keys = _ZOBRIST_CACHE.get(size)
+    if keys is None:
+        rng = random.Random(size * 7919)  # Fixed seed so hashes are stable between runs
+        cell_keys = [0] * (size * size * 3)
+        for index in range(size * size):
+            cell_keys[index * 3 + S] = rng.getrandbits(64)
+            cell_keys[index * 3 + O] = rng.getrandbits(64)
+        keys = _ZOBRIST_CACHE[size] = (cell_keys, rng.getrandbits(64))
+    return keys
+
+
+def neighbor_cells(size):
+    """Return, for every cell, the flat indices of the cells within distance 2."""
+    neighbors = _NEIGHBOR_CACHE.get(size)
+    if neighbors is None:
+        neighbors = []
+        for row in range(size):
+            for col in range(size):
+                near = []
+                for r in range(max(0, row - 2), min(size, row + 3)):
+                    for c in range(max(0, col - 2), min(size, col + 3)):
+                        if (r, c) != (row, col):
+                            near.append(r * size + c)
+                neighbors.append(tuple(near))
+        neighbors = _NEIGHBOR_CACHE[size] = tuple(neighbors)
+    return neighbors
+
+
+def search_copy(game):
+    """Return a detached array-backed copy of a game for search."""
+    if game.backend == 'array':
+        return game.copy()
+    copy = GameLogic(game.size, game.mode, auto_reset=False)
+    for row in range(game.size):
+        for col in range(game.size):
+            if game.board[row][col]:
+                copy.board.place(row, col, game.board[row][col])
+    copy.scores = dict(game.scores)
+    copy.current_turn = game.current_turn
+    return copy
+
+
+def board_key(game):
+    """Return the Zobrist hash of a game's board and side to move."""
+    cell_keys, side_key = zobrist_keys(game.size)
+    key = 0
+    for index, code in enumerate(game.board.cells):
+        if code:
+            key ^= cell_keys[index * 3 + code]
+    return key ^ side_key if game.current_turn == 'Red' else key
+
+
+class TranspositionTable:
+    """Fixed-size hash table of search results.
+
+    Each slot holds one entry. A new entry replaces the old one if the old one is from an
+    earlier search or was searched to a depth no greater than the new one. Values depend on
+    the game mode, so a table must be cleared before it is used for a game of another mode.
+    """
+    __slots__ = ('mask', 'slots', 'generation', 'probes', 'hits', 'stores')
+
+    def __init__(self, size_bits=18):
+        self.mask = (1 << size_bits) - 1  # 2 ** size_bits slots
+        self.slots = [None] * (1 << size_bits)
+        self.generation = 0  # Bumped once per search
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def clear(self):
+        """Drop every entry."""
+        self.slots = [None] * len(self.slots)
+
+    def new_search(self):
+        """Mark existing entries as old so they are replaced first."""
+        self.generation += 1
+
+    def probe(self, key):
+        """Return (depth, value, flag, move) for a key, or None."""
+        self.probes += 1
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1:5]
+        return None
+
+    def store(self, key, depth, value, flag, move):
+        """Store a search result, following the replacement policy."""
+        slot = key & self.mask
+        entry = self.slots[slot]
+        if entry is None or entry[5] != self.generation or depth >= entry[1]:
+            self.slots[slot] = (key, depth, value, flag, move, self.generation)
+            self.stores += 1
+
+    def hit_rate(self):
+        """Return the fraction of probes that found an entry."""
+        return self.hits / self.probes if self.probes else 0.0
+
+
+class AlphaBetaPlayer:
+    """Iterative-deepening alpha-beta player with move ordering and a transposition table."""
+
+    def __init__(self, time_limit=1.0, max_depth=64, tt_bits=18):
+        self.time_limit = time_limit  # Seconds per move
+        self.max_depth = max_depth  # Depth cap for iterative deepening
+        self.tt = TranspositionTable(tt_bits)
+        self.tt_game = None  # (size, mode) the table entries belong to
+        self.last_stats = {}  # Stats of the last search (nodes, nodes_per_second, tt_hit_rate, depth)
+        self.stop_event = None  # Optional threading.Event that ends the search early when set
+        self.on_progress = None  # Optional callback(dict) after every finished depth
+        self.deadline = 0.0
+        self.check_mask = 15  # The clock is checked when nodes & check_mask == 0
+        self.nodes = 0
+        self.key = 0
+
+    def choose_move(self, game):
+        """Return the best (row, col, letter) found within the time budget."""
+        start = time.perf_counter()
+        self.deadline = start + self.time_limit * 0.95  # Leave room to unwind and return the move
+        self.nodes = 0
+        search = search_copy(game)
+        if self.tt_game != (search.size, search.mode):
+            self.tt.clear()  # Entries of another size or mode would give wrong values
+            self.tt_game = (search.size, search.mode)
+        self.tt.new_search()
+        probes, hits = self.tt.probes, self.tt.hits
+
+        self.key = board_key(search)
+        self.check_mask = 15  # The root move list is always built in full: it holds the fallback move
+        moves = self.ordered_moves(search, None)
+        # Every node scans all empty cells, so on large boards the clock is checked at each node
+        # and inside the scans
+        self.check_mask = 15 if search.board.empty_count <= CLOCK_CHECK_CELLS else 0
+        best = moves[0]  # Legal fallback in case the first iteration does not finish
+        depth_reached = 0
+        value = 0
+
+        # A scoring move wins a Simple game at once, and a single move needs no search
+        if len(moves) > 1 and not (search.mode == 'Simple' and moves[0][0]):
+            for depth in range(1, min(self.max_depth, search.board.empty_count) + 1):
+                try:
+                    value, move = self.search_root(search, depth, moves)
+                except SearchTimeout:
+                    break
+                best = move
+                depth_reached = depth
+                moves.remove(move)
+                moves.insert(0, move)  # Search the best move first in the next iteration
+                if self.on_progress:
+                    row, col = divmod(move[1], search.size)
+                    self.on_progress({'depth': depth, 'move': (row, col, LETTERS[move[2]]),
+                                      'value': value, 'nodes': self.nodes})
+                if search.mode == 'Simple' and abs(value) >= WIN:
+                    break  # Result is decided
+
+        elapsed = time.perf_counter() - start
+        probes = self.tt.probes - probes
+        self.last_stats = {
+            'nodes': self.nodes,
+            'nodes_per_second': self.nodes / elapsed if elapsed > 0 else 0.0,
+            'tt_hit_rate': (self.tt.hits - hits) / probes if probes else 0.0,
+            'depth': depth_reached,
+            'value': value,
+            'time': elapsed,
+        }
+        _, index, code = best
+        row, col = divmod(index, search.size)
+        return row, col, LETTERS[code]
+
+    def search_root(self, game, depth, moves):
+        """Search every root move to a depth and return (value, best move)."""
+        alpha = -INFINITY
+        best = moves[0]
+        for move in moves:
+            value = self.search_move(game, move, depth, alpha, INFINITY)
+            if value > alpha:
+                alpha = value
+                best = move
+        self.tt.store(self.key, depth, alpha, EXACT, best)
+        return alpha, best
+
+    def search_move(self, game, move, depth, alpha, beta):
+        """Play a move, search the reply and return the move's value for the mover."""
+        gained, index, code = move
+        cell_keys, side_key = zobrist_keys(game.size)
+        row, col = divmod(index, game.size)
+        game.make_move(row, col, LETTERS[code])
+        key = self.key
+        self.key = key ^ cell_keys[index * 3 + code] ^ side_key
+        try:
+            if game.mode == 'Simple':
+                value = WIN if gained else -self.negamax(game, depth - 1, -beta, -alpha)
+            else:
+                value = gained - self.negamax(game, depth - 1, -beta + gained, -alpha + gained)
+        finally:
+            self.key = key
+            game.unmake_move()
+        return value
+
+    def negamax(self, game, depth, alpha, beta):
+        """Return the value of the position for the side to move."""
+        self.nodes += 1
+        if not self.nodes & self.check_mask:
+            self.check_clock()
+        if game.board.empty_count == 0:
+            return 0  # Nothing left to score
+        if depth == 0:
+            return self.evaluate(game)
+
+        alpha_start = alpha
+        tt_move = None
+        entry = self.tt.probe(self.key)
+        if entry is not None:
+            tt_depth, tt_value, flag, tt_move = entry
+            if tt_depth >= depth:
+                if flag == EXACT:
+                    return tt_value
+                if flag == LOWER:
+                    alpha = max(alpha, tt_value)
+                else:
+                    beta = min(beta, tt_value)
+                if alpha >= beta:
+                    return tt_value
+
+        best_value = -INFINITY
+        best_move = None
+        for move in self.ordered_moves(game, tt_move):
+            value = self.search_move(game, move, depth, alpha, beta)
+            if value > best_value:
+                best_value = value
+                best_move = move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+
+        if best_value <= alpha_start:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.tt.store(self.key, depth, best_value, flag, best_move)
+        return best_value
+
+    def check_clock(self):
+        """Raise SearchTimeout when the time budget is spent or the search was stopped."""
+        if time.perf_counter() > self.deadline or (self.stop_event is not None and self.stop_event.is_set()):
+            raise SearchTimeout()
+
+    def evaluate(self, game):
+        """Estimate a quiet position: the side to move can take the best immediate score."""
+        cells = game.board.cells
+        index_lines = game.sos_index
+        best = 0
+        check = not self.check_mask  # Large board: also check the clock during the scan
+        for number, index in enumerate(game.board.empty_cells):
+            if check and not number % CLOCK_CHECK_CELLS:
+                self.check_clock()
+            for code in (S, O):
+                cells[index] = code
+                gained = index_lines.count(cells, index)
+                cells[index] = EMPTY
+                if gained > best:
+                    if game.mode == 'Simple':
+                        return WIN
+                    best = gained
+        return best
+
+    def ordered_moves(self, game, tt_move):
+        """Return (gained, index, code) moves: table move, scoring moves, moves near letters, then the rest."""
+        cells = game.board.cells
+        index_lines = game.sos_index
+        neighbors = neighbor_cells(game.size)
+        scoring = []
+        near = []
+        quiet = []
+        check = not self.check_mask  # Large board: also check the clock during the scan
+        for number, index in enumerate(sorted(game.board.empty_cells)):
+            if check and not number % CLOCK_CHECK_CELLS:
+                self.check_clock()
+            is_near = any(cells[n] for n in neighbors[index])
+            for code in (S, O):
+                cells[index] = code
+                gained = index_lines.count(cells, index)
+                cells[index] = EMPTY
+                move = (gained, index, code)
+                if gained:
+                    scoring.append(move)
+                elif is_near:
+                    near.append(move)
+                else:
+                    quiet.append(move)
+        scoring.sort(reverse=True)
+        moves = scoring + near + quiet
+        if tt_move is not None and tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        return moves
+
+
+class RandomPlayer:
+    """Player that picks a random empty cell and letter."""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def choose_move(self, game):
+        """Return a random legal (row, col, letter)."""
+        if game.backend == 'array':
+            row, col = self.rng.choice(game.board.empty_positions())
+        else:
+            row, col = self.rng.choice([(r, c) for r in range(game.size) for c in range(game.size)
+                                        if game.board[r][c] == ''])
+        return row, col, self.rng.choice('SO')
+
+
+def scoring_move(game):
+    """Return the first (row, col, letter) that forms an SOS in an array-backed game, or None."""
+    cells = game.board.cells
+    find_first = game.sos_index.find_first
+    for index in game.board.empty_cells:
+        for code in (S, O):
+            cells[index] = code  # Try the letter in place without touching the counters
+            found = find_first(cells, index)
+            cells[index] = EMPTY
+            if found:
+                row, col = divmod(index, game.size)
+                return row, col, LETTERS[code]
+    return None
+
+
+class GreedyPlayer:
+    """Player that takes a move forming an SOS when there is one, otherwise a random move."""
+
+    def __init__(self, seed=None):
+        self.random_player = RandomPlayer(seed)
+
+    def choose_move(self, game):
+        """Return the first scoring (row, col, letter), or a random legal move."""
+        search = search_copy(game)
+        return scoring_move(search) or self.random_player.choose_move(search)
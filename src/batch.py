@@ -0,0 +1,128 @@
+"""Vectorized SOS evaluation over stacks of boards.
+
+Boards are stacked in a (B, N, N) uint8 array of ArrayBoard codes (EMPTY, S, O). Every
+query compares shifted slices of the whole stack, one slice per line direction, instead
+of looping over boards and cells. Requires NumPy.
+"""
+from collections import namedtuple  # BatchResult
+import numpy as np  # Array maths
+from src.board import EMPTY, S, O  # Byte codes used by ArrayBoard
+
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))  # Each line is found once, from its first cell
+SOS_LETTERS = ('S', 'O')  # Order of the letter axis in scoring masks
+
+BatchResult = namedtuple('BatchResult', 'counts triples gains')
+
+
+def stack_boards(boards):
+    """Stack ArrayBoards, GameLogics or lists of letters into a (B, N, N) uint8 array."""
+    boards = list(boards)
+    if not boards:
+        raise ValueError("No boards to stack.")
+    rows = []
+    for board in boards:
+        board = getattr(board, 'board', board)  # GameLogic -> its board
+        if hasattr(board, 'cells'):
+            rows.append(bytes(board.cells))
+        else:
+            rows.append(bytes(EMPTY if letter == '' else S if letter == 'S' else O
+                              for row in board for letter in row))
+    size = int(round(len(rows[0]) ** 0.5))
+    if any(len(row) != size * size for row in rows):
+        raise ValueError("All boards must have the same size.")
+    return np.frombuffer(b''.join(rows), dtype=np.uint8).reshape(len(rows), size, size)
+
+
+def line_slices(size, dr, dc):
+    """Return (rows, cols) slices of the first, middle and last cells of every line in a direction.
+
+    The three slices have the same shape, so element [r, c] of each is one line.
+    """
+    slices = []
+    for k in range(3):
+        rows = slice(k * dr - 2 * min(dr, 0), size - 2 * max(dr, 0) + k * dr)
+        cols = slice(k * dc - 2 * min(dc, 0), size - 2 * max(dc, 0) + k * dc)
+        slices.append((rows, cols))
+    return slices
+
+
+def check_boards(boards):
+    """Return boards as a (B, N, N) uint8 array."""
+    boards = np.asarray(boards, dtype=np.uint8)
+    if boards.ndim != 3 or boards.shape[1] != boards.shape[2]:
+        raise ValueError("Boards must be a (B, N, N) array.")
+    return boards
+
+
+def sos_masks(boards):
+    """Yield (direction, mask) for each line direction; mask is True where a line is an SOS."""
+    size = boards.shape[1]
+    is_s = boards == S
+    is_o = boards == O
+    for direction, (dr, dc) in enumerate(LINE_DIRECTIONS):
+        (r0, c0), (r1, c1), (r2, c2) = line_slices(size, dr, dc)
+        yield direction, is_s[:, r0, c0] & is_o[:, r1, c1] & is_s[:, r2, c2]
+
+
+def sos_counts(boards):
+    """Return the number of SOS lines on each board, shape (B,)."""
+    boards = check_boards(boards)
+    counts = np.zeros(len(boards), dtype=np.int64)
+    for _, mask in sos_masks(boards):
+        counts += mask.sum(axis=(1, 2))
+    return counts
+
+
+def sos_triples(boards):
+    """Return (board ids, cells) of every SOS line; cells has shape (K, 3, 2) of (row, col)."""
+    boards = check_boards(boards)
+    size = boards.shape[1]
+    ids = []
+    cells = []
+    for direction, mask in sos_masks(boards):
+        dr, dc = LINE_DIRECTIONS[direction]
+        (r0, c0), _, _ = line_slices(size, dr, dc)
+        board_ids, rows, cols = np.nonzero(mask)
+        rows = rows + r0.start  # Slice coordinates -> board coordinates of the first cell
+        cols = cols + c0.start
+        steps = np.arange(3)
+        ids.append(board_ids)
+        cells.append(np.stack([rows[:, None] + steps * dr, cols[:, None] + steps * dc], axis=2))
+    return np.concatenate(ids), np.concatenate(cells)
+
+
+def scoring_gains(boards):
+    """Return how many SOS lines each move would complete, shape (B, 2, N, N).
+
+    Axis 1 is the letter (0 = S, 1 = O). Occupied cells are always 0.
+    """
+    boards = check_boards(boards)
+    size = boards.shape[1]
+    is_s = boards == S
+    is_o = boards == O
+    is_empty = boards == EMPTY
+    gains = np.zeros((len(boards), 2, size, size), dtype=np.uint8)  # At most 8 lines per move
+    for dr, dc in LINE_DIRECTIONS:
+        (r0, c0), (r1, c1), (r2, c2) = line_slices(size, dr, dc)
+        gains[:, 0, r0, c0] += is_empty[:, r0, c0] & is_o[:, r1, c1] & is_s[:, r2, c2]  # S at the first cell
+        gains[:, 0, r2, c2] += is_s[:, r0, c0] & is_o[:, r1, c1] & is_empty[:, r2, c2]  # S at the last cell
+        gains[:, 1, r1, c1] += is_s[:, r0, c0] & is_empty[:, r1, c1] & is_s[:, r2, c2]  # O in the middle
+    return gains
+
+
+def scoring_moves(boards):
+    """Return a (B, 2, N, N) bool mask of the moves that complete at least one SOS."""
+    return scoring_gains(boards) > 0
+
+
+def evaluate(boards):
+    """Return BatchResult(counts, triples, gains) for a stack of boards."""
+    boards = check_boards(boards)
+    return BatchResult(sos_counts(boards), sos_triples(boards), scoring_gains(boards))
+
+
+def random_boards(count, size, fill=0.5, seed=None):
+    """Return count random boards where about fill of the cells hold a random letter."""
+    rng = np.random.default_rng(seed)
+    letters = rng.integers(S, O + 1, size=(count, size, size), dtype=np.uint8)
+    return np.where(rng.random((count, size, size)) < fill, letters, EMPTY).astype(np.uint8)
@@ -0,0 +1,306 @@
+"""Benchmarks of the game core and UI, with JSON baselines and a regression check.
+
+    python -m src.bench --save bench_baseline.json           record a baseline
+    python -m src.bench --compare bench_baseline.json        fail (exit 1) on a regression
+
+Every benchmark reports the best seconds per operation over a few repeats. A result is a
+regression when it is slower than the baseline by more than the threshold (25% by default).
+The UI benchmark needs a display; without one it starts Xvfb if it is installed, otherwise
+it is skipped.
+
+Timings depend on the machine, so no baseline is committed. To check a change, record a
+baseline on the unchanged code and compare on the same machine:
+
+    git stash && python -m src.bench --save bench_baseline.json && git stash pop
+    python -m src.bench --compare bench_baseline.json
+
+The test suite runs the same check when SOS_BENCH_BASELINE names a baseline file:
+
+    SOS_BENCH_BASELINE=bench_baseline.json python -m pytest test/test_bench.py
+
+On a shared or busy machine the timings can vary by more than 25% between runs; set
+SOS_BENCH_THRESHOLD (for example 1.0) to allow a larger slowdown.
+"""
+import argparse  # Command line parsing
+import json  # Baselines
+import os  # DISPLAY for the virtual display
+import platform  # Machine details stored with a baseline
+import random  # Move orders
+import shutil  # Finding Xvfb
+import subprocess  # Running Xvfb
+import sys  # Exit code
+import time  # Timing
+from src.game_logic import GameLogic  # Game rules
+from src.simulate import run_batch  # Random-game throughput
+
+SIZES = (3, 5, 10, 20, 50)  # Board sizes of the core benchmarks
+GRID_SIZES = (10, 50)  # Board sizes of the UI benchmark
+DEFAULT_THRESHOLD = 0.25  # Allowed slowdown before a result counts as a regression
+BENCHMARKS = {}  # Name -> function(quick) returning seconds per operation
+
+
+def benchmark(name):
+    """Register a benchmark function under a name."""
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def best_time(run, repeat):
+    """Return the fastest of repeat timings of run(), which returns the seconds it measured."""
+    return min(run() for _ in range(repeat))
+
+
+def filled_game(size, fill, seed=0):
+    """Return a General game with a fraction of the cells filled at random."""
+    rng = random.Random(seed)
+    game = GameLogic(size, 'General', auto_reset=False)
+    cells = list(range(size * size))
+    rng.shuffle(cells)
+    for index in cells[:int(fill * size * size)]:
+        game.make_move(*divmod(index, size), rng.choice('SO'))
+    return game
+
+
+def bench_place_letter(size, quick):
+    rng = random.Random(size)
+    moves = [(*divmod(index, size), rng.choice('SO')) for index in rng.sample(range(size * size), size * size)]
+
+    def run():
+        game = GameLogic(size, 'General', auto_reset=False)
+        start = time.perf_counter()
+        for row, col, letter in moves:
+            game.place_letter(row, col, letter)
+        return time.perf_counter() - start
+    return best_time(run, 3 if quick else 7) / len(moves)
+
+
+def bench_check_general_sos(size, quick):
+    game = filled_game(size, 1.0)
+    cells = [(row, col, game.board[row][col]) for row in range(size) for col in range(size)]
+    rounds = max(1, (2000 if quick else 20000) // len(cells))
+
+    def run():
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for row, col, letter in cells:
+                game.check_general_sos(row, col, letter)
+        return time.perf_counter() - start
+    return best_time(run, 3 if quick else 7) / (rounds * len(cells))
+
+
+def bench_is_full(size, quick):
+    game = filled_game(size, 0.5)
+    calls = 2000 if quick else 50000
+
+    def run():
+        is_full = game.is_full
+        start = time.perf_counter()
+        for _ in range(calls):
+            is_full()
+        return time.perf_counter() - start
+    return best_time(run, 3 if quick else 7) / calls
+
+
+def bench_reset_game(size, quick):
+    game = filled_game(size, 0.5)
+    calls = 200 if quick else 5000
+
+    def run():
+        start = time.perf_counter()
+        for _ in range(calls):
+            game.reset_game()
+        return time.perf_counter() - start
+    return best_time(run, 3 if quick else 7) / calls
+
+
+for _size in SIZES:
+    benchmark(f"place_letter[{_size}]")(lambda quick, size=_size: bench_place_letter(size, quick))
+    benchmark(f"check_general_sos[{_size}]")(lambda quick, size=_size: bench_check_general_sos(size, quick))
+    benchmark(f"is_full[{_size}]")(lambda quick, size=_size: bench_is_full(size, quick))
+    benchmark(f"reset_game[{_size}]")(lambda quick, size=_size: bench_reset_game(size, quick))
+
+
+def bench_random_games(mode, quick):
+    games = 50 if quick else 1000
+
+    def run():
+        start = time.perf_counter()
+        run_batch((8, mode, 'random', games, 0))
+        return time.perf_counter() - start
+    return best_time(run, 3 if quick else 5) / games
+
+
+for _mode in ('Simple', 'General'):
+    benchmark(f"random_game[8 {_mode}]")(lambda quick, mode=_mode: bench_random_games(mode, quick))
+
+
+class VirtualDisplay:
+    """Tk root on the current display, or on a private Xvfb display when there is none."""
+
+    def __init__(self):
+        self.process = None
+        self.old_display = os.environ.get('DISPLAY')
+        self.root = None
+
+    def __enter__(self):
+        import tkinter as tk  # Only the UI benchmark needs Tk
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            xvfb = shutil.which('Xvfb')
+            if xvfb is None:
+                return None
+            display = f":{90 + os.getpid() % 100}"
+            self.process = subprocess.Popen([xvfb, display, '-screen', '0', '1280x1024x24'],
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            os.environ['DISPLAY'] = display
+            for _ in range(50):  # Wait up to 5s for the server
+                try:
+                    self.root = tk.Tk()
+                    break
+                except tk.TclError:
+                    time.sleep(0.1)
+        if self.root is not None:
+            self.root.withdraw()
+        return self.root
+
+    def __exit__(self, *exc):
+        if self.root is not None:
+            self.root.destroy()
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait()
+            if self.old_display is None:
+                os.environ.pop('DISPLAY', None)
+            else:
+                os.environ['DISPLAY'] = self.old_display
+
+
+def bench_create_game_grid(size, quick):
+    from src.ui import SOSGameUI  # Imports Tk
+    with VirtualDisplay() as root:
+        if root is None:
+            return None  # No display and no Xvfb
+        ui = SOSGameUI(root, GameLogic(3))
+        builds = 3 if quick else 10
+
+        def run():
+            elapsed = 0.0
+            for _ in range(builds):
+                ui.create_game_grid(3)  # Untimed switch to a small board so every timed build changes the board
+                root.update_idletasks()
+                start = time.perf_counter()
+                ui.create_game_grid(size)
+                root.update_idletasks()  # Include the drawing
+                elapsed += time.perf_counter() - start
+            return elapsed
+        return best_time(run, 3) / builds
+
+
+for _size in GRID_SIZES:
+    benchmark(f"create_game_grid[{_size}]")(lambda quick, size=_size: bench_create_game_grid(size, quick))
+
+
+def run_benchmarks(names=None, quick=False, progress=None):
+    """Run benchmarks (all, or those whose name contains one of names) and return {name: seconds per op}.
+
+    Skipped benchmarks are left out. progress, if given, is called with (name, seconds or None).
+    """
+    results = {}
+    for name, function in BENCHMARKS.items():
+        if names and not any(part in name for part in names):
+            continue
+        seconds = function(quick)
+        if seconds is not None:
+            results[name] = seconds
+        if progress:
+            progress(name, seconds)
+    return results
+
+
+def save_baseline(path, results):
+    """Write results to a JSON baseline with the machine they were measured on."""
+    data = {'version': 1, 'python': platform.python_version(), 'platform': platform.platform(),
+            'results': results}
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """Return the results of a JSON baseline."""
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)['results']
+
+
+def compare(baseline, results, threshold=DEFAULT_THRESHOLD):
+    """Return [(name, baseline seconds, seconds, ratio, status)].
+
+    status is 'regressed' when slower than the baseline by more than threshold, 'improved'
+    when faster by more than threshold, 'ok' in between, and 'new' without a baseline.
+    """
+    rows = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, None, seconds, None, 'new'))
+            continue
+        ratio = seconds / base if base > 0 else float('inf')
+        if ratio > 1 + threshold:
+            status = 'regressed'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improved'
+        else:
+            status = 'ok'
+        rows.append((name, base, seconds, ratio, status))
+    return rows
+
+
+def format_time(seconds):
+    if seconds is None:
+        return '-'
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f} us"
+    return f"{seconds * 1e3:.2f} ms"
+
+
+def format_rows(rows):
+    """Return comparison rows as printable lines."""
+    lines = [f"{'Benchmark':<28}{'Baseline':>12}{'Now':>12}{'Ratio':>8}  Status"]
+    for name, base, seconds, ratio, status in rows:
+        ratio_text = f"{ratio:.2f}" if ratio is not None else '-'
+        lines.append(f"{name:<28}{format_time(base):>12}{format_time(seconds):>12}{ratio_text:>8}  {status}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SOS game core and UI.")
+    parser.add_argument('names', nargs='*', help="only run benchmarks whose name contains one of these")
+    parser.add_argument('--quick', action='store_true', help="fewer iterations (noisier)")
+    parser.add_argument('--save', metavar='PATH', help="write the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="compare with a JSON baseline; exit 1 on a regression")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    def progress(name, seconds):
+        print(f"{name:<28}{format_time(seconds) if seconds is not None else 'skipped':>12}", file=sys.stderr)
+
+    results = run_benchmarks(args.names, args.quick, progress)
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"Saved {len(results)} results to {args.save}")
+    if args.compare:
+        rows = compare(load_baseline(args.compare), results, args.threshold)
+        for line in format_rows(rows):
+            print(line)
+        regressed = [row[0] for row in rows if row[4] == 'regressed']
+        if regressed:
+            print(f"{len(regressed)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressed)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+EMPTY, S, O = 0, 1, 2  # Byte codes stored in the board cells
+LETTERS = ('', 'S', 'O')  # Byte code -> letter
+CODES = {'': EMPTY, 'S': S, 'O': O}  # Letter -> byte code
+
+
+class BoardRow:
+    """Lightweight view of one board row so board[row][col] keeps working."""
+    __slots__ = ('board', 'offset')
+
+    def __init__(self, board, row):
+        self.board = board  # Board that owns the cells
+        self.offset = row * board.size  # Flat index of the first cell in this row
+
+    def __getitem__(self, col):
+        if not 0 <= col < self.board.size:
+            raise IndexError("board column out of range")
+        return LETTERS[self.board.cells[self.offset + col]]
+
+    def __setitem__(self, col, letter):
+        if not 0 <= col < self.board.size:
+            raise IndexError("board column out of range")
+        self.board.set_index(self.offset + col, letter)
+
+    def __len__(self):
+        return self.board.size
+
+    def __iter__(self):
+        cells = self.board.cells
+        return (LETTERS[cells[i]] for i in range(self.offset, self.offset + self.board.size))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+class ArrayBoard:
+    """Flat bytearray board with O(1) fullness and occupancy tracking."""
+    __slots__ = ('size', 'cells', 'empty_count', 'empty_cells')
+
+    def __init__(self, size):
+        self.size = size  # Number of rows and columns
+        self.cells = bytearray(size * size)  # One byte per cell, row-major
+        self.empty_count = size * size  # Number of empty cells left
+        self.empty_cells = set(range(size * size))  # Flat indices of the empty cells
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.size:
+            raise IndexError("board row out of range")
+        return BoardRow(self, row)  # Row view for board[row][col] access
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return (BoardRow(self, row) for row in range(self.size))
+
+    def __eq__(self, other):
+        return self.to_lists() == [list(row) for row in other]
+
+    def index(self, row, col):
+        """Return the flat index of a cell, raising IndexError off the board."""
+        size = self.size
+        if not (0 <= row < size and 0 <= col < size):
+            raise IndexError(f"Cell ({row}, {col}) is off the board.")
+        return row * size + col
+
+    def get(self, row, col):
+        """Return the letter at a cell ('' when empty)."""
+        return LETTERS[self.cells[self.index(row, col)]]
+
+    def set_index(self, index, letter):
+        """Write a letter (or '' to clear) at a flat index, keeping the counters in sync."""
+        code = CODES[letter]
+        old = self.cells[index]
+        if old == code:
+            return
+        self.cells[index] = code
+        if old == EMPTY:  # Filled an empty cell
+            self.empty_count -= 1
+            self.empty_cells.discard(index)
+        elif code == EMPTY:  # Cleared an occupied cell
+            self.empty_count += 1
+            self.empty_cells.add(index)
+
+    def place(self, row, col, letter):
+        """Place a letter on an empty cell. Returns False if the cell is occupied."""
+        index = self.index(row, col)
+        if self.cells[index] != EMPTY:
+            return False
+        self.cells[index] = CODES[letter]
+        self.empty_count -= 1
+        self.empty_cells.discard(index)
+        return True
+
+    def remove(self, row, col):
+        """Clear an occupied cell (used to take back a move)."""
+        index = self.index(row, col)
+        if self.cells[index] != EMPTY:
+            self.cells[index] = EMPTY
+            self.empty_count += 1
+            self.empty_cells.add(index)
+
+    def is_empty(self, row, col):
+        """Check if a cell is empty."""
+        return self.cells[self.index(row, col)] == EMPTY
+
+    def is_full(self):
+        """Check if the board is full in O(1)."""
+        return self.empty_count == 0
+
+    def empty_positions(self):
+        """Return the (row, col) of every empty cell."""
+        size = self.size
+        return [divmod(index, size) for index in sorted(self.empty_cells)]
+
+    def clear(self):
+        """Empty every cell."""
+        size = self.size
+        self.cells = bytearray(size * size)
+        self.empty_count = size * size
+        self.empty_cells = set(range(size * size))
+
+    def copy(self):
+        """Return an independent copy of the board."""
+        board = ArrayBoard.__new__(ArrayBoard)
+        board.size = self.size
+        board.cells = bytearray(self.cells)
+        board.empty_count = self.empty_count
+        board.empty_cells = set(self.empty_cells)
+        return board
+
+    def to_lists(self):
+        """Return the board as a list of lists of letters."""
+        size = self.size
+        cells = self.cells
+        return [[LETTERS[cells[r * size + c]] for c in range(size)] for r in range(size)]
+
+
+BOARD_BACKENDS = ('array', 'list')  # Backends accepted by GameLogic
+
+
+def create_board(size, backend='array'):
+    """Create an empty board for the given backend."""
+    if backend == 'array':
+        return ArrayBoard(size)
+    if backend == 'list':
+        return [['' for _ in range(size)] for _ in range(size)]  # Original list of lists board
+    raise ValueError(f"Unknown board backend: {backend}")
@@ -0,0 +1,135 @@
+import tkinter as tk
+
+CELL_COLOR = "white"  # Background of an empty cell
+GRID_COLOR = "gray"  # Cell borders
+PLAYER_COLORS = {'Blue': "lightblue", 'Red': "red"}  # Background of cells in a player's SOS
+LINE_COLORS = {'Blue': "blue", 'Red': "darkred"}  # SOS strike-through lines
+
+
+class CanvasBoard:
+    """Game board drawn on a single tk.Canvas.
+
+    Cells, letters and SOS lines are canvas items. Items are reused between games and only
+    cells marked dirty are redrawn, in one batch when Tk is idle.
+    """
+
+    def __init__(self, parent, on_click, max_pixels=600, bg="lightgray"):
+        self.canvas = tk.Canvas(parent, width=max_pixels, height=max_pixels, bg=bg, highlightthickness=0)
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+        self.on_click = on_click  # Called with (row, col) when a cell is clicked
+        self.max_pixels = max_pixels  # Largest side of the board in pixels
+        self.size = 0  # Board size shown
+        self.cell_pixels = 0  # Side of one cell in pixels
+        self.rects = []  # Rectangle item per cell (flat, row-major), reused between games
+        self.texts = []  # Text item per cell
+        self.lines = []  # SOS line items drawn this game
+        self.letters = []  # Letter per cell
+        self.fills = []  # Background color per cell
+        self.dirty = set()  # Flat indices of cells to redraw
+        self.flush_pending = None  # after_idle id of the pending redraw
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def reset(self, size):
+        """Show an empty board of the given size, reusing the existing canvas items."""
+        self.cancel_flush()
+        self.size = size
+        self.cell_pixels = max(8, min(60, self.max_pixels // size))
+        pixels = self.cell_pixels * size
+        self.canvas.config(width=pixels, height=pixels)
+        font = ("Arial", max(6, self.cell_pixels // 3), "bold")
+
+        for line in self.lines:
+            self.canvas.delete(line)
+        self.lines = []
+
+        count = size * size
+        while len(self.rects) < count:  # Create items only when the board grows past the largest one so far
+            self.rects.append(self.canvas.create_rectangle(0, 0, 0, 0, outline=GRID_COLOR))
+            self.texts.append(self.canvas.create_text(0, 0, text=""))
+        for index in range(len(self.rects)):
+            if index < count:
+                row, col = divmod(index, size)
+                x, y = col * self.cell_pixels, row * self.cell_pixels
+                self.canvas.coords(self.rects[index], x, y, x + self.cell_pixels, y + self.cell_pixels)
+                self.canvas.coords(self.texts[index], x + self.cell_pixels / 2, y + self.cell_pixels / 2)
+                self.canvas.itemconfig(self.rects[index], fill=CELL_COLOR, state=tk.NORMAL)
+                self.canvas.itemconfig(self.texts[index], text="", font=font, state=tk.NORMAL)
+            else:
+                self.canvas.itemconfig(self.rects[index], state=tk.HIDDEN)  # Keep for a later larger board
+                self.canvas.itemconfig(self.texts[index], state=tk.HIDDEN)
+        self.letters = [''] * count
+        self.fills = [CELL_COLOR] * count
+        self.dirty = set()
+
+    def set_letter(self, row, col, letter):
+        """Show a letter in a cell (drawn on the next flush)."""
+        index = row * self.size + col
+        if self.letters[index] != letter:
+            self.letters[index] = letter
+            self.mark_dirty(index)
+
+    def mark_sos(self, sos_list, player):
+        """Color the cells of each SOS for a player and strike through it."""
+        fill = PLAYER_COLORS.get(player, "yellow")
+        half = self.cell_pixels / 2
+        for coordinates in sos_list:
+            for row, col in coordinates:
+                index = row * self.size + col
+                if self.fills[index] != fill:
+                    self.fills[index] = fill
+                    self.mark_dirty(index)
+            (r0, c0), (r1, c1) = coordinates[0], coordinates[-1]
+            self.lines.append(self.canvas.create_line(
+                c0 * self.cell_pixels + half, r0 * self.cell_pixels + half,
+                c1 * self.cell_pixels + half, r1 * self.cell_pixels + half,
+                fill=LINE_COLORS.get(player, "black"), width=max(2, self.cell_pixels // 12)))
+
+    def unmark_sos(self, count):
+        """Remove the strike-through lines of the last count SOS (cell colors are set with color_cell)."""
+        for _ in range(count):
+            self.canvas.delete(self.lines.pop())
+
+    def color_cell(self, row, col, player):
+        """Color a cell for a player's SOS, or back to the empty cell color when player is None."""
+        fill = PLAYER_COLORS.get(player, "yellow") if player else CELL_COLOR
+        index = row * self.size + col
+        if self.fills[index] != fill:
+            self.fills[index] = fill
+            self.mark_dirty(index)
+
+    def mark_dirty(self, index):
+        """Queue a cell for redraw and schedule one batched flush."""
+        self.dirty.add(index)
+        if self.flush_pending is None:
+            self.flush_pending = self.canvas.after_idle(self.flush)
+
+    def flush(self):
+        """Redraw the dirty cells."""
+        self.flush_pending = None
+        itemconfig = self.canvas.itemconfig
+        for index in self.dirty:
+            itemconfig(self.rects[index], fill=self.fills[index])
+            itemconfig(self.texts[index], text=self.letters[index])
+        self.dirty = set()
+
+    def cancel_flush(self):
+        """Drop a scheduled redraw."""
+        if self.flush_pending is not None:
+            self.canvas.after_cancel(self.flush_pending)
+            self.flush_pending = None
+
+    def cell_at(self, x, y):
+        """Return the (row, col) under a canvas point, or None."""
+        if not self.size:
+            return None
+        row, col = int(y // self.cell_pixels), int(x // self.cell_pixels)
+        if 0 <= row < self.size and 0 <= col < self.size:
+            return row, col
+        return None
+
+    def on_canvas_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None and not self.letters[cell[0] * self.size + cell[1]]:
+            self.on_click(*cell)
@@ -0,0 +1,179 @@
+"""Headless command line: replay and validate games from a move stream, one JSON line per game.
+
+    python -m src.cli games.txt --mode General > results.jsonl
+    python main.py --mode Simple < games.txt         (any argument skips the GUI)
+
+Input is one move per line as "row col letter". A blank line ends a game, and a
+"game <size> <mode>" line starts one with its own settings. Lines starting with # are
+comments. Moves of a game after its first invalid move are skipped.
+
+Only src.game_logic is imported, and only after the arguments are parsed: no tkinter
+and no display are needed.
+"""
+import argparse  # Command line parsing
+import json  # Result lines
+import sys  # Streams
+import time  # Throughput and startup timing
+
+MODES = ('Simple', 'General')
+MAX_SIZE = 100  # Largest board a stream may ask for
+FLUSH_LINES = 4096  # Result lines collected before one write
+STARTUP_BUDGET = 0.1  # Seconds the CLI may add to interpreter start-up (checked by the tests)
+
+
+class StreamGame:
+    """One game being read from the stream."""
+    __slots__ = ('number', 'line', 'size', 'mode', 'game', 'error')
+
+    def __init__(self, number, line, size, mode, first_player, game_class):
+        self.number = number
+        self.line = line  # Line the game starts on
+        self.size = size
+        self.mode = mode
+        self.game = game_class(size, mode, auto_reset=False, first_player=first_player)
+        self.error = None  # First problem found, as "line N: reason"
+
+    def play(self, line_number, parts):
+        """Apply one move line; return (player, SOS scored) or None if it was rejected."""
+        if self.error:
+            return None
+        game = self.game
+        if len(parts) != 3:
+            self.error = f"line {line_number}: expected 'row col letter'"
+            return None
+        try:
+            row, col = int(parts[0]), int(parts[1])
+        except ValueError:
+            self.error = f"line {line_number}: row and column must be integers"
+            return None
+        letter = parts[2].upper()
+        if letter != 'S' and letter != 'O':
+            self.error = f"line {line_number}: letter must be S or O"
+        elif not (0 <= row < self.size and 0 <= col < self.size):
+            self.error = f"line {line_number}: cell ({row}, {col}) is off the board"
+        elif game.game_result():
+            self.error = f"line {line_number}: move after the game ended"
+        else:
+            player = game.current_turn
+            try:
+                return player, game.make_move(row, col, letter)
+            except ValueError as error:  # Occupied cell
+                self.error = f"line {line_number}: {error}"
+        return None
+
+    def result(self):
+        """Return the JSON-ready result of the game."""
+        game = self.game
+        record = {'game': self.number, 'line': self.line, 'size': self.size, 'mode': self.mode,
+                  'moves': len(game.moves), 'result': game.game_result(), 'scores': game.scores,
+                  'valid': self.error is None}
+        if self.error:
+            record['error'] = self.error
+        return record
+
+
+def process(lines, out, size=3, mode='General', first_player='Blue', trace=False, numbered=0):
+    """Replay every game in lines, writing JSON lines to out. Returns (games, moves).
+
+    Games are numbered from numbered + 1, so several streams can share one numbering.
+    """
+    from src.game_logic import GameLogic  # The only game import, loaded on first use
+
+    dumps = json.JSONEncoder(separators=(',', ':')).encode
+    pending = []
+    current = None
+    games = numbered
+    moves = 0
+
+    def finish():
+        nonlocal current, games
+        if current is not None:
+            pending.append(dumps(current.result()))
+            games += 1
+            current = None
+            if len(pending) >= FLUSH_LINES:
+                out.write('\n'.join(pending) + '\n')
+                pending.clear()
+
+    for line_number, line in enumerate(lines, 1):
+        parts = line.split()
+        if not parts:
+            finish()  # Blank line ends the game
+            continue
+        if parts[0][0] == '#':
+            continue
+        if parts[0] == 'game':
+            finish()
+            game_size, game_mode = size, mode
+            error = None
+            try:
+                game_size = int(parts[1]) if len(parts) > 1 else size
+                game_mode = parts[2].capitalize() if len(parts) > 2 else mode
+            except ValueError:
+                error = f"line {line_number}: size must be an integer"
+            if error is None and not 3 <= game_size <= MAX_SIZE:
+                error = f"line {line_number}: size must be between 3 and {MAX_SIZE}"
+            elif error is None and game_mode not in MODES:
+                error = f"line {line_number}: mode must be Simple or General"
+            if error:
+                game_size, game_mode = size, mode
+            current = StreamGame(games + 1, line_number, game_size, game_mode, first_player, GameLogic)
+            current.error = error
+            continue
+        if current is None:
+            current = StreamGame(games + 1, line_number, size, mode, first_player, GameLogic)
+        played = current.play(line_number, parts)
+        if played is not None:
+            moves += 1
+            if trace:
+                player, gained = played
+                row, col, letter = current.game.moves[-1][:3]
+                pending.append(dumps({'game': current.number, 'move': len(current.game.moves), 'row': row,
+                                      'col': col, 'letter': letter, 'player': player, 'sos': gained}))
+    finish()
+    if pending:
+        out.write('\n'.join(pending) + '\n')
+    return games - numbered, moves
+
+
+def main(argv=None):
+    startup = time.process_time()  # CPU time from interpreter start to here
+    parser = argparse.ArgumentParser(description="Replay and validate SOS games from a move stream without the GUI.")
+    parser.add_argument('files', nargs='*', default=['-'], help="move files ('-' or none for stdin)")
+    parser.add_argument('--size', type=int, default=3, help="board size of games without a 'game' line")
+    parser.add_argument('--mode', choices=MODES, default='General', help="mode of games without a 'game' line")
+    parser.add_argument('--first', choices=['Blue', 'Red'], default='Blue', help="color that moves first")
+    parser.add_argument('--trace', action='store_true', help="also write one line per accepted move")
+    parser.add_argument('--stats', action='store_true', help="print start-up time and throughput to stderr")
+    parser.add_argument('-o', '--output', help="write results to a file instead of stdout")
+    args = parser.parse_args(argv)
+
+    if not 3 <= args.size <= MAX_SIZE:
+        parser.error(f"size must be between 3 and {MAX_SIZE}")
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    start = time.perf_counter()
+    games = moves = 0
+    try:
+        for path in args.files:
+            if path == '-':
+                counts = process(sys.stdin, out, args.size, args.mode, args.first, args.trace, games)
+            else:
+                with open(path, encoding='utf-8') as file:
+                    counts = process(file, out, args.size, args.mode, args.first, args.trace, games)
+            games += counts[0]
+            moves += counts[1]
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    if args.stats:
+        rate = games / elapsed if elapsed > 0 else 0.0
+        print(f"Start-up: {startup * 1000:.1f} ms CPU; {games} games, {moves} moves in {elapsed:.3f}s "
+              f"({rate:,.0f} games/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+import queue  # Results and progress handed from the worker thread to Tk
+import sys  # GIL switch interval
+import threading  # Background search thread and stop flag
+
+SWITCH_INTERVAL = 0.002  # Seconds the search thread may hold the GIL before Tk gets a turn
+
+
+class EngineWorker:
+    """Run engine searches on a background thread and deliver results on the Tk thread.
+
+    Tk is not thread safe, so the worker never touches widgets. It puts progress and results
+    on a queue, and poll() (scheduled with root.after) passes them to the callbacks.
+
+    At most one search thread runs at a time: a new search first stops the old one and waits
+    for its thread to exit, because a player object keeps its search state (hash key, node
+    count, transposition table) on itself and may be reused for the next search.
+    """
+
+    def __init__(self, root, poll_ms=15):
+        self.root = root  # Anything with after(ms, callback), normally the Tk root
+        self.poll_ms = poll_ms  # Queue polling interval, under one frame
+        self.messages = queue.Queue()
+        self.job = 0  # Id of the current search; results of older ids are dropped
+        self.stop_event = None  # Stop flag of the current search
+        self.thread = None  # Thread of the last search, joined before the next one starts
+        self.callbacks = None  # (on_done, on_progress) of the current search
+        self.poll_id = None  # after id of the next poll
+
+        # The search is pure Python and shares the GIL with Tk; a short switch interval keeps
+        # input handling within a frame while it runs
+        if sys.getswitchinterval() > SWITCH_INTERVAL:
+            sys.setswitchinterval(SWITCH_INTERVAL)
+
+    @property
+    def busy(self):
+        """Check if a search is running."""
+        return self.callbacks is not None
+
+    def start(self, player, game, on_done, on_progress=None):
+        """Search a copy of the game with the player. on_done gets (row, col, letter), on_progress a dict."""
+        self.cancel()  # Also waits for the old thread, so it can no longer touch the player
+        self.job += 1
+        job = self.job
+        stop_event = threading.Event()  # Cancel token of this job only
+        self.stop_event = stop_event
+        self.callbacks = (on_done, on_progress)
+        player.stop_event = stop_event
+        if hasattr(player, 'on_progress'):
+            player.on_progress = lambda info: self.messages.put((job, 'progress', info))
+        search = game.copy()  # The search never sees the live game
+
+        def run():
+            try:
+                move = player.choose_move(search)
+            except Exception as error:  # Hand engine errors to the Tk thread
+                self.messages.put((job, 'error', error))
+            else:
+                self.messages.put((job, 'done', move))
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        self.schedule_poll()
+        return job
+
+    def cancel(self):
+        """Stop the running search, wait for its thread to exit and drop its result.
+
+        Players check their stop flag at least once per search node, so the wait is short.
+        """
+        if self.stop_event is not None:
+            self.stop_event.set()
+        self.stop_event = None
+        self.callbacks = None
+        self.job += 1
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def schedule_poll(self):
+        if self.poll_id is None:
+            self.poll_id = self.root.after(self.poll_ms, self.poll)
+
+    def poll(self):
+        """Deliver queued messages of the current search; keep polling while it runs."""
+        self.poll_id = None
+        while True:
+            try:
+                job, kind, payload = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if job != self.job or self.callbacks is None:
+                continue  # Cancelled or replaced search
+            on_done, on_progress = self.callbacks
+            if kind == 'progress':
+                if on_progress:
+                    on_progress(payload)
+            else:
+                self.callbacks = None
+                self.stop_event = None
+                if kind == 'error':
+                    raise payload
+                on_done(payload)
+                if self.callbacks is None:
+                    return
+        if self.callbacks is not None:
+            self.schedule_poll()
@@ -0,0 +1,133 @@
+import json  # Dumping metrics
+import time  # Timing moves and detection latency
+
+
+class GameObserver:
+    """Base class for GameLogic listeners. Override only the events you need."""
+
+    def game_started(self, game, starting_player):
+        """A new game started (on creation and after every reset)."""
+
+    def move_placed(self, game, row, col, letter, player, sos_list, detect_time):
+        """A letter was placed. detect_time is the SOS check time in seconds."""
+
+    def move_rejected(self, game, row, col, letter, player):
+        """A letter could not be placed because the cell is occupied."""
+
+    def sos_formed(self, game, player, sos_list):
+        """The player formed one or more SOS with the last move."""
+
+    def turn_changed(self, game, player):
+        """It is now player's turn."""
+
+    def game_over(self, game, winner):
+        """The game ended. winner is 'Blue', 'Red' or 'Draw'."""
+
+
+class PrintObserver(GameObserver):
+    """Print a trace of the game to stdout (what GameLogic used to print)."""
+
+    def game_started(self, game, starting_player):
+        print(f"Starting player: {starting_player}")
+
+    def move_placed(self, game, row, col, letter, player, sos_list, detect_time):
+        print(f"Placed {letter} at ({row}, {col}) by {player}.")
+
+    def move_rejected(self, game, row, col, letter, player):
+        print(f"Failed to place {letter} at ({row}, {col}). Cell already occupied.")
+
+    def sos_formed(self, game, player, sos_list):
+        print(f"{player} formed SOS at {sos_list}. Current score: {game.scores[player]}")
+
+    def turn_changed(self, game, player):
+        print(f"Next turn: {player}")
+
+    def game_over(self, game, winner):
+        if winner == 'Draw':
+            print("The game is a draw.")
+        else:
+            print(f"{winner} wins the game in {game.mode} mode with a score of {game.scores[winner]}.")
+
+
+class UIObserver(GameObserver):
+    """Forward SOS formations to a UI that has a color_squares method."""
+
+    def __init__(self, ui):
+        self.ui = ui
+
+    def sos_formed(self, game, player, sos_list):
+        self.ui.color_squares(sos_list)
+
+
+# Upper bounds (in microseconds) of the detection latency histogram buckets
+LATENCY_BUCKETS_US = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class MetricsCollector(GameObserver):
+    """Collect moves/sec, detection latency and SOS counts per game."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock  # Time source (seconds)
+        self.start_time = clock()  # When collection started
+        self.moves = 0  # Moves placed
+        self.rejected = 0  # Moves on occupied cells
+        self.games = 0  # Games finished
+        self.results = {'Blue': 0, 'Red': 0, 'Draw': 0}  # Finished games by result
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS_US) + 1)  # Last bucket is overflow
+        self.detect_total = 0.0  # Total detection time in seconds
+        self.sos_per_game = []  # SOS formed in each finished game
+        self.current_sos = 0  # SOS formed so far in the running game
+
+    def move_placed(self, game, row, col, letter, player, sos_list, detect_time):
+        self.moves += 1
+        self.detect_total += detect_time
+        micros = detect_time * 1e6
+        bucket = 0
+        for bound in LATENCY_BUCKETS_US:
+            if micros <= bound:
+                break
+            bucket += 1
+        self.latency_counts[bucket] += 1
+
+    def move_rejected(self, game, row, col, letter, player):
+        self.rejected += 1
+
+    def sos_formed(self, game, player, sos_list):
+        self.current_sos += len(sos_list)
+
+    def game_over(self, game, winner):
+        self.games += 1
+        self.results[winner] += 1
+        self.sos_per_game.append(self.current_sos)
+        self.current_sos = 0
+
+    def moves_per_second(self):
+        """Return the moves placed per second since collection started."""
+        elapsed = self.clock() - self.start_time
+        return self.moves / elapsed if elapsed > 0 else 0.0
+
+    def latency_histogram(self):
+        """Return the detection latency histogram as {bucket label: count}."""
+        labels = [f"<={bound}us" for bound in LATENCY_BUCKETS_US] + [f">{LATENCY_BUCKETS_US[-1]}us"]
+        return dict(zip(labels, self.latency_counts))
+
+    def to_dict(self):
+        """Return all metrics as a JSON-friendly dict."""
+        return {
+            'moves': self.moves,
+            'rejected_moves': self.rejected,
+            'games': self.games,
+            'results': dict(self.results),
+            'moves_per_second': self.moves_per_second(),
+            'mean_detect_us': self.detect_total / self.moves * 1e6 if self.moves else 0.0,
+            'detect_latency_histogram': self.latency_histogram(),
+            'sos_per_game': list(self.sos_per_game),
+        }
+
+    def dump_json(self, fp):
+        """Write the metrics as JSON to a path or an open file."""
+        if isinstance(fp, str):
+            with open(fp, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
+        else:
+            json.dump(self.to_dict(), fp, indent=2)
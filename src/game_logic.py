@@ -1,66 +1,268 @@
 import random  # Import random module for selecting a starting player
+import time  # Timing SOS detection for observers
+from src.board import CODES, EMPTY, LETTERS, create_board  # Board backends (flat array or list of lists)
+from src.events import PrintObserver, UIObserver  # Built-in game observers
+from src.sos_index import get_sos_index  # Precomputed SOS lines per board size
+from src.threats import ThreatMap  # Incremental scoring and unsafe moves
 
 class GameLogic:
-    def __init__(self, size, mode='Simple', ui=None):
+    def __init__(self, size, mode='Simple', ui=None, backend='array', verbose=False, observers=None, auto_reset=True,
+                 first_player=None):
         # Initialize game parameters
         self.size = size  # Size of the game board
         self.mode = mode  # Game mode (Simple or General)
-        self.board = [['' for _ in range(size)] for _ in range(size)]  # Create the game board
-        self.current_turn = random.choice(['Blue', 'Red'])  # Randomly choose starting player
+        self.backend = backend  # Board backend ('array' or 'list')
+        self.board = create_board(size, backend)  # Create the game board
+        self.sos_index = get_sos_index(size) if backend == 'array' else None  # Cached SOS lines for the array board
+        self.first_player = first_player  # Color that starts every game (None picks one at random)
+        self.current_turn = first_player or random.choice(['Blue', 'Red'])  # Choose starting player
         self.scores = {'Blue': 0, 'Red': 0}  # Initialize scores
         self.moves = []  # To record moves for replay functionality
+        self.move_gains = []  # SOS scored by each move in self.moves, used to undo them
+        self.redo_moves = []  # Undone moves that redo() can play again
+        self.auto_reset = auto_reset  # Reset the board after a Simple mode win (False keeps the history)
         self.ui = ui  # Reference to the UI for color changes
+        self.players = {'Blue': None, 'Red': None}  # Computer player per color (None means human)
+        self.threats = None  # ThreatMap, built on first use by track_threats()
+        self.observers = list(observers or [])  # Event listeners (empty list means no event cost)
 
-        print(f"Starting player: {self.current_turn}")
+        if verbose:
+            self.observers.insert(0, PrintObserver())  # Print a trace of every move
+        if ui:
+            self.observers.append(UIObserver(ui))  # Color SOS squares in the UI
+
+        for observer in self.observers:
+            observer.game_started(self, self.current_turn)
+
+    def add_observer(self, observer):
+        """Attach an event listener."""
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Detach an event listener."""
+        self.observers.remove(observer)
+
+    def set_player(self, color, player):
+        """Let a computer player (anything with choose_move(game)) play a color, or None for a human."""
+        self.players[color] = player
+
+    def is_computer_turn(self):
+        """Check if the player to move is a computer."""
+        return self.players[self.current_turn] is not None
+
+    def play_computer_move(self):
+        """Ask the computer player to move and play its move. Returns ((row, col, letter), place_letter result)."""
+        row, col, letter = self.players[self.current_turn].choose_move(self)
+        return (row, col, letter), self.place_letter(row, col, letter)
+
+    def track_threats(self):
+        """Keep a ThreatMap up to date from now on and return it (array backend only)."""
+        if self.sos_index is None:
+            raise ValueError("Threat tracking needs the array board backend.")
+        if self.threats is None:
+            self.threats = ThreatMap(self.board)
+        return self.threats
+
+    def scoring_moves(self):
+        """Return every (row, col, letter) that completes at least one SOS."""
+        size = self.size
+        return [(*divmod(index, size), LETTERS[code]) for index, code in self.track_threats().scoring_moves()]
+
+    def safe_moves(self):
+        """Return every (row, col, letter) that hands the opponent no new SOS."""
+        size = self.size
+        return [(*divmod(index, size), LETTERS[code]) for index, code in self.track_threats().safe_moves()]
 
     def place_letter(self, row, col, letter):
         """Place a letter on the board and check for SOS formations."""
-        print(f"{self.current_turn}'s turn. Trying to place {letter} at ({row}, {col}).")
+        observers = self.observers  # Events are only built when someone listens
+        player = self.current_turn
 
-        if self.board[row][col] == '':
+        size = self.size
+        if not (0 <= row < size and 0 <= col < size):
+            raise IndexError(f"Cell ({row}, {col}) is off the board.")  # Negative indices would wrap around
+
+        sos_index = self.sos_index
+        if sos_index is not None:
+            board = self.board
+            index = row * size + col
+            cells = board.cells
+            placed = not cells[index]  # Write the bytes directly, the bounds are already checked
+            if placed:
+                cells[index] = CODES[letter]
+                board.empty_count -= 1
+                board.empty_cells.discard(index)
+                if self.threats is not None:
+                    self.threats.update(index, EMPTY)
+        elif self.board[row][col] == '':
             self.board[row][col] = letter  # Place letter on the board
-            self.moves.append((row, col, letter, self.current_turn))  # Record the move
+            placed = True
+        else:
+            placed = False
 
-            print(f"Placed {letter} at ({row}, {col}) by {self.current_turn}.")
+        if not placed:
+            for observer in observers:
+                observer.move_rejected(self, row, col, letter, player)
+            return None, None  # Invalid move if the cell is already occupied
 
-            sos_list = self.check_for_sos(row, col, letter)  # Check for SOS formations
+        self.moves.append((row, col, letter, player))  # Record the move
+        if self.redo_moves:
+            self.redo_moves = []  # A new move drops the undone ones
 
-            if sos_list:  # If any SOS was formed
-                self.scores[self.current_turn] += len(sos_list)  # Score points for unique SOS formations
+        if observers:
+            start = time.perf_counter()
+            sos_list = self.check_for_sos(row, col, letter)  # Check for SOS formations
+            detect_time = time.perf_counter() - start
+            for observer in observers:
+                observer.move_placed(self, row, col, letter, player, sos_list, detect_time)
+        elif sos_index is not None and self.mode == 'General':
+            sos_list = sos_index.find_all(cells, index)  # Same lookup as check_general_sos, one call less
+        else:
+            sos_list = self.check_for_sos(row, col, letter)  # Check for SOS formations
 
-                print(f"{self.current_turn} formed SOS at {sos_list}. Current score: {self.scores[self.current_turn]}")
+        self.move_gains.append(len(sos_list) if sos_list else 0)
 
-                if self.ui:  # Check if UI is set
-                    self.ui.color_squares(sos_list)  # Call to color squares for SOS
+        if sos_list:  # If any SOS was formed
+            self.scores[player] += len(sos_list)  # Score points for unique SOS formations
+            for observer in observers:
+                observer.sos_formed(self, player, sos_list)
 
-                # Check if the game should end in Simple mode
-                if self.mode == 'Simple':
-                    winner = self.current_turn  # Declare the current player as the winner
-                    print(f"{self.current_turn} wins the game in Simple mode.")
+            # Check if the game should end in Simple mode
+            if self.mode == 'Simple':
+                for observer in observers:
+                    observer.game_over(self, player)  # The current player wins
+                if self.auto_reset:
                     self.reset_game()  # Reset game for a new round
-                    return winner, sos_list  # Return the winner and the SOS list
+                return player, sos_list  # Return the winner and the SOS list
+
+        # Switch turn after the current player has played
+        self.current_turn = 'Red' if player == 'Blue' else 'Blue'
+        for observer in observers:
+            observer.turn_changed(self, self.current_turn)
+
+        # Check for a winner in General mode if the board is full
+        if self.is_full():
+            winner = self.check_winner_by_score() or 'Draw'  # Determine winner based on scores
+            for observer in observers:
+                observer.game_over(self, winner)
+            return winner, None  # Return winner, or draw if no winner
+
+        return None, None  # Continue game if no winner or draw
+
+    def make_move(self, row, col, letter):
+        """Play a move without events or auto reset and return the SOS it scored.
 
-            # Switch turn after the current player has played
-            self.current_turn = 'Red' if self.current_turn == 'Blue' else 'Blue'
-            print(f"Next turn: {self.current_turn}")
+        This is the fast path for search code: pair it with unmake_move() instead of copying the board.
+        Like place_letter, a new move drops the undone moves that redo() could play again.
+        """
+        if self.redo_moves:
+            self.redo_moves = []
+        player = self.current_turn
+        size = self.size
+        if not (0 <= row < size and 0 <= col < size):
+            raise IndexError(f"Cell ({row}, {col}) is off the board.")
+        if self.sos_index is not None:
+            board = self.board
+            index = row * size + col
+            cells = board.cells
+            if cells[index]:
+                raise ValueError(f"Cell ({row}, {col}) is already occupied.")
+            cells[index] = CODES[letter]
+            board.empty_count -= 1
+            board.empty_cells.discard(index)
+            if self.threats is not None:
+                self.threats.update(index, EMPTY)
+            gained = self.sos_index.count(cells, index)
+            if gained and self.mode == 'Simple':
+                gained = 1  # Simple mode scores one point for the winning move
+        else:
+            if self.board[row][col] != '':
+                raise ValueError(f"Cell ({row}, {col}) is already occupied.")
+            self.board[row][col] = letter
+            sos_list = self.check_for_sos(row, col, letter)
+            gained = len(sos_list) if sos_list else 0
 
-            # Check for a winner in General mode if the board is full
-            if self.is_full():
-                winner = self.check_winner_by_score()  # Determine winner based on scores
-                if winner:
-                    print(f"{winner} wins the game in General mode with a score of {self.scores[winner]}.")
-                    return winner, None  # Return winner if found
-                print("The game is a draw.")
-                return 'Draw', None  # Return draw if no winner
+        if gained:
+            self.scores[player] += gained
+        self.moves.append((row, col, letter, player))
+        self.move_gains.append(gained)
+        self.current_turn = 'Red' if player == 'Blue' else 'Blue'
+        return gained
 
-            return None, None  # Continue game if no winner or draw
+    def unmake_move(self):
+        """Take back the last move, restoring the board, score and turn. Returns the move."""
+        row, col, letter, player = self.moves.pop()
+        gained = self.move_gains.pop()
+        if self.backend == 'array':
+            self.board.remove(row, col)
+            if self.threats is not None:
+                self.threats.update(row * self.size + col, CODES[letter])
+        else:
+            self.board[row][col] = ''
+        if gained:
+            self.scores[player] -= gained
+        self.current_turn = player
+        return row, col, letter, player
 
-        print(f"Failed to place {letter} at ({row}, {col}). Cell already occupied.")
-        return None, None  # Invalid move if the cell is already occupied
+    def undo(self):
+        """Undo the last move so redo() can play it again. Returns the move, or None if there is none."""
+        if not self.moves:
+            return None
+        move = self.unmake_move()
+        self.redo_moves.append(move)
+        for observer in self.observers:
+            observer.turn_changed(self, self.current_turn)
+        return move
+
+    def redo(self):
+        """Play the last undone move again. Returns the SOS it scored, or None if there is nothing to redo."""
+        if not self.redo_moves:
+            return None
+        redo_moves = self.redo_moves
+        row, col, letter, player = redo_moves[-1]
+        if self.board[row][col] != '':
+            raise ValueError(f"Cell ({row}, {col}) is already occupied.")  # Nothing changed yet
+        redo_moves.pop()
+        self.current_turn = player
+        gained = self.make_move(row, col, letter)  # Clears self.redo_moves
+        self.redo_moves = redo_moves  # The rest can still be redone
+        for observer in self.observers:
+            observer.turn_changed(self, self.current_turn)
+        return gained
+
+    def copy(self):
+        """Return a detached copy of the game state (no UI, observers or auto reset) for search code."""
+        game = GameLogic.__new__(GameLogic)
+        game.size = self.size
+        game.mode = self.mode
+        game.backend = self.backend
+        game.board = self.board.copy() if self.backend == 'array' else [list(row) for row in self.board]
+        game.sos_index = self.sos_index
+        game.current_turn = self.current_turn
+        game.scores = dict(self.scores)
+        game.moves = list(self.moves)
+        game.move_gains = list(self.move_gains)
+        game.redo_moves = []
+        game.auto_reset = False
+        game.first_player = self.first_player
+        game.ui = None
+        game.observers = []
+        game.players = {'Blue': None, 'Red': None}
+        game.threats = ThreatMap(game.board) if self.threats is not None else None
+        return game
+
+    def game_result(self):
+        """Return 'Blue', 'Red' or 'Draw' once the game is over, otherwise None."""
+        if self.mode == 'Simple':
+            for player in ('Blue', 'Red'):
+                if self.scores[player]:
+                    return player  # The first SOS ends a Simple game
+        if self.is_full():
+            return self.check_winner_by_score() or 'Draw'
+        return None
 
     def check_for_sos(self, row, col, letter):
         """Check for SOS formations based on the game mode."""
-        print(f"Checking for SOS formations at ({row}, {col}) with letter {letter}.")
         if self.mode == 'Simple':
             return self.check_simple_sos(row, col, letter)  # Check for SOS in Simple mode
         elif self.mode == 'General':
@@ -69,14 +271,20 @@ class GameLogic:
 
     def check_simple_sos(self, row, col, letter):
         """Check for SOS in Simple mode (one SOS ends the game)."""
-        sos_found, coordinates = self.is_sos(row, col)  # Check for SOS formation
+        if self.sos_index is not None:
+            coordinates = self.sos_index.find_first(self.board.cells, row * self.size + col)  # Table lookup
+            sos_found = coordinates is not None
+        else:
+            sos_found, coordinates = self.is_sos(row, col)  # Check for SOS formation
         if sos_found:
-            print(f"SOS found in Simple mode at {coordinates}.")
             return [coordinates]  # Return SOS coordinates as a list for consistency
         return None  # No SOS found
 
     def check_general_sos(self, row, col, letter):
         """Check for SOS formations in General mode."""
+        if self.sos_index is not None:
+            return self.sos_index.find_all(self.board.cells, row * self.size + col)  # Table lookup, None if no SOS
+
         sos_list = []  # To track unique SOS formations
         checked_positions = set()  # Set to track unique SOS coordinates
 
@@ -90,8 +298,6 @@ class GameLogic:
                     sos_list.append(coordinates)  # Collect unique SOS formations
                     checked_positions.add(coord_set)  # Mark as counted
 
-        if sos_list:
-            print(f"SOS found in General mode at {sos_list}.")
         return sos_list if sos_list else None  # Return unique SOS list or None
 
     def is_sos(self, row, col):
@@ -133,14 +339,12 @@ class GameLogic:
 
     def is_full(self):
         """Check if the board is full."""
-        full = all(self.board[row][col] != '' for row in range(self.size) for col in range(self.size))
-        if full:
-            print("The board is full.")
-        return full
+        if self.backend == 'array':
+            return self.board.is_full()  # O(1) check on the tracked empty count
+        return all(self.board[row][col] != '' for row in range(self.size) for col in range(self.size))
 
     def check_winner_by_score(self):
         """Check if either player has reached a winning score."""
-        print(f"Checking winner by score. Blue: {self.scores['Blue']}, Red: {self.scores['Red']}")
         if self.scores['Blue'] > self.scores['Red']:
             return 'Blue'  # Blue wins
         elif self.scores['Red'] > self.scores['Blue']:
@@ -149,8 +353,13 @@ class GameLogic:
 
     def reset_game(self):
         """Reset the game board and scores for a new round."""
-        self.board = [['' for _ in range(self.size)] for _ in range(self.size)]  # Clear the board
+        self.board = create_board(self.size, self.backend)  # Clear the board
+        if self.threats is not None:
+            self.threats = ThreatMap(self.board)  # Follow the new board
         self.scores = {'Blue': 0, 'Red': 0}  # Reset scores
-        self.current_turn = random.choice(['Blue', 'Red'])  # Randomly choose starting player
+        self.current_turn = self.first_player or random.choice(['Blue', 'Red'])  # Choose starting player
         self.moves = []  # Reset moves for replay functionality
-        print("Game has been reset. New starting player: ", self.current_turn)
+        self.move_gains = []
+        self.redo_moves = []
+        for observer in self.observers:
+            observer.game_started(self, self.current_turn)
@@ -0,0 +1,183 @@
+"""Load generator for the game server: N concurrent bot players over TCP.
+
+    python -m src.loadgen --clients 2000 --games 5 --size 6 --spawn
+
+Each bot joins, plays random legal moves as soon as it is its turn and measures move
+latency (from sending a move to receiving its broadcast). The report gives p50/p99
+latency, sessions per second and sessions per core, where sessions per core is the
+number of concurrent sessions divided by the server CPU cores they kept busy.
+"""
+import argparse  # Command line parsing
+import asyncio  # Concurrent bots
+import json  # Wire format
+import multiprocessing  # --spawn runs the server in its own process
+import random  # Bot moves
+import time  # Latency and wall-clock timing
+from src.server import main as server_main  # Server entry point for --spawn
+
+
+def percentile(values, fraction):
+    """Return the value below which the given fraction of sorted values falls."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def send(writer, message):
+    writer.write(json.dumps(message).encode() + b'\n')
+    await writer.drain()
+
+
+async def request_stats(host, port):
+    """Return the server's stats message."""
+    reader, writer = await asyncio.open_connection(host, port)
+    await reader.readline()  # welcome
+    await send(writer, {'type': 'stats'})
+    stats = json.loads(await reader.readline())
+    writer.close()
+    return stats
+
+
+async def bot(host, port, size, mode, games, rng, latencies, results):
+    """Play games against whoever the server pairs this bot with."""
+    reader, writer = await asyncio.open_connection(host, port)
+    await reader.readline()  # welcome
+    errors = 0
+    for _ in range(games):
+        await send(writer, {'type': 'join', 'size': size, 'mode': mode})
+        color = None
+        empty = None
+        sent = None  # perf_counter when our pending move was sent
+
+        async def move():
+            nonlocal sent
+            row, col = divmod(rng.choice(sorted(empty)), size)
+            sent = time.perf_counter()
+            await send(writer, {'type': 'move', 'row': row, 'col': col, 'letter': rng.choice('SO')})
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                results.append('disconnected')
+                writer.close()
+                return errors
+            message = json.loads(line)
+            kind = message['type']
+            if kind == 'start':
+                color = message['color']
+                empty = set(range(size * size))
+                if message['turn'] == color:
+                    await move()
+            elif kind == 'move':
+                empty.discard(message['row'] * size + message['col'])
+                if message['player'] == color and sent is not None:
+                    latencies.append(time.perf_counter() - sent)
+                    sent = None
+                if message['turn'] == color and empty:
+                    await move()
+            elif kind == 'game_over':
+                results.append(message['reason'])
+                break
+            elif kind == 'error':
+                errors += 1
+    writer.close()
+    return errors
+
+
+async def run_load(host, port, clients=100, games=1, size=6, mode='General', seed=0):
+    """Run the bots to completion and return a report dict."""
+    before = await request_stats(host, port)
+    latencies = []
+    results = []
+    base = random.Random(seed)
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(bot(host, port, size, mode, games, random.Random(base.getrandbits(32)),
+                                        latencies, results) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    after = await request_stats(host, port)
+
+    latencies.sort()
+    sessions = after['sessions_played'] - before['sessions_played']
+    cores = (after['cpu_time'] - before['cpu_time']) / elapsed if elapsed > 0 else 0.0  # Server cores in use
+    return {
+        'clients': clients,
+        'sessions': sessions,
+        'finished': results.count('finished'),
+        'moves': after['moves'] - before['moves'],
+        'errors': sum(errors),
+        'elapsed': elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'sessions_per_second': sessions / elapsed if elapsed > 0 else 0.0,
+        'sessions_per_core': (clients // 2) / cores if cores > 0 else 0.0,
+    }
+
+
+def format_report(report):
+    """Return the report as printable lines."""
+    return [
+        f"Clients: {report['clients']}, sessions: {report['sessions']} "
+        f"({report['finished']} finished), moves: {report['moves']}, errors: {report['errors']}",
+        f"Move latency: p50 {report['p50_ms']:.2f} ms, p99 {report['p99_ms']:.2f} ms",
+        f"Throughput: {report['sessions_per_second']:,.1f} sessions/s in {report['elapsed']:.2f}s",
+        f"Concurrent sessions per server core: {report['sessions_per_core']:,.0f}",
+    ]
+
+
+async def wait_for_server(host, port, timeout=10.0):
+    """Wait until a spawned server accepts connections."""
+    end = time.perf_counter() + timeout
+    while True:
+        try:
+            await request_stats(host, port)
+            return
+        except OSError:
+            if time.perf_counter() > end:
+                raise
+            await asyncio.sleep(0.05)
+
+
+def raise_file_limit():
+    """Allow as many open sockets as the hard limit permits."""
+    try:
+        import resource  # Unix only
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent bot players against the game server.")
+    parser.add_argument('--host', default='127.0.0.1', help="server address")
+    parser.add_argument('--port', type=int, default=8765, help="server port")
+    parser.add_argument('--clients', type=int, default=200, help="number of concurrent bots (two per session)")
+    parser.add_argument('--games', type=int, default=1, help="games each bot plays")
+    parser.add_argument('--size', type=int, default=6, help="board size")
+    parser.add_argument('--mode', choices=['Simple', 'General'], default='General', help="game mode")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    parser.add_argument('--spawn', action='store_true', help="start a server in a child process first")
+    args = parser.parse_args(argv)
+
+    raise_file_limit()
+    server = None
+    if args.spawn:
+        server = multiprocessing.Process(target=server_main, args=(['--host', args.host, '--port', str(args.port)],),
+                                         daemon=True)
+        server.start()
+    try:
+        if server is not None:
+            asyncio.run(wait_for_server(args.host, args.port))
+        report = asyncio.run(run_load(args.host, args.port, args.clients, args.games, args.size, args.mode, args.seed))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+    for line in format_report(report):
+        print(line)
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""Monte Carlo Tree Search (UCT) player for GameLogic, with optional root-parallel search."""
+import math  # UCT exploration term
+import multiprocessing  # Root-parallel worker processes
+import random  # Rollouts and expansion order
+import time  # Wall-clock budget
+from src.board import LETTERS, O, S  # Byte code -> letter, letter codes
+from src.ai import search_copy  # Detached array-backed game copies
+from src.game_logic import GameLogic  # Game rules
+
+
+class Node:
+    """One position in the search tree, reached by move from its parent."""
+    __slots__ = ('move', 'parent', 'children', 'untried', 'visits', 'wins', 'player', 'terminal')
+
+    def __init__(self, move, parent, player, untried, terminal):
+        self.move = move  # (index, code) that led here
+        self.parent = parent
+        self.children = []
+        self.untried = untried  # Moves not expanded yet
+        self.visits = 0
+        self.wins = 0.0  # Rewards for the player who made self.move
+        self.player = player  # Player who made self.move
+        self.terminal = terminal  # The game is over in this position
+
+    def best_child(self, exploration):
+        """Return the child with the highest UCT score."""
+        log_visits = math.log(self.visits)
+        best = None
+        best_score = -1.0
+        for child in self.children:
+            score = child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits)
+            if score > best_score:
+                best = child
+                best_score = score
+        return best
+
+
+def legal_moves(game, rng):
+    """Return every (index, code) move of a game in random order."""
+    moves = [(index, code) for index in game.board.empty_cells for code in (S, O)]
+    rng.shuffle(moves)
+    return moves
+
+
+def rollout(game, rng):
+    """Play random moves to the end, take them back and return the result."""
+    size = game.size
+    simple = game.mode == 'Simple'
+    order = list(game.board.empty_cells)
+    rng.shuffle(order)
+    made = 0
+    for index in order:
+        row, col = divmod(index, size)
+        gained = game.make_move(row, col, 'S' if rng.random() < 0.5 else 'O')
+        made += 1
+        if simple and gained:
+            break
+    result = game.game_result()
+    for _ in range(made):
+        game.unmake_move()
+    return result
+
+
+def run_search(game, rng, playouts, deadline, exploration, stop_event=None):
+    """Grow a UCT tree from the game position. Returns (root, playouts done)."""
+    size = game.size
+    simple = game.mode == 'Simple'
+    opponent = 'Red' if game.current_turn == 'Blue' else 'Blue'
+    root = Node(None, None, opponent, legal_moves(game, rng), False)
+    done = 0
+    while done < playouts and (done & 15 or (time.perf_counter() < deadline and
+                                             not (stop_event is not None and stop_event.is_set()))):
+        node = root
+        made = 0
+
+        # Selection
+        while not node.untried and node.children and not node.terminal:
+            node = node.best_child(exploration)
+            row, col = divmod(node.move[0], size)
+            game.make_move(row, col, LETTERS[node.move[1]])
+            made += 1
+
+        # Expansion
+        if node.untried and not node.terminal:
+            index, code = node.untried.pop()
+            player = game.current_turn
+            row, col = divmod(index, size)
+            gained = game.make_move(row, col, LETTERS[code])
+            made += 1
+            terminal = (simple and gained > 0) or game.board.empty_count == 0
+            child = Node((index, code), node, player, [] if terminal else legal_moves(game, rng), terminal)
+            node.children.append(child)
+            node = child
+
+        # Simulation
+        result = game.game_result() if node.terminal else rollout(game, rng)
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if result == node.player:
+                node.wins += 1.0
+            elif result == 'Draw':
+                node.wins += 0.5
+            node = node.parent
+
+        for _ in range(made):
+            game.unmake_move()
+        done += 1
+    return root, done
+
+
+def game_state(game):
+    """Return a small picklable snapshot of a game for worker processes."""
+    return game.size, game.mode, bytes(game.board.cells), dict(game.scores), game.current_turn
+
+
+def restore_game(state):
+    """Rebuild a detached game from game_state()."""
+    size, mode, cells, scores, current_turn = state
+    game = GameLogic(size, mode, auto_reset=False)
+    for index, code in enumerate(cells):
+        if code:
+            row, col = divmod(index, size)
+            game.board.place(row, col, LETTERS[code])
+    game.scores = scores
+    game.current_turn = current_turn
+    return game
+
+
+worker_stop = None  # Stop flag shared with the parent, set in each worker process by init_worker()
+
+
+def init_worker(stop):
+    """Pool initializer: keep the shared stop flag for search_worker()."""
+    global worker_stop
+    worker_stop = stop
+
+
+def search_worker(args):
+    """Run one independent tree in a worker and return its root visit counts."""
+    state, seed, playouts, time_limit, exploration = args
+    deadline = time.perf_counter() + time_limit
+    root, done = run_search(restore_game(state), random.Random(seed), playouts, deadline, exploration, worker_stop)
+    return {child.move: (child.visits, child.wins) for child in root.children}, done
+
+
+class MCTSPlayer:
+    """UCT player. Stops at the playout budget or the wall-clock budget, whichever comes first."""
+
+    def __init__(self, playouts=100000, time_limit=1.0, workers=1, exploration=1.4, seed=None):
+        self.playouts = playouts  # Maximum playouts per move (summed over workers)
+        self.time_limit = time_limit  # Seconds per move
+        self.workers = workers  # Independent trees searched in parallel (1 = in process)
+        self.exploration = exploration  # UCT exploration constant
+        self.rng = random.Random(seed)
+        self.pool = None  # Created on first parallel search
+        self.pool_stop = None  # multiprocessing.Event the workers poll, set when stop_event is
+        self.last_stats = {}  # Stats of the last search (playouts, playouts_per_second, workers, time)
+        self.stop_event = None  # Optional threading.Event that ends the search early when set
+
+    def choose_move(self, game):
+        """Return the most visited (row, col, letter) at the root."""
+        start = time.perf_counter()
+        search = search_copy(game)
+        if self.workers <= 1:
+            root, done = run_search(search, self.rng, self.playouts, start + self.time_limit * 0.95,
+                                    self.exploration, self.stop_event)
+            visits = {child.move: (child.visits, child.wins) for child in root.children}
+        else:
+            visits, done = self.parallel_search(search)
+
+        if visits:
+            index, code = max(visits, key=lambda move: visits[move][0])
+        else:
+            index = min(search.board.empty_cells)  # No playout finished: any legal move
+            code = S
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            'playouts': done,
+            'playouts_per_second': done / elapsed if elapsed > 0 else 0.0,
+            'workers': max(self.workers, 1),
+            'time': elapsed,
+        }
+        row, col = divmod(index, search.size)
+        return row, col, LETTERS[code]
+
+    def parallel_search(self, game):
+        """Search independent trees in the process pool and merge their root visit counts."""
+        if self.pool is None:
+            self.pool_stop = multiprocessing.Event()
+            self.pool = multiprocessing.Pool(self.workers, initializer=init_worker, initargs=(self.pool_stop,))
+        self.pool_stop.clear()
+        state = game_state(game)
+        per_worker = max(1, self.playouts // self.workers)
+        time_limit = self.time_limit * 0.9  # Leave room for process round trips
+        tasks = [(state, self.rng.getrandbits(32), per_worker, time_limit, self.exploration)
+                 for _ in range(self.workers)]
+        pending = self.pool.map_async(search_worker, tasks)
+        while not pending.ready():
+            if self.stop_event is not None and self.stop_event.is_set():
+                self.pool_stop.set()  # Workers return their trees within 16 playouts
+            pending.wait(0.01)
+        merged = {}
+        total = 0
+        for counts, done in pending.get():
+            total += done
+            for move, (visits, wins) in counts.items():
+                old_visits, old_wins = merged.get(move, (0, 0.0))
+                merged[move] = (old_visits + visits, old_wins + wins)
+        return merged, total
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            self.pool_stop = None
@@ -0,0 +1,298 @@
+"""Append-only binary game records.
+
+A record file starts with MAGIC, followed by one record per game:
+
+    size (u8), mode (u8), result (u8), move count (u16), then one u16 per move:
+    cell index in bits 0-11, letter in bit 12 (0 = S, 1 = O), player in bit 13 (0 = Blue, 1 = Red)
+
+A side file (<path>.idx) starts with INDEX_MAGIC, the number of records and the data file
+size it covers, followed by the u64 offset of every record, so the reader can jump to any
+game in O(1) without scanning the file. The two files are written separately, so an index
+that does not cover the data exactly (missing, short after a crash, or left from an older
+file) is ignored by the reader and rebuilt by the next writer.
+"""
+import mmap  # Memory-mapped reading
+import os  # File sizes
+import struct  # Binary layout
+from collections import namedtuple  # GameRecord
+from src.board import ArrayBoard, CODES  # Boards rebuilt by board_at
+from src.sos_index import get_sos_index  # SOS lines formed during replay
+
+MAGIC = b'SOSREC1\0'
+RECORD_HEADER = struct.Struct('<BBBH')
+OFFSET = struct.Struct('<Q')
+INDEX_MAGIC = b'SOSIDX1\0'
+INDEX_HEADER = struct.Struct('<8sQQ')  # Magic, records covered, data file bytes covered
+MODES = ('Simple', 'General')
+RESULTS = ('Blue', 'Red', 'Draw', None)  # None: unfinished game
+PLAYERS = ('Blue', 'Red')
+LETTERS = ('S', 'O')
+MAX_RECORD_SIZE = 64  # Cell indices are stored in 12 bits
+
+GameRecord = namedtuple('GameRecord', 'size mode result moves')  # moves: [(row, col, letter, player)]
+
+
+def record_from_game(game, result=None):
+    """Build a GameRecord from a GameLogic and its result."""
+    return GameRecord(game.size, game.mode, result, list(game.moves))
+
+
+def encode_record(record):
+    """Return the bytes of one record."""
+    if record.size > MAX_RECORD_SIZE:
+        raise ValueError(f"Records support boards up to {MAX_RECORD_SIZE}x{MAX_RECORD_SIZE}.")
+    words = [row * record.size + col | LETTERS.index(letter) << 12 | PLAYERS.index(player) << 13
+             for row, col, letter, player in record.moves]
+    return (RECORD_HEADER.pack(record.size, MODES.index(record.mode), RESULTS.index(record.result), len(words)) +
+            struct.pack(f'<{len(words)}H', *words))
+
+
+def decode_record(buffer, offset):
+    """Read the record at an offset of a buffer."""
+    size, mode, result, count = RECORD_HEADER.unpack_from(buffer, offset)
+    words = struct.unpack_from(f'<{count}H', buffer, offset + RECORD_HEADER.size)
+    moves = [(*divmod(word & 0xFFF, size), LETTERS[word >> 12 & 1], PLAYERS[word >> 13 & 1]) for word in words]
+    return GameRecord(size, MODES[mode], RESULTS[result], moves)
+
+
+def record_end(buffer, offset):
+    """Return the offset just past the record at an offset, or None if it runs past the buffer."""
+    if offset + RECORD_HEADER.size > len(buffer):
+        return None
+    end = offset + RECORD_HEADER.size + 2 * RECORD_HEADER.unpack_from(buffer, offset)[3]
+    return end if end <= len(buffer) else None
+
+
+def scan_records(buffer):
+    """Return (offsets of the complete records, offset past the last one) by walking the headers."""
+    offsets = []
+    offset = len(MAGIC)
+    while True:
+        end = record_end(buffer, offset)
+        if end is None:
+            return offsets, offset
+        offsets.append(offset)
+        offset = end
+
+
+def index_matches(buffer, index):
+    """Check that an index covers the data exactly.
+
+    Its header must name as many records as it has offsets and the current data size, its
+    first offset must be the first record and its last record must end at the end of the data.
+    """
+    if len(index) < INDEX_HEADER.size or (len(index) - INDEX_HEADER.size) % OFFSET.size:
+        return False
+    magic, records, data_size = INDEX_HEADER.unpack_from(index, 0)
+    count = (len(index) - INDEX_HEADER.size) // OFFSET.size
+    if magic != INDEX_MAGIC or records != count or data_size != len(buffer):
+        return False
+    if not count:
+        return len(buffer) == len(MAGIC)
+    first = OFFSET.unpack_from(index, INDEX_HEADER.size)[0]
+    last = OFFSET.unpack_from(index, len(index) - OFFSET.size)[0]
+    return first == len(MAGIC) and record_end(buffer, last) == len(buffer)
+
+
+def index_bytes(offsets, data_size):
+    """Return the contents of an index file for record offsets and a data file size."""
+    return (INDEX_HEADER.pack(INDEX_MAGIC, len(offsets), data_size) +
+            b''.join(OFFSET.pack(offset) for offset in offsets))
+
+
+def map_file(file):
+    """Return a read-only mmap of an open file, or b'' if it is empty."""
+    if os.fstat(file.fileno()).st_size == 0:
+        return b''
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class RecordWriter:
+    """Buffered, append-only writer of game records."""
+
+    def __init__(self, path, buffer_size=1 << 20):
+        self.path = path
+        self.buffer_size = buffer_size  # Bytes collected before one bulk write
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if new:
+            with open(path, 'wb') as file:
+                file.write(MAGIC)
+            with open(path + '.idx', 'wb') as index_file:  # Drop an index left from an older file
+                index_file.write(index_bytes([], len(MAGIC)))
+        else:
+            self.repair()
+        self.file = open(path, 'ab')
+        self.index_file = open(path + '.idx', 'r+b')
+        self.records = (self.index_file.seek(0, os.SEEK_END) - INDEX_HEADER.size) // OFFSET.size
+        self.position = self.file.tell()  # Offset of the next record
+        self.buffer = bytearray()
+        self.offsets = bytearray()
+
+    def repair(self):
+        """Drop a torn last record and rebuild the index if it does not cover the data exactly."""
+        index_path = self.path + '.idx'
+        index = b''
+        if os.path.exists(index_path):
+            with open(index_path, 'rb') as index_file:
+                index = index_file.read()
+        with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if index_matches(data, index):
+                return
+            offsets, end = scan_records(data)
+            size = len(data)
+        if end < size:
+            os.truncate(self.path, end)  # Crash in the middle of a record
+        with open(index_path, 'wb') as index_file:
+            index_file.write(index_bytes(offsets, end))
+
+    def write(self, record):
+        """Append a GameRecord."""
+        self.offsets += OFFSET.pack(self.position + len(self.buffer))
+        self.buffer += encode_record(record)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_game(self, game, result=None):
+        """Append a GameLogic's moves and result."""
+        self.write(record_from_game(game, result))
+
+    def flush(self):
+        """Write the buffered records to disk."""
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.file.flush()  # Data first: the index header never covers bytes not written yet
+            self.index_file.write(self.offsets)
+            self.records += len(self.offsets) // OFFSET.size
+            self.position += len(self.buffer)
+            self.index_file.seek(0)
+            self.index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, self.records, self.position))
+            self.index_file.seek(0, os.SEEK_END)
+            self.buffer = bytearray()
+            self.offsets = bytearray()
+        self.file.flush()
+        self.index_file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+        self.index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RecordReader:
+    """Memory-mapped reader with O(1) access to any game."""
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an SOS game record file.")
+        self.index_file = None
+        self.index = None
+        if os.path.exists(path + '.idx'):
+            self.index_file = open(path + '.idx', 'rb')
+            self.index = map_file(self.index_file)
+            if self.index and index_matches(self.map, self.index):
+                self.count = INDEX_HEADER.unpack_from(self.index, 0)[1]
+            else:
+                self.close_index()  # Missing, short or stale index: scan instead
+        if self.index is None:
+            self.offsets = scan_records(self.map)[0]  # Find the records once
+            self.count = len(self.offsets)
+
+    def close_index(self):
+        if self.index:
+            self.index.close()
+        if self.index_file is not None:
+            self.index_file.close()
+        self.index_file = None
+        self.index = None
+
+    def offset(self, number):
+        if self.index is not None:
+            return OFFSET.unpack_from(self.index, INDEX_HEADER.size + number * OFFSET.size)[0]
+        return self.offsets[number]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, number):
+        if number < 0:
+            number += self.count
+        if not 0 <= number < self.count:
+            raise IndexError("game record out of range")
+        return decode_record(self.map, self.offset(number))
+
+    def __iter__(self):
+        for number in range(self.count):
+            yield self[number]
+
+    def close(self):
+        self.close_index()
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Replay:
+    """Positions of a recorded game: the SOS and scores after every move, for seeking.
+
+    The UI seeks by diffing: it applies or takes back only the moves between the position on
+    screen and the new one, so no board snapshots are kept.
+    """
+
+    def __init__(self, record):
+        self.record = record
+        self.sos_lines = []  # (move number, player, SOS coordinates) for every SOS formed
+        self.scores_after = []  # Scores after each move
+
+        size = record.size
+        index_lines = get_sos_index(size)
+        cells = bytearray(size * size)
+        scores = {'Blue': 0, 'Red': 0}
+        for number, (row, col, letter, player) in enumerate(record.moves):
+            index = row * size + col
+            cells[index] = CODES[letter]
+            if record.mode == 'Simple':
+                first = index_lines.find_first(cells, index)
+                found = [first] if first else []
+            else:
+                found = index_lines.find_all(cells, index) or []
+            for coordinates in found:
+                self.sos_lines.append((number, player, coordinates))
+            scores[player] += len(found)
+            self.scores_after.append(dict(scores))
+
+    def __len__(self):
+        return len(self.record.moves)
+
+    def board_at(self, move_count):
+        """Return (ArrayBoard, scores) after the first move_count moves."""
+        move_count = max(0, min(move_count, len(self)))
+        board = ArrayBoard(self.record.size)
+        for row, col, letter, player in self.record.moves[:move_count]:
+            board.place(row, col, letter)
+        return board, self.scores_at(move_count)
+
+    def scores_at(self, move_count):
+        """Return the scores after the first move_count moves."""
+        move_count = max(0, min(move_count, len(self)))
+        return dict(self.scores_after[move_count - 1]) if move_count else {'Blue': 0, 'Red': 0}
+
+    def sos_until(self, move_count):
+        """Return (player, coordinates) of every SOS formed in the first move_count moves."""
+        return self.sos_between(0, move_count)
+
+    def sos_between(self, start, end):
+        """Return (player, coordinates) of every SOS formed by moves start to end - 1."""
+        return [(player, coordinates) for number, player, coordinates in self.sos_lines if start <= number < end]
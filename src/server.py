@@ -0,0 +1,334 @@
+"""Asyncio game server: line-delimited JSON over TCP, one GameLogic per session.
+
+    python -m src.server --port 8765
+
+Client messages (one JSON object per line):
+
+    {"type": "join", "size": 8, "mode": "General"}   wait for an opponent with the same settings
+    {"type": "move", "row": 2, "col": 3, "letter": "S"}
+    {"type": "stats"}                                 server counters and CPU time
+    {"type": "ping"}
+
+Server messages: welcome, waiting, start, move, game_over, error, stats and pong.
+"""
+import argparse  # Command line parsing
+import asyncio  # Event loop, streams and timers
+import itertools  # Session ids
+import json  # Wire format
+import time  # CPU time for stats
+from src.events import GameObserver  # SOS lines of each move
+from src.game_logic import GameLogic  # Game rules
+
+MAX_SIZE = 20  # Largest board a client may ask for
+MAX_LINE = 4096  # Longest accepted message in bytes
+BACKLOG = 4096  # Pending connections, so a burst of clients is not refused
+
+
+def encode(message):
+    """Return a message as one line of compact JSON."""
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+class Connection:
+    """One client: its stream, color and session."""
+
+    def __init__(self, server, reader, writer):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.session = None
+        self.color = None  # 'Blue' or 'Red' once in a session
+        self.waiting_for = None  # (size, mode) while in the matchmaking queue
+        self.last_active = asyncio.get_running_loop().time()  # Loop time of the last message
+        self.closed = False
+
+    def send(self, message):
+        """Queue a message."""
+        self.send_line(encode(message))
+
+    def send_line(self, line):
+        """Queue an encoded message. A client that lets its buffer grow past the limit is dropped."""
+        if self.closed:
+            return
+        self.writer.write(line)
+        if self.writer.transport.get_write_buffer_size() > self.server.max_buffer:
+            self.server.drop(self, "slow consumer")
+
+    @property
+    def backlogged(self):
+        """Check if sent messages are still waiting in the transport buffer."""
+        return not self.closed and self.writer.transport.get_write_buffer_size() > 0
+
+    async def drain(self):
+        """Wait until the buffer is below the transport's high-water mark, or drop the client."""
+        if not self.backlogged:
+            return  # Everything was sent straight away: no task or timer needed
+        try:
+            await asyncio.wait_for(self.writer.drain(), self.server.drain_timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            self.server.drop(self, "slow consumer")
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.writer.close()
+
+
+class Session(GameObserver):
+    """A game between two connections. Observes its game to collect the SOS of each move."""
+
+    def __init__(self, server, number, size, mode, blue, red):
+        self.server = server
+        self.number = number
+        self.game = GameLogic(size, mode, observers=[self], auto_reset=False)
+        self.players = {'Blue': blue, 'Red': red}
+        self.timer = None  # Idle timer of the player to move
+        self.over = False
+        self.last_sos = []  # SOS formed by the last move
+        for color, connection in self.players.items():
+            connection.session = self
+            connection.color = color
+
+    def sos_formed(self, game, player, sos_list):
+        self.last_sos = sos_list
+
+    def broadcast(self, message):
+        """Queue a message for both players; drain() waits until it is sent."""
+        line = encode(message)  # Encoded once for both players
+        for connection in self.players.values():
+            connection.send_line(line)
+
+    async def drain(self):
+        """Wait for the buffers of both players in parallel."""
+        slow = [connection.drain() for connection in self.players.values() if connection.backlogged]
+        if slow:
+            await asyncio.gather(*slow)
+
+    def restart_timer(self):
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = asyncio.get_running_loop().call_later(self.server.idle_timeout, self.on_idle)
+
+    def on_idle(self):
+        """The player to move took too long: the opponent wins."""
+        self.timer = None
+        self.finish(self.opponent(self.game.current_turn), "timeout")
+
+    def opponent(self, color):
+        return 'Red' if color == 'Blue' else 'Blue'
+
+    async def start(self):
+        game = self.game
+        for color, connection in self.players.items():
+            connection.send({'type': 'start', 'session': self.number, 'color': color,
+                             'size': game.size, 'mode': game.mode, 'turn': game.current_turn})
+        self.restart_timer()
+        await self.drain()
+
+    async def play(self, connection, message):
+        """Validate and apply a move from one of the players."""
+        game = self.game
+        if self.over:
+            connection.send({'type': 'error', 'reason': "game is over"})
+            return
+        if connection.color != game.current_turn:
+            connection.send({'type': 'error', 'reason': "not your turn"})
+            return
+        row, col, letter = message.get('row'), message.get('col'), message.get('letter')
+        if (type(row) is not int or type(col) is not int or letter not in ('S', 'O') or
+                not (0 <= row < game.size and 0 <= col < game.size)):
+            connection.send({'type': 'error', 'reason': "invalid move"})
+            return
+        if game.board[row][col] != '':
+            connection.send({'type': 'error', 'reason': "cell is occupied"})
+            return
+
+        player = game.current_turn
+        self.last_sos = []
+        winner, _ = game.place_letter(row, col, letter)
+        self.server.moves += 1
+        self.broadcast({'type': 'move', 'row': row, 'col': col, 'letter': letter, 'player': player,
+                        'sos': self.last_sos, 'scores': game.scores, 'turn': None if winner else game.current_turn})
+        # End the game before the first await: a Simple win keeps the winner's turn, and the idle
+        # timer or a disconnect must not change the result while the broadcast drains
+        if winner:
+            self.finish(winner, "finished")
+        else:
+            self.restart_timer()
+        await self.drain()
+
+    def finish(self, result, reason):
+        """End the session and tell whoever is still connected."""
+        if self.over:
+            return
+        self.over = True
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        for connection in self.players.values():
+            connection.send({'type': 'game_over', 'result': result, 'reason': reason, 'scores': self.game.scores})
+            connection.session = None
+            connection.color = None
+        self.server.end_session(self)
+
+
+class GameServer:
+    """Matchmaking and session hosting for many concurrent clients."""
+
+    def __init__(self, host='127.0.0.1', port=8765, idle_timeout=60.0, max_buffer=1 << 16, drain_timeout=5.0):
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout  # Seconds a player may take per move, or idle outside a game
+        self.max_buffer = max_buffer  # Bytes of unsent output before a client is dropped
+        self.drain_timeout = drain_timeout  # Seconds a broadcast waits for a slow client
+        self.waiting = {}  # (size, mode) -> connection waiting for an opponent
+        self.sessions = {}  # Session number -> Session
+        self.session_ids = itertools.count(1)
+        self.connections = set()
+        self.handlers = set()  # Client handler tasks, awaited on close
+        self.sessions_played = 0
+        self.moves = 0
+        self.server = None
+        self.reaper = None  # Task that drops idle clients outside a game
+
+    async def start(self):
+        """Start listening. Returns the asyncio server; port 0 picks a free port."""
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port, limit=MAX_LINE,
+                                                 backlog=BACKLOG)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.reaper = asyncio.create_task(self.reap_idle())
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.reaper is not None:
+            self.reaper.cancel()
+        for connection in list(self.connections):
+            self.drop(connection, "server shutdown")
+        if self.handlers:
+            await asyncio.gather(*self.handlers, return_exceptions=True)
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def reap_idle(self):
+        """Drop clients that stay idle outside a game; in a game the session timer decides.
+        Clients waiting in the matchmaking queue are kept: they are idle only because nobody joined yet.
+
+        One sweep for all clients is much cheaper than a timeout around every read.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.idle_timeout / 4)
+            deadline = loop.time() - self.idle_timeout
+            for connection in list(self.connections):
+                if connection.session is None and connection.waiting_for is None and connection.last_active < deadline:
+                    self.drop(connection, "idle")
+
+    async def handle_client(self, reader, writer):
+        connection = Connection(self, reader, writer)
+        self.connections.add(connection)
+        task = asyncio.current_task()
+        self.handlers.add(task)
+        loop = asyncio.get_running_loop()
+        connection.send({'type': 'welcome'})
+        try:
+            while not connection.closed:
+                line = await reader.readline()
+                if not line:
+                    break
+                connection.last_active = loop.time()
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    connection.send({'type': 'error', 'reason': "bad json"})
+                    continue
+                if not isinstance(message, dict):
+                    connection.send({'type': 'error', 'reason': "bad message"})
+                    continue
+                await self.handle_message(connection, message)
+        except (ConnectionError, ValueError):
+            pass  # Reset connection or a line over MAX_LINE
+        finally:
+            self.drop(connection, "disconnected")
+            self.handlers.discard(task)
+
+    async def handle_message(self, connection, message):
+        kind = message.get('type')
+        if kind == 'move':
+            if connection.session is None:
+                connection.send({'type': 'error', 'reason': "not in a game"})
+            else:
+                await connection.session.play(connection, message)
+        elif kind == 'join':
+            await self.join(connection, message)
+        elif kind == 'stats':
+            connection.send(self.stats())
+        elif kind == 'ping':
+            connection.send({'type': 'pong'})
+        else:
+            connection.send({'type': 'error', 'reason': "unknown message type"})
+        await connection.drain()
+
+    async def join(self, connection, message):
+        """Pair the connection with a waiting one of the same size and mode, or queue it."""
+        size, mode = message.get('size', 8), message.get('mode', 'General')
+        if connection.session is not None or connection.waiting_for is not None:
+            connection.send({'type': 'error', 'reason': "already joined"})
+            return
+        if type(size) is not int or not 3 <= size <= MAX_SIZE or mode not in ('Simple', 'General'):
+            connection.send({'type': 'error', 'reason': "invalid game settings"})
+            return
+        key = (size, mode)
+        opponent = self.waiting.pop(key, None)
+        if opponent is None or opponent.closed:
+            self.waiting[key] = connection
+            connection.waiting_for = key
+            connection.send({'type': 'waiting'})
+            return
+        opponent.waiting_for = None
+        session = Session(self, next(self.session_ids), size, mode, opponent, connection)
+        self.sessions[session.number] = session
+        await session.start()
+
+    def end_session(self, session):
+        if self.sessions.pop(session.number, None) is not None:
+            self.sessions_played += 1
+
+    def drop(self, connection, reason):
+        """Close a connection; its opponent wins an unfinished game."""
+        if connection.waiting_for is not None and self.waiting.get(connection.waiting_for) is connection:
+            del self.waiting[connection.waiting_for]
+        connection.waiting_for = None
+        connection.close()
+        self.connections.discard(connection)
+        session = connection.session
+        if session is not None:
+            session.finish(session.opponent(connection.color), reason)
+
+    def stats(self):
+        return {'type': 'stats', 'connections': len(self.connections), 'sessions': len(self.sessions),
+                'sessions_played': self.sessions_played, 'moves': self.moves, 'cpu_time': time.process_time()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host SOS games over line-delimited JSON on TCP.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=8765, help="port to listen on")
+    parser.add_argument('--idle-timeout', type=float, default=60.0, help="seconds a player may take per move")
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.host, args.port, args.idle_timeout)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
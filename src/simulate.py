@@ -0,0 +1,178 @@
+"""Headless self-play simulator.
+
+Plays games through GameLogic without Tk and spreads them across a process pool:
+
+    python -m src.simulate --games 1000000 --size 8 --mode General --workers 4
+"""
+import argparse  # Command line parsing
+import multiprocessing  # Process pool for parallel games
+import os  # CPU count for the default worker number
+import random  # Per-worker random generators
+import sys  # Output stream for progress lines
+import time  # Wall-clock timing for throughput
+from src.ai import scoring_move  # Greedy policy shared with GreedyPlayer
+from src.board import EMPTY  # Byte code of an empty ArrayBoard cell
+from src.game_logic import GameLogic  # Game rules
+
+COLORS = ('Blue', 'Red')
+
+
+def random_move(game, rng, order):
+    """Take the next empty cell of a pre-shuffled order with a random letter."""
+    cells = game.board.cells
+    while True:
+        index = order.pop()  # Each cell is popped once, so a whole game is O(N^2)
+        if cells[index] == EMPTY:
+            row, col = divmod(index, game.size)
+            return row, col, 'S' if rng.random() < 0.5 else 'O'
+
+
+def greedy_move(game, rng, order):
+    """Take a move that forms an SOS if there is one, otherwise play randomly."""
+    return scoring_move(game) or random_move(game, rng, order)
+
+
+POLICIES = {'random': random_move, 'greedy': greedy_move}  # Name -> move function
+
+
+def new_stats():
+    """Return an empty aggregate of game results."""
+    return {
+        'games': 0,
+        'wins': {'Blue': 0, 'Red': 0},  # Wins per color
+        'starts': {'Blue': 0, 'Red': 0},  # Games started per color
+        'starter_wins': 0,  # Games won by the player who moved first
+        'draws': 0,
+        'sos': 0,  # Total SOS formed
+        'moves': 0,  # Total moves played
+    }
+
+
+def merge_stats(total, part):
+    """Add the results in part into total."""
+    for key in ('games', 'starter_wins', 'draws', 'sos', 'moves'):
+        total[key] += part[key]
+    for color in COLORS:
+        total['wins'][color] += part['wins'][color]
+        total['starts'][color] += part['starts'][color]
+    return total
+
+
+def play_game(game, rng, policy, stats):
+    """Play one game to the end and add its result to stats."""
+    blue_policy, red_policy = policy if isinstance(policy, tuple) else (policy, policy)
+    game.reset_game()
+    starter = game.current_turn
+    order = list(range(game.size * game.size))
+    rng.shuffle(order)
+    moves = 0
+    while True:
+        move = blue_policy if game.current_turn == 'Blue' else red_policy
+        row, col, letter = move(game, rng, order)
+        winner, sos_list = game.place_letter(row, col, letter)
+        moves += 1
+        if winner:
+            break
+
+    stats['games'] += 1
+    stats['starts'][starter] += 1
+    stats['moves'] += moves
+    if game.mode == 'Simple':
+        stats['sos'] += len(sos_list) if sos_list else 0  # Scores were reset when the game ended
+    else:
+        stats['sos'] += game.scores['Blue'] + game.scores['Red']
+    if winner == 'Draw':
+        stats['draws'] += 1
+    else:
+        stats['wins'][winner] += 1
+        if winner == starter:
+            stats['starter_wins'] += 1
+    return winner
+
+
+def run_batch(args):
+    """Play a batch of games in one worker and return its stats."""
+    size, mode, policy_name, games, seed = args
+    random.seed(seed)  # GameLogic picks the starting player with the module random
+    rng = random.Random(seed)
+    game = GameLogic(size, mode, verbose=False)
+    stats = new_stats()
+    policy = POLICIES[policy_name]
+    for _ in range(games):
+        play_game(game, rng, policy, stats)
+    return stats
+
+
+def simulate(games, size, mode='General', workers=1, policy='random', seed=0, batch_size=1000, progress=None):
+    """Play games across a process pool and return (stats, elapsed seconds).
+
+    progress, if given, is called with the running stats after every finished batch.
+    """
+    batches = []
+    remaining = games
+    while remaining > 0:
+        count = min(batch_size, remaining)
+        batches.append((size, mode, policy, count, seed * 1000003 + len(batches)))  # Distinct seed per batch
+        remaining -= count
+
+    total = new_stats()
+    start = time.perf_counter()
+    if workers <= 1:
+        results = map(run_batch, batches)  # Run in process, no pool start-up cost
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers)
+        results = pool.imap_unordered(run_batch, batches)
+    try:
+        for part in results:
+            merge_stats(total, part)
+            if progress:
+                progress(total, time.perf_counter() - start)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    return total, time.perf_counter() - start
+
+
+def format_report(stats, elapsed, workers):
+    """Format aggregate results and throughput as text lines."""
+    games = stats['games'] or 1
+    rate = stats['games'] / elapsed if elapsed > 0 else 0.0
+    lines = [
+        f"Games: {stats['games']}  Moves: {stats['moves']}  Time: {elapsed:.2f}s",
+        f"Blue wins: {stats['wins']['Blue'] / games:.2%}  Red wins: {stats['wins']['Red'] / games:.2%}  Draws: {stats['draws'] / games:.2%}",
+        f"Starting player wins: {stats['starter_wins'] / games:.2%}  (Blue started {stats['starts']['Blue']}, Red started {stats['starts']['Red']})",
+        f"Average SOS per game: {stats['sos'] / games:.3f}  Average game length: {stats['moves'] / games:.2f} moves",
+        f"Throughput: {rate:,.0f} games/s  ({rate / max(workers, 1):,.0f} games/s per worker)",
+    ]
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless SOS self-play games.")
+    parser.add_argument('--games', type=int, default=10000, help="number of games to play")
+    parser.add_argument('--size', type=int, default=8, help="board size")
+    parser.add_argument('--mode', choices=['Simple', 'General'], default='General', help="game mode")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='random', help="move policy for both players")
+    parser.add_argument('--seed', type=int, default=0, help="base random seed")
+    parser.add_argument('--batch-size', type=int, default=1000, help="games per worker task")
+    args = parser.parse_args(argv)
+
+    if args.size < 3:
+        parser.error("size must be at least 3")
+
+    def progress(stats, elapsed):
+        rate = stats['games'] / elapsed if elapsed > 0 else 0.0
+        print(f"{stats['games']}/{args.games} games, {rate:,.0f} games/s", file=sys.stderr)
+
+    stats, elapsed = simulate(args.games, args.size, args.mode, args.workers, args.policy,
+                              args.seed, args.batch_size, progress)
+    for line in format_report(stats, elapsed, args.workers):
+        print(line)
+    return stats
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""Exhaustive perfect-play solver and on-disk position database for small boards.
+
+Values are from the point of view of the player to move:
+- General mode: the best score margin (own SOS minus opponent SOS) still to come.
+- Simple mode: 1 for a win, 0 for a draw, -1 for a loss.
+
+Positions are folded under the 8 symmetries of the square, so each is stored once under its
+smallest base-3 key. The database is a sorted table of keys and values read through mmap:
+
+    python -m src.solver --size 4 --mode General --output sos_4_general.sosdb
+"""
+import argparse  # Command line parsing
+import bisect  # Binary search over the memory-mapped keys
+import mmap  # Memory-mapped database file
+import struct  # Database header
+import sys  # Byte order of the key array
+import time  # Positions/sec
+from src.board import S, O, LETTERS  # Byte codes used by ArrayBoard
+from src.sos_index import get_sos_index  # SOS counting per cell
+
+MAX_SOLVER_SIZE = 4  # Larger boards have too many positions to enumerate
+MAGIC = b'SOSDB1\0\0'
+HEADER = struct.Struct('<8sBBxxxxxxQ')  # magic, size, mode, padding, entry count (24 bytes, 8-byte aligned)
+MODES = {'Simple': 0, 'General': 1}
+
+
+def symmetry_weights(size):
+    """Return, for every cell, the base-3 weight of that cell under each of the 8 symmetries."""
+    last = size - 1
+    maps = [
+        lambda r, c: (r, c), lambda r, c: (c, last - r), lambda r, c: (last - r, last - c),
+        lambda r, c: (last - c, r), lambda r, c: (r, last - c), lambda r, c: (last - r, c),
+        lambda r, c: (c, r), lambda r, c: (last - c, last - r),
+    ]
+    weights = []
+    for row in range(size):
+        for col in range(size):
+            cell = []
+            for transform in maps:
+                r, c = transform(row, col)
+                cell.append(3 ** (r * size + c))
+            weights.append(tuple(cell))
+    return weights
+
+
+def canonical_key(cells, cell_weights):
+    """Return the smallest base-3 key of a board over the 8 symmetries (cell_weights from symmetry_weights)."""
+    keys = [0] * 8
+    for index, weights in enumerate(cell_weights):
+        code = cells[index]
+        if code:
+            for s in range(8):
+                keys[s] += code * weights[s]
+    return min(keys)
+
+
+class Solver:
+    """Depth-first solver with a memo table of canonical positions."""
+
+    def __init__(self, size, mode):
+        if not 3 <= size <= MAX_SOLVER_SIZE:
+            raise ValueError(f"The solver only handles boards from 3x3 to {MAX_SOLVER_SIZE}x{MAX_SOLVER_SIZE}.")
+        self.size = size
+        self.mode = mode
+        self.index_lines = get_sos_index(size)
+        self.weights = symmetry_weights(size)
+        self.memo = {}  # Canonical key -> value
+        self.positions = 0  # Positions searched (memo misses)
+        self.elapsed = 0.0
+
+    def solve(self):
+        """Solve from the empty board and return its value."""
+        start = time.perf_counter()
+        cells = bytearray(self.size * self.size)
+        value = self.search(cells, [0] * 8, len(cells))
+        self.elapsed = time.perf_counter() - start
+        return value
+
+    def search(self, cells, keys, empty):
+        """Return the value of a position for the player to move."""
+        key = min(keys)
+        value = self.memo.get(key)
+        if value is not None:
+            return value
+        self.positions += 1
+        if empty == 0:
+            self.memo[key] = 0
+            return 0
+
+        simple = self.mode == 'Simple'
+        count = self.index_lines.count
+        best = -10 ** 6
+        for index in range(len(cells)):
+            if cells[index]:
+                continue
+            weights = self.weights[index]
+            for code in (S, O):
+                cells[index] = code
+                gained = count(cells, index)
+                if simple and gained:
+                    value = 1  # Completing an SOS wins a Simple game
+                else:
+                    child = [k + code * w for k, w in zip(keys, weights)]
+                    value = gained - self.search(cells, child, empty - 1)
+                cells[index] = 0
+                if value > best:
+                    best = value
+        self.memo[key] = best
+        return best
+
+    def positions_per_second(self):
+        """Return the solver throughput of the last solve()."""
+        return self.positions / self.elapsed if self.elapsed > 0 else 0.0
+
+    def write(self, path):
+        """Write the memo table as a sorted database file. Returns the file size in bytes."""
+        keys = sorted(self.memo)
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, self.size, MODES[self.mode], len(keys)))
+            f.write(struct.pack(f'<{len(keys)}Q', *keys))
+            f.write(struct.pack(f'<{len(keys)}b', *(self.memo[key] for key in keys)))
+            return f.tell()
+
+
+class PositionDatabase:
+    """Read-only, memory-mapped solver database with O(log n) lookups."""
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size, mode, self.count = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an SOS position database.")
+        self.mode = 'General' if mode == MODES['General'] else 'Simple'
+        self.view = memoryview(self.map)
+        key_end = HEADER.size + 8 * self.count
+        if sys.byteorder == 'little':
+            self.keys = self.view[HEADER.size:key_end].cast('Q')  # Sorted keys, searched in place
+        else:
+            self.keys = struct.unpack_from(f'<{self.count}Q', self.map, HEADER.size)
+        self.values = self.view[key_end:key_end + self.count].cast('b')
+        self.weights = symmetry_weights(self.size)
+
+    def lookup_key(self, key):
+        """Return the value stored for a canonical key, or None."""
+        position = bisect.bisect_left(self.keys, key)
+        if position < self.count and self.keys[position] == key:
+            return self.values[position]
+        return None
+
+    def lookup(self, cells):
+        """Return the value of a board (bytearray of codes) for the player to move, or None."""
+        return self.lookup_key(canonical_key(cells, self.weights))
+
+    def close(self):
+        """Release the memory map."""
+        for view in (self.keys, self.values, self.view):
+            if isinstance(view, memoryview):
+                view.release()
+        self.map.close()
+        self.file.close()
+
+
+class PerfectPlayer:
+    """Player that picks moves from a solved position database."""
+
+    def __init__(self, database):
+        self.database = database
+
+    def move_values(self, game):
+        """Return {(row, col, letter): value for the mover} for every legal move."""
+        if (game.size, game.mode) != (self.database.size, self.database.mode):
+            raise ValueError(f"The database is for {self.database.size}x{self.database.size} {self.database.mode} games.")
+        cells = bytearray(game.board.cells) if game.backend == 'array' else bytearray(
+            'SO'.index(game.board[r][c]) + 1 if game.board[r][c] else 0
+            for r in range(game.size) for c in range(game.size))
+        index_lines = get_sos_index(game.size)
+        simple = game.mode == 'Simple'
+        values = {}
+        for index in range(len(cells)):
+            if cells[index]:
+                continue
+            for code in (S, O):
+                cells[index] = code
+                gained = index_lines.count(cells, index)
+                if simple and gained:
+                    value = 1
+                elif 0 not in cells:
+                    value = gained  # Last move of the game
+                else:
+                    value = gained - self.database.lookup(cells)
+                cells[index] = 0
+                row, col = divmod(index, game.size)
+                values[(row, col, LETTERS[code])] = value
+        return values
+
+    def choose_move(self, game):
+        """Return a move with the best exact value."""
+        values = self.move_values(game)
+        return max(values, key=values.get)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve small SOS boards and write a position database.")
+    parser.add_argument('--size', type=int, default=3, help="board size (3 or 4)")
+    parser.add_argument('--mode', choices=sorted(MODES), default='General', help="game mode")
+    parser.add_argument('--output', help="database file (default sos_<size>_<mode>.sosdb)")
+    args = parser.parse_args(argv)
+
+    solver = Solver(args.size, args.mode)
+    value = solver.solve()
+    path = args.output or f"sos_{args.size}_{args.mode.lower()}.sosdb"
+    size = solver.write(path)
+    print(f"{args.size}x{args.size} {args.mode}: value {value} for the first player")
+    print(f"Positions: {solver.positions} in {solver.elapsed:.2f}s ({solver.positions_per_second():,.0f} positions/s)")
+    print(f"Database: {path}, {len(solver.memo)} entries, {size} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+from src.board import S, O  # Byte codes used by ArrayBoard
+
+# Directions in the order GameLogic.is_sos_in_direction walks them
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1), (-1, 1), (1, -1)]
+
+_INDEX_CACHE = {}  # Board size -> SOSLineIndex, shared by every game of that size
+
+
+class SOSLineIndex:
+    """Precomputed SOS triples for every cell of a board size.
+
+    s_lines[i] holds (middle, far, coordinates) for the lines where cell i is an S end,
+    o_lines[i] holds (first, last, coordinates) for the lines where cell i is the O middle.
+    Coordinates are stored in the same order the direction-walking code reports them.
+    """
+    __slots__ = ('size', 's_lines', 'o_lines')
+
+    def __init__(self, size):
+        self.size = size
+        s_lines = []
+        o_lines = []
+        for row in range(size):
+            for col in range(size):
+                ends = []
+                middles = []
+                seen = set()  # Middle lines found twice (once per opposite direction)
+                for dr, dc in DIRECTIONS:
+                    # Cell as the S end: S at (row, col), O one step away, S two steps away
+                    r2, c2 = row + 2 * dr, col + 2 * dc
+                    if 0 <= r2 < size and 0 <= c2 < size:
+                        coordinates = ((row, col), (row + dr, col + dc), (r2, c2))
+                        ends.append(((row + dr) * size + col + dc, r2 * size + c2, coordinates))
+
+                    # Cell as the O middle: S on both sides
+                    r0, c0, r1, c1 = row - dr, col - dc, row + dr, col + dc
+                    if 0 <= r0 < size and 0 <= c0 < size and 0 <= r1 < size and 0 <= c1 < size:
+                        key = frozenset(((r0, c0), (r1, c1)))
+                        if key not in seen:
+                            seen.add(key)
+                            coordinates = ((r0, c0), (row, col), (r1, c1))
+                            middles.append((r0 * size + c0, r1 * size + c1, coordinates))
+                s_lines.append(tuple(ends))
+                o_lines.append(tuple(middles))
+        self.s_lines = tuple(s_lines)
+        self.o_lines = tuple(o_lines)
+
+    def find_all(self, cells, index):
+        """Return every SOS that goes through the letter at a flat index, or None if there is none.
+
+        Nothing is allocated unless an SOS is found, which keeps the common no-SOS case cheap.
+        """
+        letter = cells[index]
+        found = None
+        if letter == S:
+            for middle, far, coordinates in self.s_lines[index]:
+                if cells[middle] == O and cells[far] == S:
+                    if found is None:
+                        found = [list(coordinates)]
+                    else:
+                        found.append(list(coordinates))
+        elif letter == O:
+            for first, last, coordinates in self.o_lines[index]:
+                if cells[first] == S and cells[last] == S:
+                    if found is None:
+                        found = [list(coordinates)]
+                    else:
+                        found.append(list(coordinates))
+        return found
+
+    def count(self, cells, index):
+        """Return how many SOS go through the letter at a flat index, without building them."""
+        letter = cells[index]
+        found = 0
+        if letter == S:
+            for middle, far, _ in self.s_lines[index]:
+                if cells[middle] == O and cells[far] == S:
+                    found += 1
+        elif letter == O:
+            for first, last, _ in self.o_lines[index]:
+                if cells[first] == S and cells[last] == S:
+                    found += 1
+        return found
+
+    def find_first(self, cells, index):
+        """Return the first SOS that goes through the letter at a flat index, or None."""
+        letter = cells[index]
+        if letter == S:
+            for middle, far, coordinates in self.s_lines[index]:
+                if cells[middle] == O and cells[far] == S:
+                    return list(coordinates)
+        elif letter == O:
+            for first, last, coordinates in self.o_lines[index]:
+                if cells[first] == S and cells[last] == S:
+                    return list(coordinates)
+        return None
+
+
+def get_sos_index(size):
+    """Return the cached SOS line index for a board size, building it on first use."""
+    index = _INDEX_CACHE.get(size)
+    if index is None:
+        index = _INDEX_CACHE[size] = SOSLineIndex(size)
+    return index
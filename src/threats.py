@@ -0,0 +1,95 @@
+from src.board import EMPTY, S, O  # Byte codes used by ArrayBoard
+from src.sos_index import get_sos_index  # Precomputed SOS lines per board size
+
+
+class ThreatMap:
+    """Scoring and unsafe moves of every empty cell, kept up to date around each move.
+
+    gains[code][i] is the number of SOS that placing the letter code at empty cell i completes.
+    risks[code][i] is the number of lines through i that the letter would leave one move away
+    from an SOS, handing the opponent a scoring move. Occupied cells are always 0.
+
+    A move only changes the lines through its cell (at most 12, all within distance 2), so
+    update() costs O(1) per move and works the same way for placing and taking back a letter.
+    """
+    __slots__ = ('size', 'cells', 'lines', 'gains', 'risks', 'scoring')
+
+    def __init__(self, board):
+        self.size = board.size
+        self.cells = board.cells  # Shared with the board, never copied
+        index = get_sos_index(board.size)
+        # Every line through a cell as (end, middle, end): the cell as an S end, then as the middle
+        self.lines = tuple(
+            tuple((cell, middle, far) for middle, far, _ in index.s_lines[cell]) +
+            tuple((first, cell, last) for first, last, _ in index.o_lines[cell])
+            for cell in range(board.size * board.size))
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute the whole map from the board."""
+        count = self.size * self.size
+        self.gains = (None, [0] * count, [0] * count)  # Indexed by letter code
+        self.risks = (None, [0] * count, [0] * count)
+        self.scoring = set()  # (index, code) of every move with a positive gain
+        index = get_sos_index(self.size)
+        for middle in range(count):
+            for first, last, _ in index.o_lines[middle]:  # Each line has one middle, so it is counted once
+                self.line_delta(first, middle, last, 1)
+
+    def add_gain(self, cell, code, sign):
+        gains = self.gains[code]
+        gains[cell] += sign
+        if sign > 0:
+            if gains[cell] == 1:
+                self.scoring.add((cell, code))
+        elif not gains[cell]:
+            self.scoring.discard((cell, code))
+
+    def line_delta(self, first, middle, last, sign):
+        """Add (sign 1) or remove (sign -1) what one line contributes to the map."""
+        cells = self.cells
+        x, y, z = cells[first], cells[middle], cells[last]
+        s_risks = self.risks[S]
+        if x == EMPTY:  # S at the first end
+            if y == O:
+                if z == S:
+                    self.add_gain(first, S, sign)
+                elif z == EMPTY:
+                    s_risks[first] += sign  # Opens S at the last end
+            elif y == EMPTY and z == S:
+                s_risks[first] += sign  # Opens O in the middle
+        if z == EMPTY:  # S at the last end
+            if y == O:
+                if x == S:
+                    self.add_gain(last, S, sign)
+                elif x == EMPTY:
+                    s_risks[last] += sign
+            elif y == EMPTY and x == S:
+                s_risks[last] += sign
+        if y == EMPTY:  # O in the middle
+            if x == S and z == S:
+                self.add_gain(middle, O, sign)
+            elif (x == S and z == EMPTY) or (x == EMPTY and z == S):
+                self.risks[O][middle] += sign  # Opens S at the empty end
+
+    def update(self, cell, old_code):
+        """Apply a change of one cell. Call after the board changed, with the code it held before."""
+        cells = self.cells
+        new_code = cells[cell]
+        lines = self.lines[cell]
+        cells[cell] = old_code
+        for first, middle, last in lines:
+            self.line_delta(first, middle, last, -1)
+        cells[cell] = new_code
+        for first, middle, last in lines:
+            self.line_delta(first, middle, last, 1)
+
+    def scoring_moves(self):
+        """Return every (index, code) that completes at least one SOS."""
+        return sorted(self.scoring)
+
+    def safe_moves(self):
+        """Return every (index, code) on an empty cell that hands the opponent no new SOS."""
+        risks = self.risks
+        return [(cell, code) for cell in range(self.size * self.size) if not self.cells[cell]
+                for code in (S, O) if not risks[code][cell]]
@@ -0,0 +1,276 @@
+"""Bot tournaments: round-robin or gauntlet matches across a process pool.
+
+    python -m src.tournament --engines random greedy alphabeta --sizes 3 4 5 --modes Simple General \
+        --games 4 --workers 4 --results tournament.jsonl
+
+Every finished game is appended to the results file as one JSON line. Running the same
+command again resumes: games already in the file are read back and not replayed.
+"""
+import argparse  # Command line parsing
+import json  # Results file
+import math  # Elo conversions
+import multiprocessing  # Process pool for parallel games
+import os  # CPU count and results file checks
+import random  # Per-game seeds
+import sys  # Progress output
+import time  # Game timing
+import zlib  # Stable per-game seeds
+from src.ai import AlphaBetaPlayer, GreedyPlayer, RandomPlayer  # Engines
+from src.game_logic import GameLogic  # Game rules
+from src.mcts import MCTSPlayer  # Engines
+
+ENGINES = {  # Name -> factory(seed, move_time)
+    'random': lambda seed, move_time: RandomPlayer(seed),
+    'greedy': lambda seed, move_time: GreedyPlayer(seed),
+    'alphabeta': lambda seed, move_time: AlphaBetaPlayer(time_limit=move_time),
+    'mcts': lambda seed, move_time: MCTSPlayer(time_limit=move_time, seed=seed),
+}
+Z_95 = 1.96  # Normal quantile of a 95% confidence interval
+
+
+def game_key(first_engine, second_engine, size, mode, number):
+    """Return the id of one scheduled game; the results file is keyed on it."""
+    return f"{first_engine}|{second_engine}|{size}|{mode}|{number}"
+
+
+def schedule(engines, sizes, modes, games, pairing='round-robin', seed=0, move_time=0.1):
+    """Return the list of games to play.
+
+    Each pair of engines plays games per size and mode. Colors alternate every game and the
+    starting color every two games, so a multiple of four games covers each combination equally.
+    The gauntlet pairs the first engine against each of the others.
+    """
+    if pairing == 'gauntlet':
+        pairs = [(engines[0], other) for other in engines[1:]]
+    else:
+        pairs = [(first, second) for number, first in enumerate(engines) for second in engines[number + 1:]]
+    specs = []
+    for size in sizes:
+        for mode in modes:
+            for first, second in pairs:
+                for number in range(games):
+                    key = game_key(first, second, size, mode, number)
+                    blue, red = (first, second) if number % 2 == 0 else (second, first)
+                    specs.append({
+                        'key': key, 'size': size, 'mode': mode, 'blue': blue, 'red': red,
+                        'first_player': 'Blue' if number // 2 % 2 == 0 else 'Red',
+                        'seed': zlib.crc32(key.encode()) ^ seed, 'move_time': move_time,
+                    })
+    return specs
+
+
+def play_match(spec):
+    """Play one scheduled game and return its result record."""
+    random.seed(spec['seed'])  # Engines that use the module random stay repeatable
+    game = GameLogic(spec['size'], spec['mode'], auto_reset=False, first_player=spec['first_player'])
+    players = {color: ENGINES[spec[color.lower()]](spec['seed'] + number, spec['move_time'])
+               for number, color in enumerate(('Blue', 'Red'))}
+    start = time.perf_counter()
+    try:
+        while True:
+            row, col, letter = players[game.current_turn].choose_move(game)
+            result, _ = game.place_letter(row, col, letter)
+            if result:
+                break
+    finally:
+        for player in players.values():
+            if hasattr(player, 'close'):
+                player.close()  # MCTS worker pools
+    return {
+        'key': spec['key'], 'size': spec['size'], 'mode': spec['mode'], 'blue': spec['blue'], 'red': spec['red'],
+        'first_player': spec['first_player'], 'result': result, 'scores': game.scores,
+        'moves': len(game.moves), 'time': time.perf_counter() - start,
+    }
+
+
+def engine_scores(record):
+    """Return {engine: score} of one game record (1 win, 0.5 draw, 0 loss)."""
+    if record['result'] == 'Draw':
+        return {record['blue']: 0.5, record['red']: 0.5}
+    winner = record['blue'] if record['result'] == 'Blue' else record['red']
+    loser = record['red'] if winner == record['blue'] else record['blue']
+    return {winner: 1.0, loser: 0.0}
+
+
+def score_to_elo(score):
+    """Return the Elo difference that gives an expected score."""
+    score = min(max(score, 1e-3), 1 - 1e-3)
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+class RatingTable:
+    """Elo ratings with 95% confidence intervals, updated one game at a time.
+
+    Ratings are the Bradley-Terry maximum likelihood fit of all games so far (a draw counts
+    as half a win each way, plus one virtual draw per pair so ratings stay finite). Each add()
+    runs a few minorization-maximization steps from the previous fit, which converges in a
+    handful of steps as games arrive. Intervals come from each engine's running score mean
+    and variance (Welford), converted to Elo around its rating.
+    """
+
+    def __init__(self, steps=10):
+        self.steps = steps  # Fit iterations per added game
+        self.pair_games = {}  # (engine, engine) sorted -> games played
+        self.points = {}  # Engine -> points scored
+        self.strength = {}  # Engine -> Bradley-Terry strength (10 ** (elo / 400))
+        self.count = {}  # Engine -> games played
+        self.mean = {}  # Engine -> mean score per game
+        self.m2 = {}  # Engine -> sum of squared score deviations
+        self.results = {}  # Engine -> [wins, draws, losses]
+
+    def add(self, record):
+        """Count one game record and refresh the ratings."""
+        scores = engine_scores(record)
+        first, second = sorted(scores)
+        pair = (first, second)
+        if pair not in self.pair_games:
+            self.pair_games[pair] = 1  # Virtual draw
+            for engine in pair:
+                self.points[engine] = self.points.get(engine, 0.0) + 0.5
+                self.strength.setdefault(engine, 1.0)
+        self.pair_games[pair] += 1
+        for engine, score in scores.items():
+            self.points[engine] += score
+            count = self.count[engine] = self.count.get(engine, 0) + 1
+            mean = self.mean.get(engine, 0.0)
+            delta = score - mean
+            mean += delta / count
+            self.mean[engine] = mean
+            self.m2[engine] = self.m2.get(engine, 0.0) + delta * (score - mean)
+            self.results.setdefault(engine, [0, 0, 0])[0 if score == 1.0 else 1 if score == 0.5 else 2] += 1
+        for _ in range(self.steps):
+            self.fit_step()
+
+    def fit_step(self):
+        """One minorization-maximization step of the Bradley-Terry fit."""
+        strength = self.strength
+        denominators = dict.fromkeys(strength, 0.0)
+        for (first, second), games in self.pair_games.items():
+            share = games / (strength[first] + strength[second])
+            denominators[first] += share
+            denominators[second] += share
+        updated = {engine: self.points[engine] / denominators[engine] for engine in strength}
+        scale = math.exp(sum(math.log(value) for value in updated.values()) / len(updated))  # Mean Elo 0
+        self.strength = {engine: value / scale for engine, value in updated.items()}
+
+    def ratings(self):
+        """Return {engine: (elo, low, high, games, [wins, draws, losses])}, best first."""
+        table = {}
+        for engine, strength in self.strength.items():
+            elo = 400.0 * math.log10(strength)
+            count = self.count[engine]
+            mean = self.mean[engine]
+            error = Z_95 * math.sqrt(self.m2[engine] / (count - 1) / count) if count > 1 else 0.5
+            low = elo + score_to_elo(max(mean - error, 0.0)) - score_to_elo(mean)
+            high = elo + score_to_elo(min(mean + error, 1.0)) - score_to_elo(mean)
+            table[engine] = (elo, low, high, count, list(self.results[engine]))
+        return dict(sorted(table.items(), key=lambda item: -item[1][0]))
+
+
+def load_results(path):
+    """Return (records, bytes) of the complete lines in a results file.
+
+    A run that was killed while writing leaves a torn last line; it is not counted.
+    """
+    records = []
+    valid = 0
+    if not os.path.exists(path):
+        return records, valid
+    with open(path, 'rb') as file:
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+            valid += len(line)
+    return records, valid
+
+
+def run_tournament(specs, results_path, workers=1, ratings=None, progress=None):
+    """Play every scheduled game not yet in the results file. Returns (RatingTable, games played now).
+
+    progress, if given, is called with (record, ratings, finished, total) after every game.
+    """
+    ratings = ratings or RatingTable()
+    done = set()
+    records, valid = load_results(results_path)
+    if os.path.exists(results_path) and os.path.getsize(results_path) > valid:
+        os.truncate(results_path, valid)  # Drop a torn last line before appending
+    for record in records:
+        if record['key'] not in done:
+            done.add(record['key'])
+            ratings.add(record)
+    pending = [spec for spec in specs if spec['key'] not in done]
+    finished = len(specs) - len(pending)
+
+    with open(results_path, 'a', encoding='utf-8') as file:
+        if workers <= 1:
+            results = map(play_match, pending)  # Run in process, no pool start-up cost
+            pool = None
+        else:
+            pool = multiprocessing.Pool(workers)
+            results = pool.imap_unordered(play_match, pending)
+        played = 0
+        try:
+            for record in results:
+                file.write(json.dumps(record) + '\n')
+                file.flush()  # Each game is on disk as soon as it finishes
+                ratings.add(record)
+                played += 1
+                finished += 1
+                if progress:
+                    progress(record, ratings, finished, len(specs))
+        finally:
+            if pool:
+                pool.terminate()
+                pool.join()
+    return ratings, played
+
+
+def format_table(ratings):
+    """Return the rating table as printable lines."""
+    lines = [f"{'Engine':<12}{'Elo':>8}{'95% interval':>20}{'Games':>8}{'W-D-L':>14}"]
+    for engine, (elo, low, high, games, (wins, draws, losses)) in ratings.ratings().items():
+        lines.append(f"{engine:<12}{elo:>8.0f}{f'[{low:.0f}, {high:.0f}]':>20}{games:>8}"
+                     f"{f'{wins}-{draws}-{losses}':>14}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play a bot tournament and rate the engines.")
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES), default=['random', 'greedy'],
+                        help="engines to compare")
+    parser.add_argument('--sizes', nargs='+', type=int, default=[3, 4, 5, 6, 7, 8, 9, 10], help="board sizes")
+    parser.add_argument('--modes', nargs='+', choices=['Simple', 'General'], default=['Simple', 'General'],
+                        help="game modes")
+    parser.add_argument('--games', type=int, default=4, help="games per pair, size and mode")
+    parser.add_argument('--pairing', choices=['round-robin', 'gauntlet'], default='round-robin',
+                        help="round-robin, or the first engine against each of the others")
+    parser.add_argument('--move-time', type=float, default=0.1, help="seconds per move for search engines")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument('--seed', type=int, default=0, help="base random seed")
+    parser.add_argument('--results', default='tournament.jsonl', help="JSONL results file (resumed if it exists)")
+    args = parser.parse_args(argv)
+
+    if len(set(args.engines)) < 2:
+        parser.error("at least two different engines are needed")
+    if min(args.sizes) < 3:
+        parser.error("sizes must be at least 3")
+
+    specs = schedule(args.engines, args.sizes, args.modes, args.games, args.pairing, args.seed, args.move_time)
+
+    def progress(record, ratings, finished, total):
+        print(f"{finished}/{total} {record['blue']} vs {record['red']} "
+              f"{record['size']}x{record['size']} {record['mode']}: {record['result']}", file=sys.stderr)
+
+    ratings, played = run_tournament(specs, args.results, args.workers, progress=progress)
+    print(f"Played {played} games, {len(specs) - played} resumed from {args.results}")
+    for line in format_table(ratings):
+        print(line)
+    return ratings
+
+
+if __name__ == '__main__':
+    main()
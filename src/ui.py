@@ -1,12 +1,26 @@
+import struct  # Errors from damaged record files
 import tkinter as tk
 from tkinter import messagebox
 from src.game_logic import GameLogic
+from src.ai import AlphaBetaPlayer
+from src.canvas_board import CanvasBoard
+from src.engine_worker import EngineWorker
+from src.records import RecordReader, RecordWriter, Replay, record_from_game
+
+MAX_BOARD_SIZE = 50  # Largest board the canvas renderer is offered for
+RECORD_FILE = "sos_games.sosrec"  # Games saved when "Record Game" is checked
 
 class SOSGameUI:
     def __init__(self, root, game_logic):
         self.root = root  # Store the root window
         self.game_logic = game_logic  # Initialize game logic
-        self.buttons = []  # List to store grid buttons
+        self.board_view = None  # Canvas board, created with the UI
+        self.engine = EngineWorker(root)  # Runs computer moves and hints off the Tk thread
+        self.last_record = None  # Record of the last finished game, for Replay
+        self.replay = None  # Replay being shown, None while playing
+        self.replay_window = None  # Replay controls window
+        self.replay_after = None  # after id of the next animation step
+        self.replay_shown = None  # (replay, move count) drawn on the board, for incremental seeks
         self.create_ui()  # Create the UI components
 
     def create_ui(self):
@@ -38,6 +52,7 @@ class SOSGameUI:
         # Grid Frame
         self.grid_frame = tk.Frame(main_frame, bg="lightgray")
         self.grid_frame.pack(pady=10)
+        self.board_view = CanvasBoard(self.grid_frame, self.on_grid_click)  # One canvas for the whole board
 
         # Player Options Frame
         options_frame = tk.Frame(main_frame, bg="lightgray")
@@ -57,10 +72,14 @@ class SOSGameUI:
 
         # Control Buttons
         tk.Button(control_frame, text="Replay", command=self.replay_game).pack(side=tk.LEFT, padx=5)
+        self.hint_button = tk.Button(control_frame, text="Hint", command=self.show_hint)  # Disabled during a replay
+        self.hint_button.pack(side=tk.LEFT, padx=5)
         tk.Button(control_frame, text="New Game", command=self.start_game).pack(side=tk.LEFT, padx=5)
 
         # Current Turn Label
         self.turn_label = tk.Label(main_frame, text=f"Current turn: {self.game_logic.current_turn}", bg="lightgray")
+        self.engine_label = tk.Label(main_frame, text="", bg="lightgray")  # Computer progress and hints
+        self.engine_label.pack(side=tk.BOTTOM)
         self.turn_label.pack(side=tk.BOTTOM, pady=10)
 
         # Scoreboard
@@ -75,13 +94,20 @@ class SOSGameUI:
         # Player label
         tk.Label(player_frame, text=player_label, font=("Arial", 10, "bold"), bg="lightgray").grid(row=0, column=0, columnspan=3, sticky=tk.W)
 
+        # Player type: Human or Computer
+        player_type = tk.StringVar(value="Human")
+        tk.Radiobutton(player_frame, text="Human", variable=player_type, value="Human", bg="lightgray").grid(row=1, column=0, sticky=tk.W)
+        tk.Radiobutton(player_frame, text="Computer", variable=player_type, value="Computer", bg="lightgray").grid(row=1, column=1, columnspan=2, sticky=tk.W)
+
         # Player choice for 'S' or 'O'
         if color == "Blue":
+            self.blue_type = player_type  # Human or Computer for Blue
             self.blue_choice = tk.StringVar(value="S")  # Default choice for Blue
             tk.Label(player_frame, text="Choose:", bg="lightgray").grid(row=2, column=0, pady=5)
             tk.Radiobutton(player_frame, text="S", variable=self.blue_choice, value="S", bg="lightgray").grid(row=2, column=1)
             tk.Radiobutton(player_frame, text="O", variable=self.blue_choice, value="O", bg="lightgray").grid(row=2, column=2)
         else:
+            self.red_type = player_type  # Human or Computer for Red
             self.red_choice = tk.StringVar(value="S")  # Default choice for Red
             tk.Label(player_frame, text="Choose:", bg="lightgray").grid(row=2, column=0, pady=5)
             tk.Radiobutton(player_frame, text="S", variable=self.red_choice, value="S", bg="lightgray").grid(row=2, column=1)
@@ -89,18 +115,25 @@ class SOSGameUI:
 
     def start_game(self):
         # Start a new game based on the user input for size
+        self.close_replay(resume=False)  # Leave a replay first so live moves are not drawn over it
+        self.engine.cancel()  # Drop any search for the old game
+        self.engine_label.config(text="")
         try:
             size_input = self.size_entry.get()
             size = int(size_input)  # Convert to integer
 
             # Validate size
-            if size < 3 or size > 10:
-                raise ValueError("Size must be between 3 and 10.")
-
-            # Initialize game logic with selected mode and size
-            self.game_logic = GameLogic(size, self.mode_var.get())  
+            if size < 3 or size > MAX_BOARD_SIZE:
+                raise ValueError(f"Size must be between 3 and {MAX_BOARD_SIZE}.")
+
+            # Initialize game logic with selected mode and size; SOS are colored through the UI observer
+            self.game_logic = GameLogic(size, self.mode_var.get(), ui=self, auto_reset=False)
+            for color, player_type in (('Blue', self.blue_type), ('Red', self.red_type)):
+                if player_type.get() == "Computer":
+                    self.game_logic.set_player(color, AlphaBetaPlayer(time_limit=1.0))  # Computer opponent
             self.create_game_grid(size)  # Create the game grid
             self.update_turn_label()  # Update the turn label
+            self.schedule_computer_move()  # Let the computer open if it starts
 
         except ValueError as e:
             messagebox.showerror("Invalid Input", str(e))  # Show error message for invalid input
@@ -112,58 +145,78 @@ class SOSGameUI:
             self.start_game()  # Restart the game
 
     def create_game_grid(self, size):
-        # Create the grid based on the specified size
-        for widget in self.grid_frame.winfo_children():
-            widget.destroy()  # Clear the previous grid
-
-        self.buttons = []  # Reset button list
-        for r in range(size):
-            row = []
-            for c in range(size):
-                # Create a button for each cell in the grid
-                btn = tk.Button(self.grid_frame, text="", width=5, height=2, 
-                                font=("Arial", 12), command=lambda r=r, c=c: self.on_grid_click(r, c))
-                btn.grid(row=r, column=c, padx=5, pady=5)  # Place button in grid
-                row.append(btn)
-            self.buttons.append(row)  # Append row to buttons list
-        self.grid_frame.pack()  # Display the grid
+        # Show an empty board; the canvas reuses its cell items instead of rebuilding widgets
+        self.board_view.reset(size)
+        self.board_view.pack()  # Display the grid
 
     def on_grid_click(self, row, col):
         # Handle button click on the grid
+        if self.game_logic.is_computer_turn() or self.replay is not None:
+            return  # Wait for the computer to move, or ignore clicks during a replay
+        self.engine.cancel()  # A pending hint is out of date
+        self.engine_label.config(text="")
         current_letter = self.blue_choice.get() if self.game_logic.current_turn == 'Blue' else self.red_choice.get()  # Determine current player's letter
         winner, sos_line = self.game_logic.place_letter(row, col, current_letter)  # Place letter and check for winner
-
-        # Update the button text and disable it
-        self.buttons[row][col].config(text=current_letter, state=tk.DISABLED)
-
-        # Check for SOS and handle winner or draw logic
-        if sos_line:  # Only color squares if an SOS was formed
-            self.color_squares(sos_line)  # Color squares for the SOS
+        self.show_move(row, col, current_letter, winner, sos_line)
+
+    def schedule_computer_move(self):
+        # Start a background search if it is the computer's turn; the window stays responsive meanwhile
+        if self.board_view.size and self.game_logic.is_computer_turn():
+            self.engine_label.config(text="Computer is thinking...")
+            player = self.game_logic.players[self.game_logic.current_turn]
+            self.engine.start(player, self.game_logic, self.apply_computer_move, self.show_engine_progress)
+
+    def apply_computer_move(self, move):
+        # Play the move found by the background search
+        if not self.game_logic.is_computer_turn():
+            return
+        row, col, letter = move
+        self.engine_label.config(text="")
+        winner, sos_line = self.game_logic.place_letter(row, col, letter)
+        self.show_move(row, col, letter, winner, sos_line)
+
+    def show_engine_progress(self, info):
+        # Show the best move found so far by the running search
+        row, col, letter = info['move']
+        self.engine_label.config(text=f"Thinking... depth {info['depth']}, best {letter} at ({row}, {col})")
+
+    def show_hint(self):
+        # Search for a good move for the human player to move
+        if self.replay is not None or not self.board_view.size or self.game_logic.is_computer_turn() or self.game_logic.game_result():
+            return
+        self.engine_label.config(text="Looking for a hint...")
+        self.engine.start(AlphaBetaPlayer(time_limit=2.0), self.game_logic,
+                          lambda move: self.engine_label.config(text=f"Hint: {move[2]} at ({move[0]}, {move[1]})"),
+                          self.show_engine_progress)
+
+    def show_move(self, row, col, current_letter, winner, sos_line):
+        # Update the board after a move and handle the end of the game
+        # Draw the letter; only this cell is redrawn (SOS cells were marked by color_squares)
+        self.board_view.set_letter(row, col, current_letter)
 
         if winner:
+            self.save_game(winner)  # Keep the finished game for Replay (and on disk if recording)
+
+        # place_letter already reports a full board as a winner or 'Draw', so no second is_full() scan
+        if winner == 'Draw':
+            messagebox.showinfo("Game Over", "It's a draw!")  # Show draw message
+            self.start_game()  # Reset the game for a new round
+        elif winner:
             self.update_scoreboard()  # Update scoreboard
             messagebox.showinfo("Game Over", f"{winner} wins!")  # Show winner message
             self.start_game()  # Reset the game for a new round
-        elif self.game_logic.is_full():
-            messagebox.showinfo("Game Over", "It's a draw!")  # Show draw message
-            self.start_game()  # Reset the game for a new round
+        else:
+            self.schedule_computer_move()  # Computer replies if it is its turn
 
         self.update_turn_label()  # Update turn label after processing
         self.update_scoreboard()  # Update scoreboard after processing
 
 
     def color_squares(self, sos_line):
-        # Color the squares that formed the SOS
-        if sos_line and len(sos_line) == 6:  # Ensure sos_line has correct length
-            start_row, start_col, mid_row, mid_col, end_row, end_col = sos_line
-            player_color = "lightblue" if self.game_logic.current_turn == 'Blue' else "red"
-
-            # Change the color of the squares forming the SOS
-            for r, c in [(start_row, start_col), (mid_row, mid_col), (end_row, end_col)]:
-                button = self.buttons[r][c]
-                button.config(bg=player_color)  # Change button background color
-                current_letter = button["text"]
-                button.config(font=("Arial", 12, "bold"), text=current_letter)  # Make text bold
+        # Color the squares that formed each SOS and strike it through
+        # Called from the game's sos_formed event, before the turn passes to the other player
+        if sos_line:
+            self.board_view.mark_sos(sos_line, self.game_logic.current_turn)
 
 
     def update_turn_label(self):
@@ -175,9 +228,122 @@ class SOSGameUI:
         scores = self.game_logic.scores  # Get current scores
         self.scoreboard.config(text=f"Blue: {scores['Blue']}  Red: {scores['Red']}")  # Update scoreboard label
 
+    def save_game(self, winner):
+        # Remember the finished game and append it to the record file if recording is on
+        self.last_record = record_from_game(self.game_logic, winner)
+        if self.record_var.get():
+            with RecordWriter(RECORD_FILE) as writer:
+                writer.write(self.last_record)
+
     def replay_game(self):
-        # Placeholder for replay functionality
-        messagebox.showinfo("Replay", "Replay functionality is not implemented yet.")  # Inform that replay is not yet implemented
+        # Replay the current game, or the last finished one, with a slider to seek to any move
+        if self.game_logic.moves:
+            record = record_from_game(self.game_logic)
+        elif self.last_record is not None:
+            record = self.last_record
+        else:
+            try:
+                with RecordReader(RECORD_FILE) as reader:
+                    record = reader[-1] if len(reader) else None
+            except (OSError, ValueError, struct.error):  # Missing or damaged record file
+                record = None
+        if record is None or not record.moves:
+            messagebox.showinfo("Replay", "There is no game to replay yet.")
+            return
+
+        self.engine.cancel()
+        self.close_replay(resume=False)  # Replaced by the new replay; no computer turn in between
+        self.replay = Replay(record)
+        self.engine_label.config(text="")
+        self.hint_button.config(state=tk.DISABLED)  # Hints are for the live game
+        self.replay_window = tk.Toplevel(self.root)
+        self.replay_window.title("Replay")
+        self.replay_window.protocol("WM_DELETE_WINDOW", self.close_replay)
+
+        self.replay_move = tk.IntVar(value=len(self.replay))
+        tk.Scale(self.replay_window, from_=0, to=len(self.replay), orient=tk.HORIZONTAL, length=300,
+                 label="Move", variable=self.replay_move, command=lambda value: self.show_replay_position(int(value))).pack()
+        self.replay_speed = tk.DoubleVar(value=4)
+        tk.Scale(self.replay_window, from_=1, to=60, orient=tk.HORIZONTAL, length=300,
+                 label="Moves per second", variable=self.replay_speed).pack()
+        buttons = tk.Frame(self.replay_window)
+        buttons.pack(pady=5)
+        tk.Button(buttons, text="Play", command=self.play_replay).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="Pause", command=self.pause_replay).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="Close", command=self.close_replay).pack(side=tk.LEFT, padx=5)
+        self.show_replay_position(len(self.replay))
+
+    def show_replay_position(self, move_count, replay=None):
+        # Draw the board after move_count moves. Only the moves between the position on screen and
+        # the new one are redrawn, so seeking and animation cost the change, not the whole board
+        replay = replay or self.replay
+        moves = replay.record.moves
+        board_view = self.board_view
+        shown_replay, shown = self.replay_shown or (None, 0)
+        if shown_replay is not replay or board_view.size != replay.record.size:
+            board_view.reset(replay.record.size)  # Another game: draw it from the empty board
+            shown = 0
+
+        if move_count >= shown:
+            for row, col, letter, _ in moves[shown:move_count]:
+                board_view.set_letter(row, col, letter)
+            for player, coordinates in replay.sos_between(shown, move_count):
+                board_view.mark_sos([coordinates], player)
+        else:
+            for row, col, _, _ in moves[move_count:shown]:
+                board_view.set_letter(row, col, '')
+            removed = replay.sos_between(move_count, shown)
+            board_view.unmark_sos(len(removed))
+            colors = {cell: None for _, coordinates in removed for cell in coordinates}
+            for player, coordinates in replay.sos_until(move_count):  # Later SOS color over earlier ones
+                for cell in coordinates:
+                    if cell in colors:
+                        colors[cell] = player
+            for (row, col), player in colors.items():
+                board_view.color_cell(row, col, player)
+        self.replay_shown = (replay, move_count)
+
+        scores = replay.scores_at(move_count)
+        self.scoreboard.config(text=f"Blue: {scores['Blue']}  Red: {scores['Red']}")
+        self.turn_label.config(text=f"Replay: move {move_count} of {len(replay)}")
+
+    def play_replay(self):
+        # Animate the replay from the current move at the chosen speed
+        self.pause_replay()
+        if self.replay_move.get() >= len(self.replay):
+            self.replay_move.set(0)
+        self.step_replay()
+
+    def step_replay(self):
+        move_count = self.replay_move.get() + 1
+        self.replay_move.set(move_count)
+        self.show_replay_position(move_count)
+        if move_count < len(self.replay):
+            self.replay_after = self.root.after(int(1000 / self.replay_speed.get()), self.step_replay)
+        else:
+            self.replay_after = None
+
+    def pause_replay(self):
+        if self.replay_after is not None:
+            self.root.after_cancel(self.replay_after)
+            self.replay_after = None
+
+    def close_replay(self, resume=True):
+        # Leave the replay and show the current game again; resume=False when a new game replaces it
+        if self.replay is None:
+            return
+        self.pause_replay()
+        self.replay_window.destroy()
+        self.replay = self.replay_window = None
+        self.hint_button.config(state=tk.NORMAL)
+        if not resume:
+            return
+        current = Replay(record_from_game(self.game_logic))
+        self.show_replay_position(len(current), current)  # Redraw the game in progress
+        self.replay_shown = None  # Live moves are drawn from here on
+        self.update_turn_label()
+        self.update_scoreboard()
+        self.schedule_computer_move()  # Resume a computer turn cancelled by the replay
 
 if __name__ == "__main__":
     root = tk.Tk()  # Create the main application window
@@ -0,0 +1,23 @@
+"""Shared helpers for the tests."""
+
+
+def exact_value(game):
+    """Exact value for the side to move by plain minimax (small endgames only).
+
+    In General mode this is the future score difference; in Simple mode a winning move is worth 1.
+    """
+    if game.is_full():
+        return 0
+    best = None
+    for row in range(game.size):
+        for col in range(game.size):
+            if game.board[row][col] == '':
+                for letter in 'SO':
+                    gained = game.make_move(row, col, letter)
+                    if game.mode == 'Simple' and gained:
+                        value = 1
+                    else:
+                        value = gained - exact_value(game)
+                    game.unmake_move()
+                    best = value if best is None else max(best, value)
+    return best
@@ -0,0 +1,117 @@
+import random
+import unittest
+from src.ai import AlphaBetaPlayer, GreedyPlayer, RandomPlayer, TranspositionTable, board_key
+from src.game_logic import GameLogic
+from test.helpers import exact_value
+
+def random_position(rng, size, mode, empties):
+    """Play random moves until only a few cells are empty, avoiding SOS in Simple mode."""
+    game = GameLogic(size, mode, auto_reset=False)
+    cells = [(r, c) for r in range(size) for c in range(size)]
+    rng.shuffle(cells)
+    for row, col in cells[:size * size - empties]:
+        for letter in rng.sample('SO', 2):
+            if game.make_move(row, col, letter) == 0 or mode == 'General':
+                break
+            game.unmake_move()
+        else:
+            return None
+    return game
+
+class TestAlphaBetaPlayer(unittest.TestCase):
+    """Test cases for the alpha-beta computer player."""
+
+    def test_takes_winning_move_in_simple_mode(self):
+        """Test that the player completes an open SOS in Simple mode."""
+        game = GameLogic(5, 'Simple')
+        game.make_move(2, 0, 'S')
+        game.make_move(2, 1, 'O')
+        self.assertEqual(AlphaBetaPlayer(time_limit=0.5).choose_move(game), (2, 2, 'S'))
+
+    def test_matches_minimax_in_general_mode(self):
+        """Test that the searched value equals plain minimax on small endgames."""
+        rng = random.Random(5)
+        for _ in range(10):
+            game = random_position(rng, 4, 'General', 5)
+            player = AlphaBetaPlayer(time_limit=10)
+            row, col, letter = player.choose_move(game)
+            self.assertEqual(player.last_stats['value'], exact_value(game))
+            gained = game.make_move(row, col, letter)
+            self.assertEqual(gained - exact_value(game), player.last_stats['value'])
+
+    def test_always_returns_legal_move(self):
+        """Test that a tiny time budget still gives a legal move on a large board."""
+        game = GameLogic(10, 'General')
+        player = AlphaBetaPlayer(time_limit=0.01)
+        row, col, letter = player.choose_move(game)
+        self.assertEqual(game.board[row][col], '')
+        self.assertIn(letter, 'SO')
+        self.assertLess(player.last_stats['time'], 0.5)
+        for key in ('nodes', 'nodes_per_second', 'tt_hit_rate', 'depth'):
+            self.assertIn(key, player.last_stats)
+
+    def test_plugs_into_game_logic(self):
+        """Test a full game between the search player and a random player."""
+        game = GameLogic(4, 'General')
+        game.set_player('Blue', AlphaBetaPlayer(time_limit=0.05))
+        game.set_player('Red', RandomPlayer(seed=1))
+        winner = None
+        while not winner:
+            self.assertTrue(game.is_computer_turn())
+            _, (winner, _) = game.play_computer_move()
+        self.assertTrue(game.is_full())
+
+    def test_greedy_player_takes_scoring_move(self):
+        """Test that the greedy player completes an SOS when one is open and is legal otherwise."""
+        game = GameLogic(5, 'General', backend='list')
+        player = GreedyPlayer(seed=2)
+        row, col, letter = player.choose_move(game)
+        self.assertEqual(game.board[row][col], '')
+        game.board[2][1] = 'S'
+        game.board[2][3] = 'S'
+        self.assertEqual(player.choose_move(game), (2, 2, 'O'))
+
+    def test_large_board_stays_within_budget(self):
+        """Test that a search on a 50x50 board returns within its time budget."""
+        game = GameLogic(50, 'General')
+        player = AlphaBetaPlayer(time_limit=0.2)
+        player.choose_move(game)
+        self.assertLess(player.last_stats['time'], player.time_limit)
+
+    def test_table_is_cleared_for_another_mode(self):
+        """Test that table entries are kept for the same game mode and dropped when the mode changes."""
+        general = GameLogic(4, 'General', auto_reset=False)
+        simple = GameLogic(4, 'Simple', auto_reset=False)
+        for game in (general, simple):
+            game.make_move(0, 0, 'S')
+            game.make_move(3, 3, 'O')
+        player = AlphaBetaPlayer(time_limit=0.2, tt_bits=12)
+        player.choose_move(general)
+        player.choose_move(general)
+        generations = {entry[5] for entry in player.tt.slots if entry is not None}
+        self.assertEqual(len(generations), 2)  # Entries of the first search are still used
+        player.choose_move(simple)
+        generations = {entry[5] for entry in player.tt.slots if entry is not None}
+        self.assertEqual(generations, {player.tt.generation})
+
+    def test_transposition_table_replacement(self):
+        """Test that deeper entries survive shallower ones within a search but not across searches."""
+        table = TranspositionTable(size_bits=4)
+        table.store(5, 3, 10, 0, None)
+        table.store(5, 1, 20, 0, None)
+        self.assertEqual(table.probe(5)[:2], (3, 10))
+        table.new_search()
+        table.store(5, 1, 20, 0, None)
+        self.assertEqual(table.probe(5)[:2], (1, 20))
+        self.assertIsNone(table.probe(21))  # Same slot, different key
+
+    def test_board_key_tracks_side_to_move(self):
+        """Test that the hash changes with the side to move."""
+        game = GameLogic(3)
+        game.current_turn = 'Blue'
+        blue_key = board_key(game)
+        game.current_turn = 'Red'
+        self.assertNotEqual(blue_key, board_key(game))
+
+if __name__ == '__main__':
+    unittest.main()
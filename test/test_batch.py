@@ -0,0 +1,81 @@
+import unittest
+from src.board import LETTERS
+from src.game_logic import GameLogic
+
+try:
+    import numpy as np
+    from src import batch
+except ImportError:  # NumPy is only needed for batch evaluation
+    np = None
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1), (-1, 1), (1, -1)]
+
+def list_game(cells):
+    """Return a list-backed GameLogic holding a board from a batch."""
+    size = len(cells)
+    game = GameLogic(size, 'General', backend='list')
+    for row in range(size):
+        for col in range(size):
+            game.board[row][col] = LETTERS[cells[row][col]]
+    return game
+
+def scalar_triples(game):
+    """Return every SOS line of a board as a set of frozensets, using is_sos_in_direction."""
+    found = set()
+    for row in range(game.size):
+        for col in range(game.size):
+            for dr, dc in DIRECTIONS:
+                sos_found, coordinates = game.is_sos_in_direction(row, col, dr, dc)
+                if sos_found:
+                    found.add(frozenset(coordinates))
+    return found
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBatchEvaluation(unittest.TestCase):
+    """Test cases for vectorized SOS evaluation against the scalar rules."""
+
+    def test_counts_and_triples_match_scalar_check(self):
+        """Test that counts and SOS lines match is_sos_in_direction on random boards."""
+        for size in (3, 4, 7):
+            boards = batch.random_boards(60, size, fill=0.8, seed=size)
+            counts = batch.sos_counts(boards)
+            board_ids, cells = batch.sos_triples(boards)
+            for number, cells_of_board in enumerate(boards):
+                expected = scalar_triples(list_game(cells_of_board.tolist()))
+                found = {frozenset(map(tuple, line.tolist())) for line in cells[board_ids == number]}
+                self.assertEqual(found, expected)
+                self.assertEqual(counts[number], len(expected))
+
+    def test_scoring_moves_match_scalar_check(self):
+        """Test that scoring gains equal the SOS lines check_general_sos finds for each move."""
+        boards = batch.random_boards(25, 6, fill=0.6, seed=1)
+        gains = batch.scoring_gains(boards)
+        masks = batch.scoring_moves(boards)
+        for number, cells_of_board in enumerate(boards):
+            game = list_game(cells_of_board.tolist())
+            for row in range(6):
+                for col in range(6):
+                    for letter_axis, letter in enumerate('SO'):
+                        expected = 0
+                        if game.board[row][col] == '':
+                            game.board[row][col] = letter
+                            expected = len(game.check_general_sos(row, col, letter) or [])
+                            game.board[row][col] = ''
+                        self.assertEqual(gains[number, letter_axis, row, col], expected)
+                        self.assertEqual(masks[number, letter_axis, row, col], expected > 0)
+
+    def test_stack_boards_from_games(self):
+        """Test stacking array-backed and list-backed games."""
+        array_game = GameLogic(4, 'General')
+        list_backed = GameLogic(4, 'General', backend='list')
+        for game in (array_game, list_backed):
+            game.make_move(1, 0, 'S')
+            game.make_move(1, 1, 'O')
+            game.make_move(1, 2, 'S')
+        boards = batch.stack_boards([array_game, list_backed])
+        self.assertEqual(boards.shape, (2, 4, 4))
+        self.assertEqual(list(batch.sos_counts(boards)), [1, 1])
+        self.assertRaises(ValueError, batch.stack_boards, [GameLogic(3), GameLogic(4)])
+
+if __name__ == '__main__':
+    unittest.main()
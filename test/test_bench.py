@@ -0,0 +1,64 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from src.bench import BENCHMARKS, DEFAULT_THRESHOLD, compare, load_baseline, main, run_benchmarks, save_baseline
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for the benchmark runner and regression check."""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "baseline.json")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_suite_covers_core_and_ui(self):
+        """Test that every requested operation is benchmarked at sizes 3 to 50."""
+        for operation in ('place_letter', 'check_general_sos', 'is_full', 'reset_game'):
+            self.assertIn(f"{operation}[3]", BENCHMARKS)
+            self.assertIn(f"{operation}[50]", BENCHMARKS)
+        self.assertIn("random_game[8 Simple]", BENCHMARKS)
+        self.assertIn("random_game[8 General]", BENCHMARKS)
+        self.assertIn("create_game_grid[50]", BENCHMARKS)
+
+    def test_baseline_round_trip(self):
+        """Test that results saved as a baseline load back unchanged."""
+        results = run_benchmarks(['is_full[3]', 'reset_game[5]'], quick=True)
+        self.assertEqual(sorted(results), ['is_full[3]', 'reset_game[5]'])
+        self.assertTrue(all(seconds > 0 for seconds in results.values()))
+        save_baseline(self.path, results)
+        self.assertEqual(load_baseline(self.path), results)
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        """Test the status of each result against the baseline."""
+        baseline = {'a': 1.0, 'b': 1.0, 'c': 1.0}
+        rows = compare(baseline, {'a': 1.2, 'b': 1.3, 'c': 0.7, 'd': 1.0}, threshold=0.25)
+        self.assertEqual([row[4] for row in rows], ['ok', 'regressed', 'improved', 'new'])
+
+    def test_main_fails_on_regression(self):
+        """Test that --compare exits with 1 against a much faster baseline and 0 against a slower one."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            save_baseline(self.path, {'is_full[3]': 1e-12})
+            self.assertEqual(main(['is_full[3]', '--quick', '--compare', self.path]), 1)
+            save_baseline(self.path, {'is_full[3]': 1.0})
+            self.assertEqual(main(['is_full[3]', '--quick', '--compare', self.path]), 0)
+        self.assertIn("regression", output.getvalue())
+
+@unittest.skipUnless(os.environ.get('SOS_BENCH_BASELINE'), "SOS_BENCH_BASELINE is not set")
+class TestBenchmarkBaseline(unittest.TestCase):
+    """Regression check against a baseline recorded on this machine (see src/bench.py)."""
+
+    def test_no_regression_against_baseline(self):
+        """Test that no benchmark is slower than the SOS_BENCH_BASELINE results beyond the threshold."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            status = main(['--compare', os.environ['SOS_BENCH_BASELINE'],
+                           '--threshold', os.environ.get('SOS_BENCH_THRESHOLD', str(DEFAULT_THRESHOLD))])
+        self.assertEqual(status, 0, output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import random
+import unittest
+from src.board import ArrayBoard, create_board
+from src.game_logic import GameLogic
+
+class TestArrayBoard(unittest.TestCase):
+    """Test cases for the flat array board backend."""
+
+    def test_place_tracks_empty_cells(self):
+        """Test that placing and removing letters keeps the empty count and set in sync."""
+        board = ArrayBoard(3)
+        self.assertTrue(board.place(1, 2, 'S'))
+        self.assertFalse(board.place(1, 2, 'O'))  # Cell already occupied
+        self.assertEqual(board.get(1, 2), 'S')
+        self.assertEqual(board.empty_count, 8)
+        self.assertNotIn(board.index(1, 2), board.empty_cells)
+
+        board.remove(1, 2)
+        self.assertEqual(board.empty_count, 9)
+        self.assertIn(board.index(1, 2), board.empty_cells)
+
+    def test_row_view_matches_list_board(self):
+        """Test that board[row][col] reads and writes like the list of lists board."""
+        board = ArrayBoard(4)
+        board[2][3] = 'O'
+        self.assertEqual(board[2][3], 'O')
+        self.assertEqual(board.empty_count, 15)
+        expected = create_board(4, 'list')
+        expected[2][3] = 'O'
+        self.assertEqual(board.to_lists(), expected)
+        with self.assertRaises(IndexError):
+            board[4][0]
+
+    def test_is_full(self):
+        """Test that the board reports full only once every cell is filled."""
+        board = ArrayBoard(3)
+        for row in range(3):
+            for col in range(3):
+                self.assertFalse(board.is_full())
+                board.place(row, col, 'S')
+        self.assertTrue(board.is_full())
+
+    def test_large_board(self):
+        """Test that boards far beyond the UI cap work."""
+        board = ArrayBoard(200)
+        board.place(199, 199, 'O')
+        self.assertEqual(board.empty_count, 200 * 200 - 1)
+        self.assertEqual(board.get(199, 199), 'O')
+
+    def test_backends_play_the_same_game(self):
+        """Test that the array and list backends give the same results for the same moves."""
+        rng = random.Random(7)
+        for mode in ('Simple', 'General'):
+            for _ in range(20):
+                size = rng.randint(3, 6)
+                array_game = GameLogic(size, mode, backend='array')
+                list_game = GameLogic(size, mode, backend='list')
+                list_game.current_turn = array_game.current_turn
+                cells = [(r, c) for r in range(size) for c in range(size)]
+                rng.shuffle(cells)
+                for row, col in cells:
+                    letter = rng.choice('SO')
+                    result = array_game.place_letter(row, col, letter)
+                    self.assertEqual(result, list_game.place_letter(row, col, letter))
+                    self.assertEqual(array_game.scores, list_game.scores)
+                    if result[0]:
+                        break
+                self.assertEqual(array_game.is_full(), list_game.is_full())
+
+    def test_off_board_moves_raise_on_both_backends(self):
+        """Test that moves outside the board raise IndexError instead of wrapping to another cell."""
+        for backend in ('array', 'list'):
+            with self.subTest(backend=backend):
+                game = GameLogic(3, 'General', backend=backend, auto_reset=False)
+                for row, col in ((0, 3), (3, 0), (-1, 0), (0, -1)):
+                    with self.assertRaises(IndexError):
+                        game.place_letter(row, col, 'S')
+                    with self.assertRaises(IndexError):
+                        game.make_move(row, col, 'O')
+                self.assertEqual(game.moves, [])
+                self.assertEqual(game.board, create_board(3, 'list'))
+                self.assertEqual(game.scores, {'Blue': 0, 'Red': 0})
+
+        board = ArrayBoard(3)
+        for row, col in ((0, 3), (-1, 0)):
+            for call in (board.index, board.get, board.remove, board.is_empty):
+                with self.assertRaises(IndexError):
+                    call(row, col)
+            with self.assertRaises(IndexError):
+                board.place(row, col, 'S')
+        self.assertEqual(board.empty_count, 9)
+
+if __name__ == '__main__':
+    unittest.main()
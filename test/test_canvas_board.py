@@ -0,0 +1,64 @@
+import tkinter as tk
+import unittest
+from src.canvas_board import CanvasBoard, PLAYER_COLORS
+
+def make_root():
+    """Return a hidden Tk root, or None when there is no display."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    return root
+
+class TestCanvasBoard(unittest.TestCase):
+    """Test cases for the canvas board renderer (skipped without a display)."""
+
+    def setUp(self):
+        self.root = make_root()
+        if self.root is None:
+            self.skipTest("no display available")
+        self.clicks = []
+        self.view = CanvasBoard(self.root, lambda row, col: self.clicks.append((row, col)))
+
+    def tearDown(self):
+        if self.root is not None:
+            self.root.destroy()
+
+    def test_items_are_reused_between_games(self):
+        """Test that a new game reuses the canvas items instead of creating new ones."""
+        self.view.reset(30)
+        items = len(self.view.canvas.find_all())
+        self.view.reset(10)
+        self.view.reset(30)
+        self.assertEqual(len(self.view.canvas.find_all()), items)
+        self.assertEqual(items, 2 * 30 * 30)
+
+    def test_only_dirty_cells_are_redrawn(self):
+        """Test that letters are queued and drawn on flush."""
+        self.view.reset(5)
+        self.view.set_letter(2, 3, 'S')
+        self.assertEqual(self.view.dirty, {13})
+        self.view.flush()
+        self.assertEqual(self.view.canvas.itemcget(self.view.texts[13], 'text'), 'S')
+        self.assertEqual(self.view.dirty, set())
+
+    def test_sos_line_and_colors(self):
+        """Test that an SOS colors its cells and draws one line."""
+        self.view.reset(3)
+        self.view.mark_sos([[(0, 0), (1, 1), (2, 2)]], 'Blue')
+        self.view.flush()
+        self.assertEqual(len(self.view.lines), 1)
+        self.assertEqual(self.view.canvas.itemcget(self.view.rects[4], 'fill'), PLAYER_COLORS['Blue'])
+        self.view.reset(3)
+        self.assertEqual(self.view.lines, [])
+
+    def test_click_maps_to_cell(self):
+        """Test that canvas points map to board cells."""
+        self.view.reset(4)
+        pixels = self.view.cell_pixels
+        self.assertEqual(self.view.cell_at(pixels * 2.5, pixels * 1.5), (1, 2))
+        self.assertIsNone(self.view.cell_at(pixels * 5, 0))
+
+if __name__ == '__main__':
+    unittest.main()
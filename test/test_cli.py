@@ -0,0 +1,71 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import unittest
+from src.cli import STARTUP_BUDGET, process
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_stream(text, **options):
+    """Process a move stream and return its JSON lines as dicts."""
+    out = io.StringIO()
+    process(io.StringIO(text), out, **options)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+def run_python(args, stdin=''):
+    """Run the interpreter in the repository root and return (seconds, completed process)."""
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable] + args, input=stdin, capture_output=True, text=True, cwd=ROOT)
+    return time.perf_counter() - start, completed
+
+class TestHeadlessCli(unittest.TestCase):
+    """Test cases for the headless move-stream command line."""
+
+    def test_games_are_replayed_and_scored(self):
+        """Test results of games split by blank lines and game headers."""
+        results = run_stream("# two games\n0 0 S\n0 1 O\n1 1 S\n0 2 S\n\ngame 4 simple\n0 0 s\n1 0 o\n2 0 S\n")
+        self.assertEqual(len(results), 2)
+        self.assertEqual((results[0]['moves'], results[0]['result'], results[0]['valid']), (4, None, True))
+        self.assertEqual(results[0]['scores'], {'Blue': 0, 'Red': 1})  # Blue moved first, so Red played (0, 2)
+        self.assertEqual((results[1]['size'], results[1]['mode'], results[1]['result']), (4, 'Simple', 'Blue'))
+        self.assertEqual(results[1]['line'], 7)
+
+    def test_invalid_moves_are_reported_with_their_line(self):
+        """Test that the first invalid move of a game is reported and the rest of it skipped."""
+        results = run_stream("0 0 S\n0 0 O\n1 1 S\n\n5 5 S\n\n0 0 X\n\n1 one S\n\ngame 2\n0 0 S\n", first_player='Red')
+        self.assertEqual([result['valid'] for result in results], [False] * 5)
+        self.assertEqual(results[0]['error'], "line 2: Cell (0, 0) is already occupied.")
+        self.assertEqual(results[0]['moves'], 1)
+        self.assertIn("off the board", results[1]['error'])
+        self.assertIn("S or O", results[2]['error'])
+        self.assertIn("integers", results[3]['error'])
+        self.assertIn("between 3", results[4]['error'])
+
+    def test_moves_after_the_end_and_trace(self):
+        """Test a Simple game that goes on after its winning move, with per-move lines."""
+        lines = run_stream("0 0 S\n0 1 O\n0 2 S\n1 1 S\n", mode='Simple', trace=True)
+        self.assertEqual([line.get('move') for line in lines], [1, 2, 3, None])
+        self.assertEqual(lines[2]['sos'], 1)
+        self.assertEqual(lines[-1]['error'], "line 4: move after the game ended")
+        self.assertEqual(lines[-1]['result'], 'Blue')
+
+    def test_main_runs_headless_within_startup_budget(self):
+        """Test that main.py with arguments never imports tkinter and starts within the budget."""
+        probe = ("import sys, runpy; sys.argv = ['main.py', '--size', '3']; "
+                 "sys.stdin = __import__('io').StringIO('0 0 S\\n'); "
+                 "code = runpy.run_path('main.py')['main'](); print('tkinter' in sys.modules, code)")
+        _, completed = run_python(['-c', probe])
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        result, imported = completed.stdout.splitlines()
+        self.assertEqual(json.loads(result)['moves'], 1)
+        self.assertEqual(imported, "False 0")
+
+        bare = min(run_python(['-c', 'pass'])[0] for _ in range(3))
+        headless = min(run_python(['main.py', '--size', '3'])[0] for _ in range(3))
+        self.assertLess(headless - bare, STARTUP_BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import threading
+import time
+import unittest
+from src.ai import AlphaBetaPlayer
+from src.engine_worker import EngineWorker
+from src.game_logic import GameLogic
+
+class FakeRoot:
+    """Stand-in for the Tk root that runs after() callbacks on demand."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+        return len(self.pending)
+
+    def run_until(self, condition, timeout=10):
+        """Run scheduled callbacks until condition() holds or the timeout passes."""
+        end = time.perf_counter() + timeout
+        while not condition() and time.perf_counter() < end:
+            if self.pending:
+                self.pending.pop(0)()
+            time.sleep(0.001)
+
+class CountingPlayer(AlphaBetaPlayer):
+    """Alpha-beta player that records how many of its searches ran at the same time."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.most_running = 0
+
+    def choose_move(self, game):
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        try:
+            return super().choose_move(game)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+class TestEngineWorker(unittest.TestCase):
+    """Test cases for the background engine worker."""
+
+    def test_result_and_progress_are_delivered(self):
+        """Test that a search reports progress and its move through the poll callback."""
+        root = FakeRoot()
+        worker = EngineWorker(root)
+        game = GameLogic(5, 'General')
+        moves, progress = [], []
+        worker.start(AlphaBetaPlayer(time_limit=0.3), game, moves.append, progress.append)
+        self.assertTrue(worker.busy)
+        root.run_until(lambda: moves)
+        self.assertEqual(len(moves), 1)
+        row, col, letter = moves[0]
+        self.assertEqual(game.board[row][col], '')
+        self.assertTrue(progress)
+        self.assertFalse(worker.busy)
+        self.assertEqual(game.moves, [])  # The live game was not touched
+
+    def test_cancel_stops_search_and_drops_result(self):
+        """Test that cancel ends the search early and its move is never delivered."""
+        root = FakeRoot()
+        worker = EngineWorker(root)
+        player = AlphaBetaPlayer(time_limit=30)
+        moves = []
+        worker.start(player, GameLogic(10, 'General'), moves.append)
+        time.sleep(0.1)
+        start = time.perf_counter()
+        worker.cancel()
+        self.assertFalse(worker.busy)
+        while player.stop_event.is_set() and not player.last_stats and time.perf_counter() - start < 5:
+            time.sleep(0.01)
+        self.assertLess(time.perf_counter() - start, 5)  # Search stopped well before its 30s budget
+        root.run_until(lambda: False, timeout=0.2)
+        self.assertEqual(moves, [])
+
+    def test_restart_with_same_player_never_overlaps(self):
+        """Test that restarting a search with the same player waits for the old search to stop."""
+        root = FakeRoot()
+        worker = EngineWorker(root)
+        player = CountingPlayer(time_limit=30)
+        game = GameLogic(10, 'General')
+        first_event = None
+        for _ in range(5):
+            worker.start(player, game, lambda move: None)
+            first_event = first_event or player.stop_event
+            time.sleep(0.02)
+        self.assertTrue(first_event.is_set())
+        self.assertIsNot(player.stop_event, first_event)  # Each search has its own cancel token
+        moves = []
+        worker.start(CountingPlayer(time_limit=0.1), game, moves.append)
+        root.run_until(lambda: moves)
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(player.most_running, 1)
+        self.assertEqual(player.running, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from src.events import GameObserver, MetricsCollector
+from src.game_logic import GameLogic
+
+class RecordingObserver(GameObserver):
+    """Observer that records every event name it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def game_started(self, game, starting_player):
+        self.events.append(('game_started', starting_player))
+
+    def move_placed(self, game, row, col, letter, player, sos_list, detect_time):
+        self.events.append(('move_placed', row, col, letter, player))
+
+    def move_rejected(self, game, row, col, letter, player):
+        self.events.append(('move_rejected', row, col))
+
+    def sos_formed(self, game, player, sos_list):
+        self.events.append(('sos_formed', player, len(sos_list)))
+
+    def turn_changed(self, game, player):
+        self.events.append(('turn_changed', player))
+
+    def game_over(self, game, winner):
+        self.events.append(('game_over', winner))
+
+def play_top_row(game):
+    """Form an SOS along the top row of a 3x3 board."""
+    first = game.current_turn
+    game.place_letter(0, 0, 'S')
+    game.place_letter(0, 1, 'O')
+    return first, game.place_letter(0, 2, 'S')
+
+class TestGameEvents(unittest.TestCase):
+    """Test cases for the GameLogic observer interface."""
+
+    def test_silent_by_default(self):
+        """Test that GameLogic prints nothing without a listener."""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            game = GameLogic(3, 'General')
+            play_top_row(game)
+        self.assertEqual(out.getvalue(), "")
+
+    def test_verbose_prints_trace(self):
+        """Test that verbose=True prints the move trace."""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            game = GameLogic(3, 'General', verbose=True)
+            play_top_row(game)
+        self.assertIn("Placed S at (0, 2)", out.getvalue())
+        self.assertIn("formed SOS", out.getvalue())
+
+    def test_simple_mode_event_order(self):
+        """Test the events sent for a Simple game won on the third move."""
+        observer = RecordingObserver()
+        game = GameLogic(3, 'Simple')
+        game.add_observer(observer)
+        first, (winner, sos_list) = play_top_row(game)
+        second = 'Red' if first == 'Blue' else 'Blue'
+        self.assertEqual(winner, first)
+        self.assertEqual(observer.events[:6], [
+            ('move_placed', 0, 0, 'S', first), ('turn_changed', second),
+            ('move_placed', 0, 1, 'O', second), ('turn_changed', first),
+            ('move_placed', 0, 2, 'S', first), ('sos_formed', first, 1),
+        ])
+        self.assertEqual(observer.events[6], ('game_over', first))
+        self.assertEqual(observer.events[7][0], 'game_started')  # Simple mode resets after a win
+
+    def test_rejected_move(self):
+        """Test that placing on an occupied cell sends move_rejected."""
+        observer = RecordingObserver()
+        game = GameLogic(3, 'General', observers=[observer])
+        game.place_letter(1, 1, 'S')
+        game.place_letter(1, 1, 'O')
+        self.assertEqual(observer.events[-1], ('move_rejected', 1, 1))
+
+    def test_metrics_collector(self):
+        """Test that the metrics collector counts moves, SOS and games and dumps JSON."""
+        metrics = MetricsCollector()
+        game = GameLogic(3, 'General', observers=[metrics])
+        letters = ['S', 'O', 'S', 'O', 'O', 'O', 'S', 'O', 'S']
+        for index, letter in enumerate(letters):
+            winner, _ = game.place_letter(index // 3, index % 3, letter)
+        self.assertIsNotNone(winner)
+        self.assertEqual(metrics.moves, 9)
+        self.assertEqual(metrics.games, 1)
+        self.assertEqual(metrics.sos_per_game, [game.scores['Blue'] + game.scores['Red']])
+        self.assertEqual(sum(metrics.latency_histogram().values()), 9)
+
+        out = io.StringIO()
+        metrics.dump_json(out)
+        data = json.loads(out.getvalue())
+        self.assertEqual(data['moves'], 9)
+        self.assertGreater(data['moves_per_second'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
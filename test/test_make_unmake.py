@@ -0,0 +1,117 @@
+import random
+import unittest
+from src.game_logic import GameLogic
+
+def random_cells(rng, size):
+    """Return every cell of a board in random order."""
+    cells = [(r, c) for r in range(size) for c in range(size)]
+    rng.shuffle(cells)
+    return cells
+
+class TestMakeUnmake(unittest.TestCase):
+    """Test cases for make_move/unmake_move and undo/redo."""
+
+    def test_unmake_restores_every_position(self):
+        """Test that unmaking moves one by one restores each earlier board, score and turn."""
+        rng = random.Random(11)
+        for backend in ('array', 'list'):
+            for mode in ('Simple', 'General'):
+                game = GameLogic(6, mode, backend=backend)
+                snapshots = []
+                for row, col in random_cells(rng, 6):
+                    snapshots.append(([list(r) for r in game.board], dict(game.scores), game.current_turn))
+                    game.make_move(row, col, rng.choice('SO'))
+                self.assertTrue(game.is_full())
+                while snapshots:
+                    game.unmake_move()
+                    board, scores, turn = snapshots.pop()
+                    self.assertEqual([list(r) for r in game.board], board)
+                    self.assertEqual(game.scores, scores)
+                    self.assertEqual(game.current_turn, turn)
+                self.assertEqual(game.moves, [])
+
+    def test_make_move_scores_like_place_letter(self):
+        """Test that make_move scores the same points as place_letter in General mode."""
+        rng = random.Random(3)
+        for _ in range(20):
+            fast = GameLogic(5, 'General')
+            slow = GameLogic(5, 'General', backend='list')
+            slow.current_turn = fast.current_turn
+            for row, col in random_cells(rng, 5):
+                letter = rng.choice('SO')
+                fast.make_move(row, col, letter)
+                slow.place_letter(row, col, letter)
+                self.assertEqual(fast.scores, slow.scores)
+            self.assertEqual(fast.game_result(), slow.check_winner_by_score() or 'Draw')
+
+    def test_make_move_rejects_occupied_cell(self):
+        """Test that make_move raises on an occupied cell."""
+        game = GameLogic(3)
+        game.make_move(0, 0, 'S')
+        with self.assertRaises(ValueError):
+            game.make_move(0, 0, 'O')
+
+    def test_undo_redo(self):
+        """Test that redo plays undone moves again and a new move clears the redo list."""
+        game = GameLogic(3, 'General')
+        first = game.current_turn
+        game.place_letter(0, 0, 'S')
+        game.place_letter(0, 1, 'O')
+        game.place_letter(0, 2, 'S')
+        self.assertEqual(game.scores[first], 1)
+
+        self.assertEqual(game.undo(), (0, 2, 'S', first))
+        self.assertEqual(game.scores[first], 0)
+        self.assertEqual(game.current_turn, first)
+        self.assertEqual(game.redo(), 1)
+        self.assertEqual(game.scores[first], 1)
+
+        game.undo()
+        game.place_letter(2, 2, 'O')
+        self.assertIsNone(game.redo())
+
+    def test_make_move_clears_redo(self):
+        """Test undo, make_move, redo: the undone move is dropped, on another cell or the same one."""
+        for row, col in ((2, 2), (0, 1)):
+            game = GameLogic(3, 'General', first_player='Blue')
+            game.make_move(0, 0, 'S')
+            game.make_move(0, 1, 'O')
+            game.undo()
+            game.make_move(row, col, 'S')
+            self.assertIsNone(game.redo())
+            self.assertEqual(game.moves, [(0, 0, 'S', 'Blue'), (row, col, 'S', 'Red')])
+            self.assertEqual(game.current_turn, 'Blue')
+
+    def test_redo_keeps_state_when_cell_is_taken(self):
+        """Test that several moves can be redone, and that a failed redo changes nothing."""
+        game = GameLogic(3, 'General', first_player='Blue')
+        for col in range(3):
+            game.make_move(0, col, 'S')
+        game.undo()
+        game.undo()
+        self.assertEqual(game.redo(), 0)
+        self.assertEqual(game.redo(), 0)
+        self.assertEqual([move[3] for move in game.moves], ['Blue', 'Red', 'Blue'])
+
+        game.undo()
+        game.board[0][2] = 'O'  # Written around the game logic
+        with self.assertRaises(ValueError):
+            game.redo()
+        self.assertEqual(game.current_turn, 'Blue')
+        self.assertEqual(game.redo_moves, [(0, 2, 'S', 'Blue')])
+
+    def test_simple_mode_can_keep_history(self):
+        """Test that auto_reset=False keeps the finished Simple game."""
+        game = GameLogic(3, 'Simple', auto_reset=False)
+        first = game.current_turn
+        game.place_letter(0, 0, 'S')
+        game.place_letter(0, 1, 'O')
+        winner, _ = game.place_letter(0, 2, 'S')
+        self.assertEqual(winner, first)
+        self.assertEqual(len(game.moves), 3)
+        self.assertEqual(game.game_result(), first)
+        game.unmake_move()
+        self.assertIsNone(game.game_result())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import threading
+import time
+import unittest
+from src.game_logic import GameLogic
+from src.mcts import MCTSPlayer, game_state, restore_game
+
+class TestMCTSPlayer(unittest.TestCase):
+    """Test cases for the Monte Carlo Tree Search player."""
+
+    def test_takes_winning_move_in_simple_mode(self):
+        """Test that the player completes an open SOS in Simple mode."""
+        game = GameLogic(4, 'Simple')
+        game.make_move(0, 0, 'S')
+        game.make_move(3, 3, 'O')
+        game.make_move(0, 1, 'O')
+        player = MCTSPlayer(playouts=3000, time_limit=5, seed=1)
+        self.assertEqual(player.choose_move(game), (0, 2, 'S'))
+
+    def test_playout_budget_and_stats(self):
+        """Test that the playout budget is respected and stats are reported."""
+        game = GameLogic(5, 'General')
+        player = MCTSPlayer(playouts=200, time_limit=10, seed=2)
+        row, col, letter = player.choose_move(game)
+        self.assertEqual(game.board[row][col], '')
+        self.assertEqual(player.last_stats['playouts'], 200)
+        self.assertGreater(player.last_stats['playouts_per_second'], 0)
+
+    def test_time_budget(self):
+        """Test that the wall-clock budget stops the search."""
+        game = GameLogic(10, 'General')
+        player = MCTSPlayer(playouts=10 ** 9, time_limit=0.1, seed=3)
+        player.choose_move(game)
+        self.assertLess(player.last_stats['time'], 0.5)
+
+    def test_root_parallel(self):
+        """Test that root-parallel search merges the workers' playouts."""
+        game = GameLogic(4, 'General')
+        player = MCTSPlayer(playouts=400, time_limit=10, workers=2, seed=4)
+        try:
+            row, col, letter = player.choose_move(game)
+        finally:
+            player.close()
+        self.assertEqual(game.board[row][col], '')
+        self.assertEqual(player.last_stats['playouts'], 400)
+        self.assertEqual(player.last_stats['workers'], 2)
+
+    def test_root_parallel_stops_on_event(self):
+        """Test that setting stop_event ends a root-parallel search long before its budget."""
+        game = GameLogic(6, 'General')
+        player = MCTSPlayer(playouts=10 ** 9, time_limit=30, workers=2, seed=5)
+        player.stop_event = threading.Event()
+        timer = threading.Timer(0.3, player.stop_event.set)
+        try:
+            start = time.perf_counter()
+            timer.start()
+            row, col, letter = player.choose_move(game)
+            elapsed = time.perf_counter() - start
+        finally:
+            timer.cancel()
+            player.close()
+        self.assertLess(elapsed, 5)
+        self.assertEqual(game.board[row][col], '')
+        self.assertGreater(player.last_stats['playouts'], 0)
+
+    def test_state_round_trip(self):
+        """Test that a game snapshot rebuilds the same position."""
+        game = GameLogic(4, 'General')
+        game.make_move(1, 1, 'S')
+        game.make_move(2, 2, 'O')
+        copy = restore_game(game_state(game))
+        self.assertEqual(copy.board.to_lists(), game.board.to_lists())
+        self.assertEqual(copy.current_turn, game.current_turn)
+        self.assertEqual(copy.scores, game.scores)
+
+if __name__ == '__main__':
+    unittest.main()
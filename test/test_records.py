@@ -0,0 +1,124 @@
+import os
+import random
+import tempfile
+import unittest
+from src.game_logic import GameLogic
+from src.records import INDEX_HEADER, RecordReader, RecordWriter, Replay, record_from_game
+
+def random_game(rng, size, mode):
+    """Play a random game to the end and return (game, result)."""
+    game = GameLogic(size, mode, auto_reset=False)
+    cells = [(r, c) for r in range(size) for c in range(size)]
+    rng.shuffle(cells)
+    for row, col in cells:
+        winner, _ = game.place_letter(row, col, rng.choice('SO'))
+        if winner:
+            return game, winner
+    return game, None
+
+class TestGameRecords(unittest.TestCase):
+    """Test cases for the binary game record format and replay."""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "games.sosrec")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def write_games(self, count, buffer_size=1 << 20):
+        rng = random.Random(count)
+        records = []
+        with RecordWriter(self.path, buffer_size=buffer_size) as writer:
+            for number in range(count):
+                game, result = random_game(rng, rng.randint(3, 12), rng.choice(['Simple', 'General']))
+                records.append(record_from_game(game, result))
+                writer.write(records[-1])
+        return records
+
+    def test_round_trip_with_random_access(self):
+        """Test that every game reads back unchanged, in any order."""
+        records = self.write_games(200, buffer_size=256)  # Small buffer: several bulk writes
+        with RecordReader(self.path) as reader:
+            self.assertEqual(len(reader), 200)
+            for number in random.Random(1).sample(range(200), 50):
+                self.assertEqual(reader[number], records[number])
+            self.assertEqual(list(reader), records)
+            self.assertEqual(reader[-1], records[-1])
+
+    def test_append_and_read_without_index(self):
+        """Test appending to an existing file and reading it when the index file is missing."""
+        records = self.write_games(5) + self.write_games(7)
+        os.remove(self.path + '.idx')
+        with RecordReader(self.path) as reader:
+            self.assertEqual(list(reader), records)
+
+    def test_missing_index_is_rebuilt_before_appending(self):
+        """Test that appending after the index file was lost keeps every game visible."""
+        records = self.write_games(5)
+        os.remove(self.path + '.idx')
+        records += self.write_games(7)
+        with RecordReader(self.path) as reader:
+            self.assertIsNotNone(reader.index)  # The writer rebuilt a complete index
+            self.assertEqual(list(reader), records)
+
+    def test_index_of_a_deleted_data_file_is_dropped(self):
+        """Test that a new data file never reuses the index left from a deleted one."""
+        self.write_games(2)
+        os.remove(self.path)
+        records = self.write_games(1)
+        with RecordReader(self.path) as reader:
+            self.assertEqual(list(reader), records)
+
+    def test_stale_index_is_ignored_by_the_reader(self):
+        """Test that the reader scans when the index header does not match the data file."""
+        records = self.write_games(3)
+        with open(self.path + '.idx', 'rb') as index_file:
+            index = index_file.read()
+        records += self.write_games(4)
+        with open(self.path + '.idx', 'wb') as index_file:
+            index_file.write(index)  # Older index of the same file
+        with RecordReader(self.path) as reader:
+            self.assertIsNone(reader.index)
+            self.assertEqual(list(reader), records)
+
+    def test_crash_between_data_and_index_writes(self):
+        """Test a short index and a torn last record left by a crash."""
+        records = self.write_games(6)
+        with open(self.path + '.idx', 'r+b') as index_file:
+            index_file.truncate(INDEX_HEADER.size + 8 * 4)  # Data of the last two games written, their offsets not
+        with RecordReader(self.path) as reader:
+            self.assertIsNone(reader.index)  # Index does not reach the end of the data: scanned
+            self.assertEqual(list(reader), records)
+        with open(self.path, 'ab') as file:
+            file.write(b'\x05\x01\x02\x09\x00\x01')  # Header and part of the moves of one more game
+        with RecordReader(self.path) as reader:
+            self.assertEqual(list(reader), records)
+        records += self.write_games(2)
+        with RecordReader(self.path) as reader:
+            self.assertIsNotNone(reader.index)
+            self.assertEqual(list(reader), records)
+
+    def test_replay_seek_matches_play(self):
+        """Test that seeking to any move gives the same board and scores as playing up to it."""
+        rng = random.Random(4)
+        for mode in ('Simple', 'General'):
+            game, result = random_game(rng, 7, mode)
+            replay = Replay(record_from_game(game, result))
+            check = GameLogic(7, mode, auto_reset=False)
+            for move_count in range(len(game.moves) + 1):
+                board, scores = replay.board_at(move_count)
+                self.assertEqual(board.to_lists(), check.board.to_lists())
+                self.assertEqual(board.empty_count, check.board.empty_count)
+                self.assertEqual(scores, check.scores)
+                if move_count < len(game.moves):
+                    row, col, letter, player = game.moves[move_count]
+                    check.current_turn = player
+                    check.place_letter(row, col, letter)
+            self.assertEqual(len(replay.sos_until(len(game.moves))), sum(check.scores.values()))
+            middle = len(game.moves) // 2
+            self.assertEqual(replay.sos_until(middle) + replay.sos_between(middle, len(game.moves)),
+                             replay.sos_until(len(game.moves)))  # Seeks redraw only the SOS in between
+
+if __name__ == '__main__':
+    unittest.main()
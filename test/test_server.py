@@ -0,0 +1,145 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+from src.loadgen import run_load
+from src.server import Connection, GameServer
+
+class Client:
+    """Minimal line-delimited JSON client for the tests."""
+
+    @classmethod
+    async def connect(cls, port):
+        client = cls()
+        client.reader, client.writer = await asyncio.open_connection('127.0.0.1', port)
+        assert (await client.receive())['type'] == 'welcome'
+        return client
+
+    async def send(self, **message):
+        self.writer.write(json.dumps(message).encode() + b'\n')
+        await self.writer.drain()
+
+    async def receive(self):
+        line = await asyncio.wait_for(self.reader.readline(), 5)
+        return json.loads(line) if line else None
+
+    def close(self):
+        self.writer.close()
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the asyncio game server and its load generator."""
+
+    async def asyncSetUp(self):
+        self.server = GameServer(port=0, idle_timeout=0.5)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def start_game(self, size=3, mode='General'):
+        """Connect two clients and return them as {color: client} with the player to move."""
+        first, second = await Client.connect(self.server.port), await Client.connect(self.server.port)
+        await first.send(type='join', size=size, mode=mode)
+        self.assertEqual((await first.receive())['type'], 'waiting')
+        await second.send(type='join', size=size, mode=mode)
+        clients = {}
+        for client in (first, second):
+            start = await client.receive()
+            self.assertEqual(start['type'], 'start')
+            clients[start['color']] = client
+        return clients, start['turn']
+
+    async def test_moves_are_validated_and_broadcast(self):
+        """Test turn order, move validation, broadcasts and the end of a full game."""
+        clients, turn = await self.start_game()
+        other = 'Red' if turn == 'Blue' else 'Blue'
+        await clients[other].send(type='move', row=0, col=0, letter='S')
+        self.assertEqual(await clients[other].receive(), {'type': 'error', 'reason': "not your turn"})
+        await clients[turn].send(type='move', row=5, col=0, letter='S')
+        self.assertEqual((await clients[turn].receive())['reason'], "invalid move")
+
+        letters = ['S', 'O', 'S', 'S', 'S', 'S', 'O', 'O', 'O']  # SOS on row 0 only
+        for index, letter in enumerate(letters):
+            row, col = divmod(index, 3)
+            await clients[turn].send(type='move', row=row, col=col, letter=letter)
+            for client in clients.values():
+                move = await client.receive()
+                self.assertEqual((move['type'], move['row'], move['col'], move['player']), ('move', row, col, turn))
+            if index == 2:
+                self.assertEqual(move['sos'], [[[0, 2], [0, 1], [0, 0]]])
+                await clients[move['turn']].send(type='move', row=0, col=0, letter='O')
+                self.assertEqual((await clients[move['turn']].receive())['reason'], "cell is occupied")
+            turn = move['turn']
+        self.assertIsNone(turn)
+        for client in clients.values():
+            over = await client.receive()
+            self.assertEqual((over['type'], over['reason']), ('game_over', "finished"))
+            self.assertEqual(sum(over['scores'].values()), 1)
+            client.close()
+        self.assertEqual(self.server.sessions_played, 1)
+
+    async def test_idle_player_and_disconnect_forfeit(self):
+        """Test that the opponent wins when the player to move times out or disconnects."""
+        clients, turn = await self.start_game()
+        other = 'Red' if turn == 'Blue' else 'Blue'
+        over = await clients[other].receive()  # Nobody moves within the idle timeout
+        self.assertEqual((over['type'], over['result'], over['reason']), ('game_over', other, "timeout"))
+
+        for client in clients.values():
+            client.close()
+        clients, turn = await self.start_game(mode='Simple')
+        other = 'Red' if turn == 'Blue' else 'Blue'
+        clients[turn].close()
+        over = await clients[other].receive()
+        self.assertEqual((over['result'], over['reason']), (other, "disconnected"))
+        clients[other].close()
+
+    async def test_waiting_client_is_not_reaped(self):
+        """Test that a client waiting for an opponent outlives the idle timeout and is paired later."""
+        first = await Client.connect(self.server.port)
+        await first.send(type='join', size=5, mode='Simple')
+        self.assertEqual((await first.receive())['type'], 'waiting')
+        await asyncio.sleep(1.0)  # Twice the idle timeout
+        second = await Client.connect(self.server.port)
+        await second.send(type='join', size=5, mode='Simple')
+        self.assertEqual((await first.receive())['type'], 'start')
+        self.assertEqual((await second.receive())['type'], 'start')
+        first.close()
+        second.close()
+
+    async def test_simple_win_ends_game_before_broadcast_drains(self):
+        """Test that no move is accepted after a Simple win while its broadcast is still draining."""
+        clients, turn = await self.start_game(mode='Simple')
+        session = next(iter(self.server.sessions.values()))
+        winner = session.players[turn]
+        session.game.make_move(0, 0, 'S')
+        session.game.make_move(0, 1, 'O')  # The winner is to move again with S O _ on row 0
+        drained = asyncio.Event()
+
+        async def slow_drain(connection):
+            await drained.wait()
+
+        with mock.patch.object(Connection, 'backlogged', True), mock.patch.object(Connection, 'drain', slow_drain):
+            winning = asyncio.create_task(session.play(winner, {'row': 0, 'col': 2, 'letter': 'S'}))
+            await asyncio.sleep(0.05)  # The winning move now waits for its broadcast to drain
+            self.assertTrue(session.over)
+            await session.play(winner, {'row': 2, 'col': 2, 'letter': 'S'})
+            drained.set()
+            await winning
+        self.assertEqual(len(session.game.moves), 3)
+        messages = [await clients[turn].receive() for _ in range(3)]
+        self.assertEqual([message['type'] for message in messages], ['move', 'game_over', 'error'])
+        self.assertEqual((messages[1]['result'], messages[2]['reason']), (turn, "game is over"))
+        for client in clients.values():
+            client.close()
+
+    async def test_load_generator_finishes_every_session(self):
+        """Test a short load run: every bot finishes its games without errors."""
+        report = await run_load('127.0.0.1', self.server.port, clients=20, games=2, size=4, seed=3)
+        self.assertEqual(report['sessions'], 20)
+        self.assertEqual(report['finished'], 40)
+        self.assertEqual(report['errors'], 0)
+        self.assertGreater(report['p99_ms'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from src.simulate import simulate, format_report
+
+class TestSimulate(unittest.TestCase):
+    """Test cases for the headless self-play simulator."""
+
+    def test_general_games_fill_the_board(self):
+        """Test that every General game runs until the board is full."""
+        stats, _ = simulate(50, 4, 'General', workers=1, batch_size=20)
+        self.assertEqual(stats['games'], 50)
+        self.assertEqual(stats['moves'], 50 * 16)
+        self.assertEqual(stats['wins']['Blue'] + stats['wins']['Red'] + stats['draws'], 50)
+        self.assertEqual(stats['starts']['Blue'] + stats['starts']['Red'], 50)
+
+    def test_simple_games_end_on_first_sos(self):
+        """Test that a Simple game won by a player counts exactly one SOS."""
+        stats, _ = simulate(100, 5, 'Simple', workers=1, policy='greedy', batch_size=50)
+        decided = stats['wins']['Blue'] + stats['wins']['Red']
+        self.assertEqual(decided + stats['draws'], 100)
+        self.assertEqual(stats['sos'], decided)  # One SOS per decided game, none in a draw
+
+    def test_seeded_runs_are_repeatable(self):
+        """Test that the same seed gives the same results with or without a pool."""
+        first, _ = simulate(40, 4, 'General', workers=1, seed=5, batch_size=10)
+        second, _ = simulate(40, 4, 'General', workers=2, seed=5, batch_size=10)
+        self.assertEqual(first, second)
+
+    def test_report_lists_throughput(self):
+        """Test that the report includes the games per second line."""
+        stats, elapsed = simulate(10, 3, 'General', workers=1)
+        self.assertIn("games/s", format_report(stats, elapsed, 1)[-1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import random
+import tempfile
+import unittest
+from src.game_logic import GameLogic
+from src.solver import PerfectPlayer, PositionDatabase, Solver, canonical_key, symmetry_weights
+from test.helpers import exact_value
+
+class TestSolver(unittest.TestCase):
+    """Test cases for the perfect-play solver and its position database."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tempdir = tempfile.TemporaryDirectory()
+        cls.databases = {}
+        for mode in ('Simple', 'General'):
+            solver = Solver(3, mode)
+            solver.solve()
+            path = os.path.join(cls.tempdir.name, f"{mode}.sosdb")
+            solver.write(path)
+            cls.databases[mode] = PositionDatabase(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        for database in cls.databases.values():
+            database.close()
+        cls.tempdir.cleanup()
+
+    def test_symmetric_boards_share_a_key(self):
+        """Test that all 8 rotations and reflections of a board fold to one key."""
+        weights = symmetry_weights(3)
+        board = [[1, 2, 0], [0, 0, 0], [0, 0, 1]]
+        variants = [board]
+        for _ in range(3):
+            variants.append([list(row) for row in zip(*variants[-1][::-1])])  # Rotate 90 degrees
+        variants += [[row[::-1] for row in variant] for variant in variants]  # Mirror each rotation
+        keys = {canonical_key(bytearray(sum(variant, [])), weights) for variant in variants}
+        self.assertEqual(len(keys), 1)
+
+    def test_database_matches_minimax(self):
+        """Test stored values against plain minimax on random positions."""
+        rng = random.Random(8)
+        for mode in ('Simple', 'General'):
+            database = self.databases[mode]
+            checked = 0
+            while checked < 30:
+                game = GameLogic(3, mode, auto_reset=False)
+                cells = [(r, c) for r in range(3) for c in range(3)]
+                rng.shuffle(cells)
+                for row, col in cells[:rng.randint(5, 8)]:
+                    game.make_move(row, col, rng.choice('SO'))
+                if mode == 'Simple' and game.game_result():
+                    continue  # Finished Simple games are not stored
+                self.assertEqual(database.lookup(game.board.cells), exact_value(game))
+                checked += 1
+
+    def test_perfect_player(self):
+        """Test that the perfect player picks a move worth the position's value."""
+        database = self.databases['General']
+        game = GameLogic(3, 'General')
+        game.make_move(0, 0, 'S')
+        game.make_move(1, 1, 'O')
+        player = PerfectPlayer(database)
+        values = player.move_values(game)
+        self.assertEqual(values[player.choose_move(game)], database.lookup(game.board.cells))
+        with self.assertRaises(ValueError):
+            player.choose_move(GameLogic(4, 'General'))
+
+    def test_rejects_large_boards(self):
+        """Test that boards beyond 4x4 are refused."""
+        with self.assertRaises(ValueError):
+            Solver(5, 'General')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import random
+import unittest
+from src.game_logic import GameLogic
+from src.sos_index import get_sos_index
+
+def random_games(rng, size, fill):
+    """Build an array game and a list game holding the same random board."""
+    array_game = GameLogic(size, 'General', backend='array')
+    list_game = GameLogic(size, 'General', backend='list')
+    for row in range(size):
+        for col in range(size):
+            if rng.random() < fill:
+                letter = rng.choice('SO')
+                array_game.board[row][col] = letter
+                list_game.board[row][col] = letter
+    return array_game, list_game
+
+class TestSOSLineIndex(unittest.TestCase):
+    """Test cases comparing the SOS line index with the direction-walking checks."""
+
+    def test_index_is_cached_per_size(self):
+        """Test that games of the same size share one index."""
+        self.assertIs(get_sos_index(7), get_sos_index(7))
+        self.assertIs(GameLogic(7).sos_index, GameLogic(7).sos_index)
+
+    def test_general_matches_direction_walk(self):
+        """Test that check_general_sos gives the same SOS lists on random boards."""
+        rng = random.Random(2024)
+        for _ in range(60):
+            size = rng.randint(3, 12)
+            array_game, list_game = random_games(rng, size, rng.random())
+            for row in range(size):
+                for col in range(size):
+                    letter = list_game.board[row][col]
+                    self.assertEqual(array_game.check_general_sos(row, col, letter),
+                                     list_game.check_general_sos(row, col, letter))
+
+    def test_simple_matches_direction_walk(self):
+        """Test that check_simple_sos reports the same first SOS on random boards."""
+        rng = random.Random(99)
+        for _ in range(60):
+            size = rng.randint(3, 12)
+            array_game, list_game = random_games(rng, size, rng.random())
+            for row in range(size):
+                for col in range(size):
+                    letter = list_game.board[row][col]
+                    self.assertEqual(array_game.check_simple_sos(row, col, letter),
+                                     list_game.check_simple_sos(row, col, letter))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+from src.game_logic import GameLogic
+
+def brute_gains(game):
+    """Return {(row, col, letter): SOS completed} for every empty cell, by trying each move."""
+    gains = {}
+    for row in range(game.size):
+        for col in range(game.size):
+            if game.board[row][col] == '':
+                for letter in 'SO':
+                    game.board[row][col] = letter
+                    gains[(row, col, letter)] = len(game.check_general_sos(row, col, letter) or [])
+                    game.board[row][col] = ''
+    return gains
+
+def brute_threats(game):
+    """Return (scoring moves, safe moves) of a list-backed game by full recomputation."""
+    gains = brute_gains(game)
+    total = sum(gains.values())
+    scoring = sorted(move for move, gain in gains.items() if gain)
+    safe = []
+    for row, col, letter in sorted(gains):
+        game.board[row][col] = letter
+        after = sum(brute_gains(game).values())
+        game.board[row][col] = ''
+        opened = after - (total - gains[(row, col, 'S')] - gains[(row, col, 'O')])  # New scoring moves for the opponent
+        if not opened:
+            safe.append((row, col, letter))
+    return scoring, safe
+
+def list_copy(game):
+    """Return a list-backed game with the same letters."""
+    copy = GameLogic(game.size, game.mode, backend='list')
+    for row in range(game.size):
+        for col in range(game.size):
+            copy.board[row][col] = game.board[row][col]
+    return copy
+
+class TestThreatMap(unittest.TestCase):
+    """Test cases for the incrementally maintained threat map."""
+
+    def assert_matches_brute_force(self, game):
+        scoring, safe = brute_threats(list_copy(game))
+        self.assertEqual(sorted(game.scoring_moves()), scoring)
+        self.assertEqual(sorted(game.safe_moves()), safe)
+
+    def test_random_make_and_unmake_match_brute_force(self):
+        """Test the map against a full recomputation after random moves and take-backs."""
+        rng = random.Random(13)
+        for size in (3, 5):
+            game = GameLogic(size, 'General', auto_reset=False)
+            game.track_threats()
+            for _ in range(60):
+                if game.moves and rng.random() < 0.3:
+                    game.unmake_move()
+                elif game.board.empty_count:
+                    row, col = divmod(rng.choice(sorted(game.board.empty_cells)), size)
+                    game.make_move(row, col, rng.choice('SO'))
+                self.assert_matches_brute_force(game)
+
+    def test_place_letter_undo_and_reset_keep_map_current(self):
+        """Test that place_letter, undo, redo, copy and reset_game keep the map in step."""
+        game = GameLogic(4, 'Simple', auto_reset=True)
+        self.assertEqual(game.scoring_moves(), [])
+        game.place_letter(0, 0, 'S')
+        game.place_letter(0, 1, 'O')
+        self.assertEqual(game.scoring_moves(), [(0, 2, 'S')])
+        safe = game.safe_moves()
+        self.assertIn((0, 2, 'S'), safe)
+        self.assertIn((0, 2, 'O'), safe)
+        self.assertNotIn((2, 2, 'S'), safe)  # Opens O at (1, 1)
+        self.assertNotIn((1, 0, 'O'), safe)  # Opens S at (2, 0)
+        game.undo()
+        self.assertEqual(game.scoring_moves(), [])
+        game.redo()
+        self.assert_matches_brute_force(game)
+        copy = game.copy()
+        copy.make_move(2, 0, 'S')
+        self.assert_matches_brute_force(copy)
+        self.assert_matches_brute_force(game)
+        game.place_letter(0, 2, 'S')  # Simple mode win resets the board
+        self.assertEqual(game.scoring_moves(), [])
+        self.assertEqual(len(game.safe_moves()), 2 * 16)
+
+    def test_list_backend_is_rejected(self):
+        """Test that threat tracking asks for the array backend."""
+        self.assertRaises(ValueError, GameLogic(3, backend='list').track_threats)
+
+if __name__ == '__main__':
+    unittest.main()
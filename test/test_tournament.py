@@ -0,0 +1,80 @@
+import json
+import os
+import tempfile
+import unittest
+from src.game_logic import GameLogic
+from src.tournament import RatingTable, load_results, run_tournament, schedule
+
+class TestTournament(unittest.TestCase):
+    """Test cases for the tournament scheduler, results file and ratings."""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "results.jsonl")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_schedule_alternates_colors_and_starting_player(self):
+        """Test pair counts and that colors and first moves are balanced."""
+        specs = schedule(['random', 'greedy', 'alphabeta'], [3, 4], ['Simple', 'General'], 4)
+        self.assertEqual(len(specs), 3 * 2 * 2 * 4)
+        self.assertEqual(len({spec['key'] for spec in specs}), len(specs))
+        pair = [spec for spec in specs if spec['key'].startswith('random|greedy|3|Simple|')]
+        self.assertEqual({(spec['blue'], spec['first_player']) for spec in pair},
+                         {('random', 'Blue'), ('greedy', 'Blue'), ('random', 'Red'), ('greedy', 'Red')})
+        gauntlet = schedule(['greedy', 'random', 'alphabeta', 'mcts'], [3], ['General'], 2, pairing='gauntlet')
+        self.assertEqual(len(gauntlet), 3 * 2)
+        self.assertTrue(all('greedy' in (spec['blue'], spec['red']) for spec in gauntlet))
+
+    def test_first_player_is_kept_after_reset(self):
+        """Test that a fixed starting color replaces the random choice, also after a reset."""
+        game = GameLogic(3, 'Simple', first_player='Red')
+        self.assertEqual(game.current_turn, 'Red')
+        game.place_letter(0, 0, 'S')
+        game.reset_game()
+        self.assertEqual(game.current_turn, 'Red')
+        self.assertEqual(game.copy().first_player, 'Red')
+
+    def test_resume_skips_finished_games(self):
+        """Test that an interrupted run resumes from the results file, dropping a torn last line."""
+        specs = schedule(['random', 'greedy'], [3, 4], ['Simple', 'General'], 4)
+        _, played = run_tournament(specs[:5], self.path)
+        self.assertEqual(played, 5)
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write('{"key": "random|gre')  # Killed while writing a line
+        _, played = run_tournament(specs, self.path)
+        self.assertEqual(played, len(specs) - 5)
+        records, _ = load_results(self.path)
+        self.assertEqual(sorted(record['key'] for record in records), sorted(spec['key'] for spec in specs))
+        with open(self.path, encoding='utf-8') as file:
+            self.assertTrue(all(json.loads(line) for line in file))
+
+    def test_parallel_results_match_serial(self):
+        """Test that a pool plays the same seeded games as a single process."""
+        specs = schedule(['random', 'greedy'], [4], ['General'], 4, seed=7)
+        serial_path = self.path + ".serial"
+        run_tournament(specs, serial_path, workers=1)
+        run_tournament(specs, self.path, workers=2)
+        serial = {record['key']: record['result'] for record in load_results(serial_path)[0]}
+        parallel = {record['key']: record['result'] for record in load_results(self.path)[0]}
+        self.assertEqual(serial, parallel)
+
+    def test_ratings_rank_the_stronger_engine_first(self):
+        """Test Elo order, zero-sum ratings and intervals around each rating."""
+        table = RatingTable()
+        for number in range(40):
+            result = 'Blue' if number % 4 else 'Draw'
+            table.add({'blue': 'strong', 'red': 'weak', 'result': result})
+        for number in range(20):
+            table.add({'blue': 'weak', 'red': 'even', 'result': 'Red' if number % 5 < 3 else 'Blue'})
+        ratings = table.ratings()
+        self.assertEqual(list(ratings), ['strong', 'even', 'weak'])
+        self.assertAlmostEqual(sum(elo for elo, *_ in ratings.values()), 0.0, places=6)
+        for elo, low, high, games, results in ratings.values():
+            self.assertLessEqual(low, elo)
+            self.assertGreaterEqual(high, elo)
+            self.assertEqual(sum(results), games)
+
+if __name__ == '__main__':
+    unittest.main()